@@ -0,0 +1,105 @@
+"""
+Benchmark de l'acquisition multi-tâches : débit total selon le nombre de tâches
+
+Lance 1, 2, 4... tâches simulées en parallèle (MultiTaskSession, un thread de
+lecture par tâche) et mesure le débit total. En mode temps réel, chaque tâche
+doit tenir sa cadence (x1.00) et le débit total croît avec le nombre de
+tâches ; --fast mesure le débit maximal, que le GIL partage entre les threads.
+
+Usage:
+    python benchmarks/bench_multi_task.py [--tasks 1 2 4 8] [--channels 8] [--rate 20000]
+                                          [--seconds 3] [--fast] [--record]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.multi_task import MultiTaskSession
+from utils.config import config
+
+
+def run(n_tasks, args, folder):
+    """
+    Acquisition simultanée de n_tasks tâches simulées pendant args.seconds secondes
+
+    Returns:
+        dict: Débit total, par tâche (points/s, tous canaux) et backlog maximal (s)
+    """
+    session = MultiTaskSession(config, [config.SIMULATION_TASK_NAME] * n_tasks)
+    if not session.start_acquisition():
+        raise RuntimeError("Impossible de démarrer les tâches simulées")
+
+    max_backlog = 0.0
+    try:
+        if args.record:
+            session.start_recording(file_prefix=f"bench_{n_tasks}", record_period=1.0, save_folder=folder)
+
+        time.sleep(0.5)  # Mise en route des threads de lecture, hors mesure
+        session.get_task_stats()  # Point de départ de la mesure de débit
+        start_samples = [model.get_engine_stats()['samples'] for model in session.models.values()]
+        start = time.perf_counter()
+        while time.perf_counter() - start < args.seconds:
+            time.sleep(0.2)
+            max_backlog = max([max_backlog] + [stats['backlog_s'] for stats in session.get_task_stats()])
+        elapsed = time.perf_counter() - start
+
+        samples = [model.get_engine_stats()['samples'] - first
+                   for model, first in zip(session.models.values(), start_samples)]
+    finally:
+        if session.is_recording:
+            session.stop_recording()
+        session.stop_acquisition()
+
+    per_task = [n * args.channels / elapsed for n in samples]
+    return {'total': sum(per_task), 'per_task': per_task, 'max_backlog_s': max_backlog}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'acquisition multi-tâches")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1, 2, 4, 8], help="Nombres de tâches")
+    parser.add_argument("--channels", type=int, default=8, help="Canaux par tâche")
+    parser.add_argument("--rate", type=float, default=20000.0, help="Fréquence par canal (Hz)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Durée de chaque essai")
+    parser.add_argument("--fast", action="store_true", help="Tâches simulées sans attente (débit maximal)")
+    parser.add_argument("--record", action="store_true", help="Enregistrer aussi (format BIN pleine cadence)")
+    args = parser.parse_args()
+
+    config.HIGH_RATE_ENABLED = True
+    config.HIGH_RATE_SAMPLE_RATE = args.rate
+    config.SIMULATION_CHANNELS = args.channels
+    config.SIMULATION_REALTIME = not args.fast
+    config.SAVE_FORMAT = "BIN"
+    config.RECORD_MODE = "FULL_RATE"
+
+    folder = tempfile.mkdtemp(prefix="logger_bench_")
+    results = {}
+    try:
+        for n_tasks in args.tasks:
+            results[n_tasks] = run(n_tasks, args, folder)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    target = args.rate * args.channels
+    print("=" * 78)
+    print(f"Multi-tâches : {args.channels} canaux x {args.rate:g} Hz par tâche, "
+          f"{'débit maximal' if args.fast else 'temps réel'}{', enregistrement BIN' if args.record else ''}")
+    print("=" * 78)
+    print(f"{'Tâches':>7}{'Total (M points/s)':>20}{'Par tâche min':>16}{'x temps réel':>14}"
+          f"{'Échelle':>10}{'Backlog max':>13}")
+    base = results[args.tasks[0]]['total'] / args.tasks[0]
+    for n_tasks, result in results.items():
+        slowest = min(result['per_task'])
+        print(f"{n_tasks:>7}{result['total'] / 1e6:>20.2f}{slowest / 1e6:>16.2f}"
+              f"{slowest / target:>14.2f}{result['total'] / base / n_tasks:>10.0%}"
+              f"{result['max_backlog_s'] * 1000:>10.0f} ms")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
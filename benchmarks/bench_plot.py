@@ -0,0 +1,88 @@
+"""
+Benchmark du rendu des graphiques : blitting contre redessin complet
+
+Utilise PlotPanel avec le backend Agg (aucun affichage nécessaire) et une
+figure configurée comme le graphique instantané de MainView.
+
+Usage:
+    python benchmarks/bench_plot.py [--channels 8] [--points 600] [--frames 200]
+"""
+import argparse
+import os
+import sys
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from view.plot_panel import PlotPanel
+
+
+def create_panel(n_channels, use_blit):
+    """
+    Crée un panneau équivalent au graphique instantané (axes, grille, légende)
+    """
+    figure = Figure(figsize=(10, 6), facecolor='#2b2b3c')
+    ax = figure.add_subplot(111)
+    ax.set_facecolor('#1a1a2e')
+    ax.set_xlabel('Temps (s)', fontsize=11, fontweight='bold')
+    ax.set_xlim(0, 60)
+    ax.set_ylim(-10, 10)
+    ax.grid(True, alpha=0.15, linestyle='--')
+    canvas = FigureCanvasAgg(figure)
+
+    lines = [ax.plot([], [], linewidth=2.5, label=f"Canal_{i}", alpha=0.9)[0] for i in range(n_channels)]
+    ax.legend(loc='upper right', fontsize=10)
+    figure.tight_layout()
+
+    panel = PlotPanel(figure, ax, canvas, use_blit=use_blit)
+    panel.set_lines(lines)
+    return panel
+
+
+def run(n_channels, n_points, n_frames, use_blit):
+    """
+    Rend n_frames trames d'une fenêtre glissante et retourne les statistiques
+    """
+    panel = create_panel(n_channels, use_blit)
+    x = np.linspace(0, 60, n_points)
+    phases = np.arange(n_channels).reshape(-1, 1)
+
+    for frame in range(n_frames):
+        data = 5 * np.sin(x / 3 + frame * 0.1 + phases)
+        panel.update(x, data, xlim=(0, 60), ylim=(-6, 6))
+
+    return panel.get_frame_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du rendu des graphiques")
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--points", type=int, default=600)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Rendu : {args.channels} canaux x {args.points} points, {args.frames} trames")
+    print("=" * 60)
+
+    results = {}
+    for use_blit in (False, True):
+        stats = run(args.channels, args.points, args.frames, use_blit)
+        results[stats['mode']] = stats
+        print(f"{stats['mode']:>5}: {stats['frame_mean_ms']:.2f} ms/trame en moyenne, "
+              f"p95 {stats['frame_p95_ms']:.2f} ms, "
+              f"{stats['full_redraws']} rendu(s) complet(s), {stats['blits']} blit(s)")
+
+    gain = results['draw']['frame_mean_ms'] / max(results['blit']['frame_mean_ms'], 1e-9)
+    print(f"Gain du blitting : x{gain:.1f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
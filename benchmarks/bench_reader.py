@@ -0,0 +1,97 @@
+"""
+Benchmark du chemin de lecture DAQ sans matériel
+
+Compare la lecture historique (Task.read -> listes Python -> np.array) à la
+lecture read_many_sample dans des buffers NumPy réutilisés, sur la tâche
+simulée de model.simulation (mode rapide, sans attente).
+
+Usage:
+    python benchmarks/bench_reader.py [--channels 16] [--rate 50000] [--seconds 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.daq_model import DAQModel
+from model.ring_buffer import RingBuffer
+from model.simulation import SimulatedTask
+from utils.config import Config
+
+
+def create_model(n_channels, sample_rate):
+    """
+    Crée un DAQModel branché sur une tâche simulée non démarrée (sans DAQmx ni thread)
+    """
+    config = Config()
+    config.HIGH_RATE_ENABLED = sample_rate >= config.HIGH_RATE_MIN
+
+    model = DAQModel(config)
+    model.configure_sample_rate(sample_rate)
+    model.task = SimulatedTask(n_channels=n_channels, sample_rate=model.sample_rate, realtime=False)
+    model.n_channels = n_channels
+    model.channel_names = [channel.name for channel in model.task.ai_channels]
+    model.instant_buffer = RingBuffer(n_channels, model.max_instantane_samples, model.sample_rate)
+    model.reader = model.task.create_reader()
+    model._allocate_read_buffers()
+    return model
+
+
+def run_list_path(model, n_reads):
+    """
+    Chemin historique : listes Python converties en tableau à chaque lecture
+    """
+    start = time.perf_counter()
+    for _ in range(n_reads):
+        data = np.array(model.task.read(model.samples_per_read, model.read_timeout))
+        if len(data.shape) == 1:
+            data = data.reshape(1, -1)
+        model._process_block(data)
+    return time.perf_counter() - start
+
+
+def run_stream_path(model, n_reads):
+    """
+    Nouveau chemin : read_many_sample dans les buffers préalloués
+    """
+    start = time.perf_counter()
+    for _ in range(n_reads):
+        model._process_block(model._read_block())
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du chemin de lecture DAQ")
+    parser.add_argument("--channels", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=50000.0)
+    parser.add_argument("--seconds", type=float, default=20.0,
+                        help="Durée d'acquisition simulée (secondes de signal)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Benchmark lecture DAQ (tâche simulée)")
+    print("=" * 60)
+
+    for name, runner in [("Task.read + np.array", run_list_path),
+                         ("read_many_sample (buffers réutilisés)", run_stream_path)]:
+        model = create_model(args.channels, args.rate)
+        n_reads = max(1, int(args.seconds * model.sample_rate / model.samples_per_read))
+        elapsed = runner(model, n_reads)
+        total = n_reads * model.samples_per_read * args.channels
+
+        print(f"{name}:")
+        print(f"  {n_reads} lectures de {model.samples_per_read} points x {args.channels} canaux")
+        print(f"  {elapsed * 1e6 / n_reads:.1f} µs par lecture, "
+              f"{total / elapsed / 1e6:.2f} M points/s "
+              f"({elapsed / args.seconds * 100:.1f} % du temps réel)")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
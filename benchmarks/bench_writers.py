@@ -0,0 +1,97 @@
+"""
+Benchmark des formats d'enregistrement (TXT, BIN, TDMS)
+
+Écrit des blocs synthétiques pleine cadence avec chaque format et mesure
+le débit soutenu : points/s, Mo/s de données utiles (float64) et Mo/s
+réellement écrits sur disque.
+
+Usage:
+    python benchmarks/bench_writers.py [--channels 16] [--rate 50000] [--seconds 10] [--folder DOSSIER]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.record_writer import SampleTimes, create_record_file
+
+
+# (libellé, format, options de create_record_file)
+BACKENDS = [
+    ("TXT exact (csv)", "TXT", {}),
+    ("TXT 9 chiffres", "TXT", {'txt_precision': 9}),
+    ("BIN float64", "BIN", {'time_column': False}),
+    ("BIN float32", "BIN", {'time_column': False, 'bin_dtype': 'float32'}),
+    ("TDMS", "TDMS", {'time_column': False}),
+]
+
+
+def run_backend(save_format, options, folder, channel_names, sample_rate, blocks):
+    """
+    Écrit tous les blocs avec un format et retourne (durée, taille du fichier)
+    """
+    record_file = create_record_file(save_format, os.path.join(folder, f"bench_{save_format}"),
+                                     channel_names, sample_rate=sample_rate, **options)
+    start = time.perf_counter()
+    for timestamps, data in blocks:
+        record_file.write_block(timestamps, data)
+    record_file.flush()
+    record_file.close()
+    elapsed = time.perf_counter() - start
+    return elapsed, os.path.getsize(record_file.filepath)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des formats d'enregistrement")
+    parser.add_argument("--channels", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=50000.0)
+    parser.add_argument("--seconds", type=float, default=10.0, help="Durée de signal écrite")
+    parser.add_argument("--block", type=int, default=2500, help="Points par canal et par bloc")
+    parser.add_argument("--folder", default=None, help="Dossier de test (défaut: dossier temporaire)")
+    args = parser.parse_args()
+
+    folder = args.folder or tempfile.mkdtemp(prefix="logger_bench_")
+    os.makedirs(folder, exist_ok=True)
+
+    channel_names = [f"Canal_{i}" for i in range(args.channels)]
+    n_blocks = max(1, int(args.seconds * args.rate / args.block))
+    rng = np.random.default_rng(0)
+    blocks = []
+    for b in range(n_blocks):
+        # Base de temps implicite, comme l'acquisition : seuls les formats qui stockent le temps le construisent
+        blocks.append((SampleTimes(b * args.block, args.rate), rng.standard_normal((args.channels, args.block))))
+
+    n_points = n_blocks * args.block
+    payload = n_points * args.channels * 8
+
+    print("=" * 78)
+    print(f"Benchmark des formats : {args.channels} canaux x {args.rate:g} Hz, "
+          f"{n_points * args.channels / 1e6:.1f} M valeurs ({payload / 1e6:.0f} Mo utiles)")
+    print("=" * 78)
+    print(f"{'Format':<18}{'Durée (s)':>10}{'x temps réel':>14}{'Mo/s utiles':>14}{'Mo/s disque':>14}{'Fichier (Mo)':>14}")
+
+    try:
+        for label, save_format, options in BACKENDS:
+            try:
+                elapsed, size = run_backend(save_format, options, folder, channel_names, args.rate, blocks)
+            except RuntimeError as e:
+                print(f"{label:<18}  ignoré : {e}")
+                continue
+            print(f"{label:<18}{elapsed:>10.2f}{n_points / args.rate / elapsed:>14.1f}"
+                  f"{payload / elapsed / 1e6:>14.1f}{size / elapsed / 1e6:>14.1f}{size / 1e6:>14.1f}")
+    finally:
+        if args.folder is None:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Suite de benchmarks de bout en bout : acquisition, enregistrement et tracé sans matériel
+
+Pour chaque combinaison fréquence x nombre de canaux, la tâche simulée
+alimente le vrai pipeline de DAQModel (boucle d'acquisition, buffer
+circulaire, historique, threads d'écriture) pendant que le thread principal
+prépare et trace les graphiques comme le contrôleur (PlotWorker et PlotPanel
+avec le backend Agg).
+
+Le rapport JSON (points/s, percentiles de latence par étape, CPU, mémoire)
+peut être comparé à celui d'une version précédente avec --compare. En temps
+réel, la durée de lecture inclut l'attente des points ; --fast supprime
+l'attente et mesure le débit maximal.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--rates 1000 10000 50000] [--channels 4 16]
+                                        [--duration 5] [--format BIN] [--fast]
+                                        [--output rapport.json] [--compare ancien.json]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+
+# Ajouter le dossier racine au path pour les imports
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_plot import create_panel
+from controller.plot_worker import PlotWorker
+from model.daq_model import DAQModel
+from model.data_model import DataModel
+from utils.config import config
+from view.plot_panel import auto_ylim, grow_xlim, instant_xlim
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows : mémoire lue avec psutil si disponible
+
+# Métriques comparées par --compare : (clé, libellé, True si plus grand = mieux)
+COMPARED_METRICS = [
+    ('samples_per_second', "points/s", True),
+    ('cpu_percent', "CPU %", False),
+    ('rss_peak_mb', "RSS max (Mo)", False),
+    ('stages.read.p99_ms', "lecture p99 (ms)", False),
+    ('stages.process.p99_ms', "traitement p99 (ms)", False),
+    ('stages.plot_prepare.p99_ms', "préparation p99 (ms)", False),
+    ('stages.plot_draw.p99_ms', "tracé p99 (ms)", False),
+]
+
+
+def percentiles(samples):
+    """
+    Résume une liste de durées (secondes) en ms : moyenne, p50, p95, p99, max
+    """
+    if not samples:
+        return {'count': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+    values = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'count': len(values), 'mean_ms': float(values.mean()), 'p50_ms': float(p50),
+            'p95_ms': float(p95), 'p99_ms': float(p99), 'max_ms': float(values.max())}
+
+
+def rss_peak_mb():
+    """
+    Retourne la mémoire résidente maximale du processus en Mo (None si inconnue)
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Ko sous Linux, octets sous macOS
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+
+
+def timed(function, samples):
+    """
+    Enveloppe une méthode pour mesurer la durée de chaque appel
+    """
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - start)
+    return wrapper
+
+
+def draw_frame(panel, visible, plot_frame, instant_window):
+    """
+    Trace une trame comme MainView.draw_instantane_frame / draw_longue_duree_frame
+
+    Les limites sont calculées par les fonctions de view.plot_panel utilisées
+    par MainView (échelle y automatique) : seul un changement de limites
+    provoque un rendu complet, exactement comme dans l'interface.
+    """
+    t_end = plot_frame.time_axis[-1]
+    if visible == 'instant':
+        xlim = instant_xlim(instant_window, t_end)
+    else:
+        xlim = grow_xlim(panel.ax.get_xlim(), t_end, config.LONG_PLOT_XLIM_GROWTH)
+    ylim = auto_ylim(panel.ax.get_ylim(), plot_frame.y_range)
+    panel.update(plot_frame.time_axis, plot_frame.data, xlim, ylim)
+
+
+def configure(sample_rate, n_channels, save_format, realtime):
+    """
+    Reporte les paramètres d'un essai dans la configuration partagée
+    """
+    if sample_rate >= config.HIGH_RATE_MIN:
+        config.HIGH_RATE_ENABLED = True
+        config.HIGH_RATE_SAMPLE_RATE = float(sample_rate)
+    else:
+        config.HIGH_RATE_ENABLED = False
+        config.SAMPLE_RATE = float(sample_rate)
+    config.SIMULATION_CHANNELS = n_channels
+    config.SIMULATION_REALTIME = realtime
+    config.SAVE_FORMAT = save_format
+    config.RECORD_MODE = "FULL_RATE"
+
+
+def run_case(sample_rate, n_channels, args, folder):
+    """
+    Acquisition, enregistrement pleine cadence et tracé pendant args.duration secondes
+
+    Returns:
+        dict: Résultats de l'essai
+    """
+    configure(sample_rate, n_channels, args.format, not args.fast)
+
+    daq_model = DAQModel(config)
+    data_model = DataModel(config)
+    stages = {'read': [], 'process': [], 'plot_prepare': [], 'plot_draw': []}
+
+    # Mesure par étape sans modifier le modèle : méthodes de l'instance enveloppées
+    daq_model._read_block = timed(daq_model._read_block, stages['read'])
+    daq_model._process_block = timed(daq_model._process_block, stages['process'])
+
+    if not daq_model.start_acquisition(data_callback=data_model.update_running_statistics,
+                                       task_name=config.SIMULATION_TASK_NAME):
+        raise RuntimeError("Impossible de démarrer la tâche simulée")
+
+    panels = {'instant': create_panel(n_channels, config.PLOT_USE_BLIT),
+              'long': create_panel(n_channels, config.PLOT_USE_BLIT)}
+    widths = {name: panel.get_pixel_width() for name, panel in panels.items()}
+    worker = PlotWorker(daq_model, data_model, config)  # Non démarré : préparation synchrone mesurée
+    # Durée de la fenêtre instantanée, transmise à MainView par le contrôleur
+    instant_window = daq_model.max_instantane_samples / daq_model.sample_rate
+
+    cpu_start = time.process_time()
+    try:
+        data_model.reset_running_statistics(int(config.STATISTICS_WINDOW_DURATION * daq_model.sample_rate))
+        daq_model.start_recording(file_prefix=f"bench_{int(sample_rate)}_{n_channels}",
+                                  record_period=args.period, save_folder=folder)
+        wall_start = time.perf_counter()
+
+        # Rafraîchissement de l'affichage, en alternant les graphiques comme les onglets
+        frame = 0
+        while time.perf_counter() - wall_start < args.duration:
+            visible = 'long' if frame % args.long_every == args.long_every - 1 else 'instant'
+            start = time.perf_counter()
+            worker.request(visible, widths, 0)
+            plot_frame = worker.take_frame(visible)
+            stages['plot_prepare'].append(time.perf_counter() - start)
+
+            if plot_frame is not None:
+                start = time.perf_counter()
+                draw_frame(panels[visible], visible, plot_frame, instant_window)
+                stages['plot_draw'].append(time.perf_counter() - start)
+
+            frame += 1
+            time.sleep(args.refresh)
+
+        samples = daq_model.total_samples_acquired
+        wall = time.perf_counter() - wall_start
+        writer_stats = daq_model.get_writer_stats()
+        model_stages = daq_model.get_metrics()['stages']
+    finally:
+        result = daq_model.stop_recording() if daq_model.is_recording else None
+        daq_model.stop_acquisition()
+    cpu = time.process_time() - cpu_start
+
+    file_size = 0
+    if result:
+        for key in ('filepath', 'full_rate_filepath'):
+            if result[key] and os.path.exists(result[key]):
+                file_size += os.path.getsize(result[key])
+
+    return {
+        'sample_rate': sample_rate,
+        'channels': n_channels,
+        'format': args.format,
+        'realtime': not args.fast,
+        'duration_s': wall,
+        'samples_per_channel': samples,
+        'samples_per_second': samples * n_channels / wall,
+        'realtime_factor': samples / wall / sample_rate,
+        'cpu_percent': 100.0 * cpu / wall,
+        'rss_peak_mb': rss_peak_mb(),
+        'file_mb': file_size / 1e6,
+        'stages': {name: percentiles(values) for name, values in stages.items()},
+        'model_stages': model_stages,
+        'engine': daq_model.get_engine_stats(),
+        'writer': writer_stats,
+    }
+
+
+def git_version():
+    """
+    Retourne la version du dépôt (git describe), ou None hors dépôt
+    """
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def lookup(run, key):
+    """
+    Lit une métrique par chemin pointé ('stages.read.p99_ms')
+    """
+    value = run
+    for part in key.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def compare(report, baseline_path):
+    """
+    Affiche l'évolution des métriques principales par rapport à un rapport précédent
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    def case(run):
+        return run['sample_rate'], run['channels'], run['format'], run['realtime']
+
+    previous = {case(run): run for run in baseline['runs']}
+    print(f"Comparaison avec {baseline_path} ({baseline.get('version') or 'version inconnue'})")
+    for run in report['runs']:
+        old = previous.get(case(run))
+        if old is None:
+            continue
+        print(f"  {run['sample_rate']:g} Hz x {run['channels']} canaux ({run['format']})")
+        for key, label, higher_is_better in COMPARED_METRICS:
+            new_value, old_value = lookup(run, key), lookup(old, key)
+            if not new_value or not old_value:
+                continue
+            change = 100.0 * (new_value - old_value) / old_value
+            worse = change < 0 if higher_is_better else change > 0
+            flag = " ⚠" if worse and abs(change) > 10 else ""
+            print(f"    {label:<24}{old_value:>12.2f} → {new_value:>12.2f}  ({change:+.1f} %){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de bout en bout avec la tâche simulée")
+    parser.add_argument("--rates", type=float, nargs="+", default=[1000.0, 10000.0, 50000.0],
+                        help="Fréquences par canal (Hz)")
+    parser.add_argument("--channels", type=int, nargs="+", default=[4, 16], help="Nombres de canaux")
+    parser.add_argument("--duration", type=float, default=5.0, help="Durée de chaque essai (s)")
+    parser.add_argument("--format", choices=["TXT", "BIN", "TDMS"], default="BIN")
+    parser.add_argument("--period", type=float, default=1.0, help="Période du fichier résumé (s)")
+    parser.add_argument("--refresh", type=float, default=0.1, help="Période de rafraîchissement des graphiques (s)")
+    parser.add_argument("--long-every", type=int, default=5,
+                        help="Tracer le graphique longue durée une trame sur N")
+    parser.add_argument("--fast", action="store_true",
+                        help="Tâche simulée sans attente : débit maximal du pipeline")
+    parser.add_argument("--folder", default=None, help="Dossier des fichiers (défaut: dossier temporaire)")
+    parser.add_argument("--output", default=None,
+                        help="Rapport JSON (défaut: benchmarks/results/bench_report_<date>.json)")
+    parser.add_argument("--compare", default=None, help="Rapport JSON précédent à comparer")
+    args = parser.parse_args()
+
+    folder = args.folder or tempfile.mkdtemp(prefix="logger_bench_")
+    os.makedirs(folder, exist_ok=True)
+
+    report = {
+        'version': git_version(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'cpu_count': os.cpu_count(),
+        'runs': [],
+    }
+
+    print("=" * 78)
+    print(f"Benchmarks de bout en bout ({'débit maximal' if args.fast else 'temps réel'}, "
+          f"{args.format}, {args.duration:g} s par essai)")
+    print("=" * 78)
+
+    try:
+        for sample_rate in args.rates:
+            for n_channels in args.channels:
+                run = run_case(sample_rate, n_channels, args, folder)
+                report['runs'].append(run)
+                stages = run['stages']
+                print(f"{sample_rate:>8g} Hz x {n_channels:>3} canaux : "
+                      f"{run['samples_per_second'] / 1e3:9.1f} k points/s "
+                      f"(x{run['realtime_factor']:.2f}), CPU {run['cpu_percent']:5.1f} %, "
+                      f"lecture p99 {stages['read']['p99_ms']:.2f} ms, "
+                      f"traitement p99 {stages['process']['p99_ms']:.2f} ms, "
+                      f"tracé p99 {stages['plot_draw']['p99_ms']:.1f} ms")
+    finally:
+        if args.folder is None:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    output = args.output
+    if output is None:
+        # Rapports locaux, non suivis par git
+        os.makedirs(RESULTS_FOLDER, exist_ok=True)
+        output = os.path.join(RESULTS_FOLDER, f"bench_report_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print("=" * 78)
+    print(f"Rapport: {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
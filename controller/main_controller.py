@@ -2,9 +2,12 @@
 Contrôleur principal - Orchestre la communication entre Model et View
 """
 import tkinter as tk
+import threading
 import time
-import numpy as np
+from collections import deque
+from controller.plot_worker import PlotWorker
 from utils.settings_manager import SettingsManager
+from utils.startup_profiler import StartupProfiler
 from utils.daq_utils import list_available_tasks, get_task_channels
 
 
@@ -13,7 +16,7 @@ class MainController:
     Classe contrôleur pour orchestrer le modèle et la vue
     """
     
-    def __init__(self, daq_model, data_model, view):
+    def __init__(self, daq_model, data_model, view, profiler=None):
         """
         Initialise le contrôleur
         
@@ -21,10 +24,13 @@ class MainController:
             daq_model: Instance du modèle DAQ
             data_model: Instance du modèle de données
             view: Instance de la vue
+            profiler: Profil de démarrage (StartupProfiler, optionnel)
         """
         self.daq_model = daq_model
         self.data_model = data_model
         self.view = view
+        self.config = data_model.config
+        self.profiler = profiler or StartupProfiler()
         
         # Gestionnaire de paramètres
         self.settings_manager = SettingsManager()
@@ -48,51 +54,91 @@ class MainController:
         # Timer pour la mise à jour de l'interface
         self.update_timer = None
         
+        # Coût lissé d'une mise à jour (s) et instants des dernières mises à jour tracées (FPS)
+        self._update_cost = None
+        self._frame_times = deque(maxlen=20)
+        
+        # Préparation des trames des graphiques hors du thread Tk
+        self.plot_worker = PlotWorker(daq_model, data_model, self.config)
+        
     def initialize(self):
         """
         Initialise l'application
         """
         # Charger les paramètres sauvegardés
         settings = self.settings_manager.load_settings()
+        self._saved_task_name = settings['task_name']
         
-        # Lister les tâches DAQmx disponibles
-        available_tasks = list_available_tasks()
+        # Restaurer les autres paramètres
+        self.view.record_period.set(settings['record_period'])
+        self.record_period = settings['record_period']
+        self.view.average_enabled.set(settings.get('average_enabled', self.config.RECORD_AVERAGE_ENABLED))
+        
+        self.view.file_prefix.set(settings.get('file_prefix', 'data'))
+        self.view.file_comment.set(settings.get('file_comment', ''))
+        self.view.save_directory.set(settings.get('last_save_folder', 'data'))
+        
+        # Lister tâches et périphériques DAQmx en arrière-plan : la fenêtre reste réactive
+        # (import de nidaqmx et interrogation du pilote) ; la combobox est remplie ensuite
+        if self._saved_task_name:
+            self.view.selected_task.set(self._saved_task_name)
+        self._daq_inventory = None
+        threading.Thread(target=self._enumerate_daq, name="DAQEnumeration", daemon=True).start()
+        self.view.root.after(50, self._check_daq_inventory)
+        
+        # NE PAS démarrer l'acquisition automatiquement - attendre le clic sur Démarrer
+        print("ℹ Application en attente - Cliquez sur 'Démarrer' pour lancer l'acquisition")
+        
+        # Démarrer la mise à jour périodique de l'interface quand même
+        if self.config.PLOT_WORKER_ENABLED:
+            self.plot_worker.start()
+        self._schedule_update()
+    
+    def _enumerate_daq(self):
+        """
+        Liste les tâches et périphériques DAQmx (exécuté dans un thread, sans accès à Tk)
+        """
+        start = time.perf_counter()
+        tasks = list_available_tasks()
+        devices = self.daq_model.list_available_devices()
+        
+        # Sans carte, proposer la tâche simulée
+        if not devices and self.config.ENABLE_SIMULATION:
+            tasks = tasks + [self.config.SIMULATION_TASK_NAME]
+        self._daq_inventory = (tasks, devices, time.perf_counter() - start)
+    
+    def _check_daq_inventory(self):
+        """
+        Remplit la liste des tâches quand l'énumération en arrière-plan est terminée
+        """
+        if self._daq_inventory is None:
+            self.view.root.after(50, self._check_daq_inventory)
+            return
+        
+        available_tasks, devices, duration = self._daq_inventory
+        self.profiler.mark(f"Énumération DAQmx (arrière-plan, {duration * 1000:.0f} ms)")
+        self.profiler.report("Profil de démarrage (énumération DAQmx)")
         
         # Mettre à jour la combobox des tâches
         if available_tasks:
             self.view.task_combo['values'] = available_tasks
             
             # Sélectionner la dernière tâche utilisée si disponible
-            if settings['task_name'] and settings['task_name'] in available_tasks:
-                self.view.selected_task.set(settings['task_name'])
-                self.selected_task_name = settings['task_name']
-            elif available_tasks:
+            if self._saved_task_name and self._saved_task_name in available_tasks:
+                self.view.selected_task.set(self._saved_task_name)
+                self.selected_task_name = self._saved_task_name
+            else:
                 # Sinon, sélectionner la première tâche
                 self.view.selected_task.set(available_tasks[0])
                 self.selected_task_name = available_tasks[0]
         else:
+            self.view.selected_task.set('')
             print("Aucune tâche DAQmx configurée")
         
-        # Restaurer les autres paramètres
-        self.view.record_period.set(settings['record_period'])
-        self.record_period = settings['record_period']
-        
-        self.view.file_prefix.set(settings.get('file_prefix', 'data'))
-        self.view.file_comment.set(settings.get('file_comment', ''))
-        self.view.save_directory.set(settings.get('last_save_folder', 'data'))
-        
-        # Lister les périphériques disponibles
-        devices = self.daq_model.list_available_devices()
         if devices:
             print(f"Périphériques DAQ détectés: {', '.join(devices)}")
         else:
             print("Aucun périphérique DAQ détecté (mode simulation)")
-        
-        # NE PAS démarrer l'acquisition automatiquement - attendre le clic sur Démarrer
-        print("ℹ Application en attente - Cliquez sur 'Démarrer' pour lancer l'acquisition")
-        
-        # Démarrer la mise à jour périodique de l'interface quand même
-        self._schedule_update()
     
     def start_recording(self):
         """
@@ -114,6 +160,9 @@ class MainController:
                 task_name=task_name
             )
             
+            # Nouveau buffer : les versions repartent de zéro
+            self.plot_worker.reset()
+            
             if success:
                 self.acquisition_active = True
                 
@@ -125,7 +174,18 @@ class MainController:
                 if channel_names:
                     self.view.setup_plot_channels(channel_names)
                 
-                print("Acquisition démarrée à 10 Hz")
+                # Afficher la fréquence effective (mode standard ou haute fréquence) et adapter
+                # l'axe du graphique instantané à la durée réelle de sa fenêtre
+                self.view.set_sample_rate(
+                    self.daq_model.sample_rate,
+                    self.daq_model.max_instantane_samples / self.daq_model.sample_rate
+                )
+                
+                # Statistiques glissantes sur la fenêtre configurée
+                self.data_model.reset_running_statistics(
+                    int(self.config.STATISTICS_WINDOW_DURATION * self.daq_model.sample_rate))
+                
+                print(f"Acquisition démarrée à {self.daq_model.sample_rate:g} Hz")
             else:
                 tk.messagebox.showerror(
                     "Erreur",
@@ -140,7 +200,8 @@ class MainController:
         comment = self.view.file_comment.get() or ""
         record_period = int(self.view.record_period.get())
         save_folder = self.view.save_directory.get() or "data"
-        self.daq_model.start_recording(file_prefix=file_prefix, comment=comment, record_period=record_period, save_folder=save_folder)
+        self.daq_model.start_recording(file_prefix=file_prefix, comment=comment, record_period=record_period, save_folder=save_folder,
+                                       average_enabled=self.view.average_enabled.get())
         self.recording_active = True
         self.last_record_time = time.time()
         print("Enregistrement démarré")
@@ -165,14 +226,27 @@ class MainController:
             # Réactiver les contrôles de configuration
             self.view.set_config_controls_state(enabled=True)
             
+            # Temps de rendu mesurés (comparaison blitting / redessin complet)
+            for name, stats in self.view.get_frame_stats().items():
+                if stats['frames']:
+                    print(f"Rendu graphique {name} ({stats['mode']}): "
+                          f"{stats['frame_mean_ms']:.1f} ms en moyenne, p95 {stats['frame_p95_ms']:.1f} ms, "
+                          f"{stats['full_redraws']} rendu(s) complet(s), {stats['blits']} blit(s)")
+            
             print("Acquisition arrêtée")
         
         # Afficher les informations
-        if result and result['filepath']:
+        if result and result['full_rate_filepath']:
+            tk.messagebox.showinfo(
+                "Enregistrement terminé",
+                f"Données pleine cadence sauvegardées dans:\n{result['full_rate_filepath']}\n\n"
+                f"{result['n_samples']} échantillons périodiques enregistrés"
+            )
+        elif result and result['filepath']:
             tk.messagebox.showinfo(
                 "Enregistrement terminé",
                 f"Données sauvegardées dans:\n{result['filepath']}\n\n"
-                f"{len(result['timestamps'])} échantillons enregistrés"
+                f"{result['n_samples']} échantillons enregistrés"
             )
         else:
             tk.messagebox.showwarning(
@@ -226,6 +300,7 @@ class MainController:
         # Sauvegarder tous les paramètres
         self.settings_manager.set('task_name', self.selected_task_name)
         self.settings_manager.set('record_period', int(self.view.record_period.get()))
+        self.settings_manager.set('average_enabled', self.view.average_enabled.get())
         self.settings_manager.set('file_prefix', self.view.file_prefix.get())
         self.settings_manager.set('file_comment', self.view.file_comment.get())
         self.settings_manager.set('last_save_folder', self.view.save_directory.get())
@@ -244,6 +319,8 @@ class MainController:
         if self.update_timer:
             self.view.root.after_cancel(self.update_timer)
         
+        self.plot_worker.stop()
+        
         print("Application terminée")
     
     def _on_data_received(self, data):
@@ -255,53 +332,97 @@ class MainController:
         """
         # Cette fonction est appelée depuis le thread d'acquisition
         # Les mises à jour de l'interface seront faites dans _update_interface
-        pass
+        self.data_model.update_running_statistics(data)
     
     def _update_interface(self):
         """
         Met à jour l'interface avec les dernières données
         """
+        start = time.perf_counter()
+        plotted = False
+        
         try:
-            # Récupérer les données instantanées
-            instant_data = self.daq_model.get_instantane_data()
-            instant_timestamps = self.daq_model.get_instantane_timestamps()
+            # Seul le graphique de l'onglet visible est tracé, et aucun si la fenêtre est réduite
+            visible_plot = None if self.view.is_minimized() else self.view.get_visible_plot()
             
-            # Mettre à jour le graphique instantané
-            if instant_data is not None and len(instant_data) > 0:
-                self.view.update_instantane_plot(instant_data, instant_timestamps)
+            # Tracer les trames préparées par le thread de préparation (set_data + blitting seulement)
+            # (la trame d'un onglet masqué reste en attente jusqu'à ce qu'il redevienne visible)
+            frame = self.plot_worker.take_frame(visible_plot) if visible_plot else None
+            if frame is not None and visible_plot == 'instant':
+                self.view.draw_instantane_frame(frame.time_axis, frame.data, frame.y_range)
+                plotted = True
+            elif frame is not None:
+                self.view.draw_longue_duree_frame(frame.time_axis, frame.data, frame.y_range)
+                plotted = True
+            
+            # Demander les trames suivantes (le graphique longue durée seulement pendant l'enregistrement)
+            if visible_plot == 'long' and not self.recording_active:
+                visible_plot = None
+            self.plot_worker.request(visible_plot, self.view.get_plot_widths(), self.view.scale_version)
             
             # Mettre à jour le nombre de points disponibles dans le buffer
             if self.acquisition_active:
                 buffer_available = self.daq_model.get_buffer_available_samples()
                 self.view.buffer_available.set(f"{buffer_available} points")
                 
+                # Durées des étapes du chemin critique (qui ralentit l'acquisition ?)
+                stages = self.daq_model.get_metrics()['stages']
+                self.view.metrics_text.set(
+                    f"buf {stages['buffer']['p99_ms']:.2f} · enr {stages['record']['p99_ms']:.2f} · "
+                    f"cb {stages['callback']['p99_ms']:.2f} ms")
+                
                 # Mettre à jour le temps écoulé
                 elapsed_time = self.daq_model.get_elapsed_time()
                 self.view.elapsed_time.set(elapsed_time)
             else:
                 self.view.buffer_available.set("0 points")
+                self.view.metrics_text.set("-")
                 self.view.elapsed_time.set("00:00:00")
             
-            # Si enregistrement actif
-            if self.recording_active:
-                # Vérifier si on doit faire un enregistrement périodique (non nécessaire car temps réel)
-                # self._check_periodic_save()
-                
-                # Mettre à jour le graphique longue durée
-                long_data_dict = self.daq_model.get_longue_duree_data()
-                if long_data_dict and long_data_dict['data'] is not None:
-                    if isinstance(long_data_dict['data'], np.ndarray) and long_data_dict['data'].size > 0:
-                        self.view.update_longue_duree_plot(
-                            long_data_dict['timestamps'],
-                            long_data_dict['data']
-                        )
+            # État du thread d'écriture (le stockage suit-il l'acquisition ?)
+            writer_stats = self.daq_model.get_writer_stats()
+            if writer_stats:
+                status = (f"file {writer_stats['queue_depth']} · "
+                          f"{writer_stats['write_latency_last_ms']:.1f} ms")
+                if writer_stats['spill_pending']:
+                    status += f" · ↪ {writer_stats['spill_pending']} en tampon"
+                if writer_stats['dropped_blocks']:
+                    status += f" · ⚠ {writer_stats['dropped_blocks']} perdu(s)"
+                self.view.writer_status.set(status)
+            else:
+                self.view.writer_status.set("-")
+            
+            # Statistiques du premier canal sur la fenêtre glissante (lecture O(1))
+            if self.acquisition_active:
+                stats = self.data_model.get_running_statistics(channel_index=0, window=True)
+                self.view.statistics_text.set(
+                    f"moy {stats['mean']:.3f} · σ {stats['std']:.3f} · eff {stats['rms']:.3f}")
             
         except Exception as e:
             print(f"Erreur lors de la mise à jour de l'interface: {e}")
         
+        # Mesurer le coût de la mise à jour et la cadence d'affichage obtenue
+        end = time.perf_counter()
+        cost = end - start
+        self._update_cost = cost if self._update_cost is None else 0.8 * self._update_cost + 0.2 * cost
+        if plotted:
+            self._frame_times.append(end)
+        self.view.refresh_status.set(f"{self.get_fps():.1f} i/s · {self._update_cost * 1000:.0f} ms")
+        
         # Planifier la prochaine mise à jour
         self._schedule_update()
     
+    def get_fps(self):
+        """
+        Retourne la cadence d'affichage obtenue (graphiques tracés par seconde)
+        """
+        if len(self._frame_times) < 2:
+            return 0.0
+        # Une cadence nulle si plus rien n'est tracé depuis une seconde (données inchangées, fenêtre réduite)
+        if time.perf_counter() - self._frame_times[-1] > self.config.GUI_REFRESH_MAX_PERIOD:
+            return 0.0
+        return (len(self._frame_times) - 1) / (self._frame_times[-1] - self._frame_times[0])
+    
     def _check_periodic_save(self):
         """
         Vérifie si un enregistrement périodique doit être effectué
@@ -330,8 +451,16 @@ class MainController:
         """
         Planifie la prochaine mise à jour de l'interface
         """
-        # Mise à jour toutes les 100 ms
-        self.update_timer = self.view.root.after(100, self._update_interface)
+        # Fenêtre réduite : juste assez souvent pour les indicateurs
+        if self.view.is_minimized():
+            period = self.config.GUI_REFRESH_MINIMIZED_PERIOD
+        else:
+            # Laisser au moins (facteur - 1) fois le coût d'une mise à jour à la boucle Tk
+            cost = self._update_cost or 0.0
+            period = min(max(self.config.GUI_REFRESH_MIN_PERIOD, cost * self.config.GUI_REFRESH_COST_FACTOR),
+                         self.config.GUI_REFRESH_MAX_PERIOD)
+        
+        self.update_timer = self.view.root.after(int(period * 1000), self._update_interface)
     
     def run(self):
         """
@@ -0,0 +1,192 @@
+"""
+Préparation des tracés - Thread qui transforme les données acquises en trames prêtes à tracer
+"""
+import threading
+
+import numpy as np
+
+
+class PlotFrame:
+    """
+    Trame prête à tracer : axe temporel relatif, données décimées et étendue en y
+    """
+
+    def __init__(self, time_axis, data, y_range, version):
+        """
+        Args:
+            time_axis: Axe temporel relatif au premier point (tableau 1D)
+            data: Données décimées (canaux x points), une ligne par courbe
+            y_range: Tuple (min, max) des données, pour l'échelle automatique
+            version: Version des données sources
+        """
+        self.time_axis = time_axis
+        self.data = data
+        self.y_range = y_range
+        self.version = version
+
+
+class PlotWorker:
+    """
+    Thread de préparation des graphiques
+
+    À chaque rafraîchissement, le contrôleur (thread Tk) récupère les trames
+    prêtes puis demande la préparation des suivantes en indiquant l'état de
+    la vue (graphique visible, largeurs). Le thread lit alors l'image des
+    données, la décime par enveloppe min/max, calcule l'axe temporel et
+    l'étendue en y : il ne reste au thread Tk que set_data et le blitting.
+
+    Le thread n'accède jamais à Tk ; seules les trames et l'état de la vue
+    sont partagés, sous verrou.
+    """
+
+    def __init__(self, daq_model, data_model, config):
+        """
+        Initialise le thread de préparation (non démarré)
+
+        Args:
+            daq_model: Modèle DAQ (source des images de données)
+            data_model: Modèle de données (décimation)
+            config: Objet de configuration
+        """
+        self.daq_model = daq_model
+        self.data_model = data_model
+        self.config = config
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._view_state = None
+        self._frames = {'instant': None, 'long': None}
+        self._versions = {'instant': None, 'long': None}
+
+    def start(self):
+        """Démarre le thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="PlotWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête le thread"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def reset(self):
+        """
+        Oublie les trames et versions (nouvelle acquisition : les versions repartent de zéro)
+        """
+        with self._lock:
+            self._frames = {'instant': None, 'long': None}
+            self._versions = {'instant': None, 'long': None}
+
+    def request(self, visible_plot, widths, scale_version):
+        """
+        Demande la préparation des trames du graphique visible
+
+        Args:
+            visible_plot: 'instant', 'long' ou None (fenêtre réduite)
+            widths: Largeurs des graphiques en pixels {'instant': ..., 'long': ...}
+            scale_version: Version des réglages d'échelle de la vue
+        """
+        with self._lock:
+            self._view_state = (visible_plot, dict(widths), scale_version)
+
+        if self._thread is None:
+            # Thread non démarré : préparation synchrone
+            self.prepare()
+        else:
+            self._wake.set()
+
+    def take_frame(self, plot_name):
+        """
+        Retourne la dernière trame préparée pour un graphique, une seule fois
+
+        Returns:
+            PlotFrame: Trame à tracer, ou None si rien de nouveau
+        """
+        with self._lock:
+            frame = self._frames[plot_name]
+            self._frames[plot_name] = None
+        return frame
+
+    def _run(self):
+        """
+        Boucle du thread : prépare les trames à chaque demande
+        """
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.prepare()
+            except Exception as e:
+                print(f"Erreur lors de la préparation des graphiques: {e}")
+
+    def prepare(self):
+        """
+        Prépare la trame du graphique visible si ses données ont changé
+        """
+        with self._lock:
+            state = self._view_state
+            versions = dict(self._versions)
+        if state is None:
+            return
+
+        visible_plot, widths, scale_version = state
+        if visible_plot == 'instant':
+            frame = self._prepare_instant(widths['instant'], versions['instant'])
+        elif visible_plot == 'long':
+            frame = self._prepare_long(widths['long'], scale_version, versions['long'])
+        else:
+            return
+
+        if frame is not None:
+            with self._lock:
+                self._frames[visible_plot] = frame
+                self._versions[visible_plot] = frame.version
+
+    def _prepare_instant(self, width, last_version):
+        """
+        Prépare la fenêtre instantanée (rien si la version n'a pas changé)
+        """
+        timestamps, data, version = self.daq_model.get_instantane_snapshot(last_version)
+        if data is None or data.size == 0:
+            return None
+
+        return self._make_frame(timestamps, data, width, version)
+
+    def _prepare_long(self, width, scale_version, last_version):
+        """
+        Prépare l'historique longue durée (rien si ni les points, ni l'échelle, ni la largeur n'ont changé)
+        """
+        history_version = self.daq_model.get_longue_duree_version()
+        version = (history_version, scale_version, width)
+        if history_version is None or version == last_version:
+            return None
+
+        # Tout l'enregistrement, au niveau de résolution adapté à la largeur du graphique
+        long_data = self.daq_model.get_longue_duree_data(max_points=width)
+        if not isinstance(long_data['data'], np.ndarray) or long_data['data'].size == 0:
+            return None
+
+        return self._make_frame(long_data['timestamps'], long_data['data'], width, version)
+
+    def _make_frame(self, timestamps, data, width, version):
+        """
+        Décime les données et calcule l'axe temporel relatif et l'étendue en y
+        """
+        if self.config.PLOT_ENVELOPE_ENABLED:
+            timestamps, data = self.data_model.decimate_minmax(timestamps, data, width)
+
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        time_axis = timestamps - timestamps[0]
+        y_range = (float(data.min()), float(data.max()))
+        return PlotFrame(time_axis, np.ascontiguousarray(data), y_range, version)
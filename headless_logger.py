@@ -0,0 +1,230 @@
+"""
+Logger NI - Acquisition et enregistrement sans interface graphique
+Point d'entrée pour les bancs de test sans surveillance (aucun import de Tkinter ni de matplotlib)
+
+Usage:
+    python headless_logger.py [--config logger_config.json] [--task NOM [NOM ...]] [--period 1]
+                              [--duration 3600] [--mode FULL_RATE] [--format BIN] ...
+
+Les paramètres non fournis en ligne de commande sont lus dans le fichier de
+configuration (mêmes clés que l'interface : task_name, record_period,
+file_prefix, file_comment, last_save_folder, average_enabled). Ctrl+C ou SIGTERM arrête
+proprement l'enregistrement (files d'écriture vidées, fichiers fermés).
+
+Plusieurs tâches (une par carte) peuvent être acquises simultanément : chacune
+a son thread de lecture et ses fichiers, reliés par un manifeste de session.
+"""
+import argparse
+import signal
+import sys
+import os
+import threading
+import time
+
+# Ajouter le dossier parent au path pour les imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model.data_model import DataModel
+from model.multi_task import MultiTaskSession
+from utils.config import config
+from utils.settings_manager import SettingsManager
+
+
+def parse_arguments(argv=None):
+    """
+    Analyse les arguments de la ligne de commande
+    """
+    parser = argparse.ArgumentParser(description="Logger NI - acquisition sans interface graphique")
+    parser.add_argument("--config", default=config.CONFIG_FILE,
+                        help="Fichier de configuration JSON (défaut: %(default)s)")
+    parser.add_argument("--task", nargs="+",
+                        help="Tâche(s) DAQmx (NI MAX) à utiliser, acquises simultanément")
+    parser.add_argument("--period", type=float, help="Période d'enregistrement en secondes")
+    parser.add_argument("--prefix", help="Préfixe des fichiers")
+    parser.add_argument("--comment", help="Commentaire d'en-tête")
+    parser.add_argument("--folder", help="Dossier d'enregistrement")
+    parser.add_argument("--rate", type=float, help="Fréquence d'échantillonnage par canal (Hz)")
+    parser.add_argument("--mode", choices=["DECIMATED", "FULL_RATE"], help="Mode d'enregistrement")
+    parser.add_argument("--format", choices=["TXT", "CSV", "BIN", "TDMS"], help="Format des fichiers")
+    parser.add_argument("--average", action=argparse.BooleanOptionalAction, default=None,
+                        help="Enregistrer moyenne, min, max et RMS de chaque période")
+    parser.add_argument("--metrics", action="store_true",
+                        help="Écrire les durées des étapes d'acquisition dans <fichier>_metrics.json à l'arrêt")
+    parser.add_argument("--duration", type=float, default=0,
+                        help="Durée d'enregistrement en secondes (0: jusqu'à Ctrl+C / SIGTERM)")
+    parser.add_argument("--status-interval", type=float, default=5.0,
+                        help="Intervalle entre deux lignes d'état en secondes (défaut: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def build_settings(args):
+    """
+    Fusionne le fichier de configuration et les arguments (les arguments l'emportent)
+
+    Returns:
+        dict: Paramètres d'acquisition et d'enregistrement
+    """
+    settings = SettingsManager(args.config).load_settings()
+
+    return {
+        'task_names': args.task or ([settings['task_name']] if settings.get('task_name') else []),
+        'record_period': args.period if args.period is not None else settings.get('record_period', 1),
+        'file_prefix': args.prefix or settings.get('file_prefix', 'data'),
+        'file_comment': args.comment if args.comment is not None else settings.get('file_comment', ''),
+        'save_folder': args.folder or settings.get('last_save_folder', 'data'),
+        'sample_rate': args.rate if args.rate is not None else settings.get('sample_rate'),
+        'record_mode': args.mode or settings.get('record_mode', config.RECORD_MODE),
+        'save_format': args.format or settings.get('save_format', config.SAVE_FORMAT),
+        'dump_metrics': args.metrics,
+        'average_enabled': args.average if args.average is not None else settings.get('average_enabled'),
+    }
+
+
+def apply_settings(settings):
+    """
+    Reporte la fréquence et le format choisis dans la configuration partagée
+    """
+    sample_rate = settings['sample_rate']
+    if sample_rate is not None:
+        if sample_rate >= config.HIGH_RATE_MIN:
+            # Dimensionnement haute fréquence (blocs, buffer DAQmx) d'après la fréquence
+            config.HIGH_RATE_ENABLED = True
+            config.HIGH_RATE_SAMPLE_RATE = float(sample_rate)
+        else:
+            config.HIGH_RATE_ENABLED = False
+            config.SAMPLE_RATE = float(sample_rate)
+
+    config.RECORD_MODE = settings['record_mode']
+    config.SAVE_FORMAT = settings['save_format']
+    if settings['dump_metrics']:
+        config.METRICS_DUMP_ON_STOP = True
+
+
+def format_status(daq_model, data_model):
+    """
+    Construit la ligne d'état périodique
+    """
+    status = (f"[{daq_model.get_elapsed_time()}] "
+              f"{daq_model.total_samples_acquired} points/canal · "
+              f"buffer DAQmx {daq_model.get_buffer_available_samples()}")
+
+    writer_stats = daq_model.get_writer_stats()
+    if writer_stats:
+        status += (f" · file {writer_stats['queue_depth']}"
+                   f" · écriture {writer_stats['write_latency_last_ms']:.1f} ms")
+        if writer_stats['spill_pending']:
+            status += f" · ↪ {writer_stats['spill_pending']} en tampon"
+        if writer_stats['dropped_blocks']:
+            status += f" · ⚠ {writer_stats['dropped_blocks']} perdu(s)"
+
+    # Durées p99 des étapes du chemin critique (buffer, enregistrement, callback)
+    stages = daq_model.get_metrics()['stages']
+    status += (f" · p99 buf {stages['buffer']['p99_ms']:.2f} enr {stages['record']['p99_ms']:.2f}"
+               f" cb {stages['callback']['p99_ms']:.2f} ms")
+    stats = data_model.get_running_statistics(channel_index=0, window=True)
+    status += f" · canal 1: moy {stats['mean']:.3f} eff {stats['rms']:.3f}"
+    return status
+
+
+def main(argv=None):
+    """
+    Fonction principale : acquisition et enregistrement jusqu'à la durée demandée ou un signal
+
+    Returns:
+        int: Code de sortie
+    """
+    args = parse_arguments(argv)
+
+    print("=" * 60)
+    print("Logger NI - Acquisition sans interface graphique")
+    print("=" * 60)
+
+    settings = build_settings(args)
+    if not settings['task_names']:
+        print("❌ Aucune tâche DAQmx indiquée (--task ou task_name dans la configuration)")
+        return 2
+    apply_settings(settings)
+
+    # Une tâche par carte, chacune avec son thread de lecture et ses statistiques
+    data_models = {}
+    session = MultiTaskSession(config, settings['task_names'],
+                               data_callback=lambda label, data: data_models[label].update_running_statistics(data))
+    data_models.update({label: DataModel(config) for label in session.models})
+    multiple = len(session.models) > 1
+
+    # Arrêt demandé par Ctrl+C ou SIGTERM : traité dans la boucle principale
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        print(f"\nSignal {signal.Signals(signum).name} reçu - arrêt de l'enregistrement...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    if not session.start_acquisition():
+        print("❌ Impossible de démarrer l'acquisition")
+        return 1
+
+    exit_code = 0
+    try:
+        for label, daq_model in session.models.items():
+            data_models[label].reset_running_statistics(
+                int(config.STATISTICS_WINDOW_DURATION * daq_model.sample_rate))
+
+        session.start_recording(
+            file_prefix=settings['file_prefix'],
+            comment=settings['file_comment'],
+            record_period=settings['record_period'],
+            save_folder=settings['save_folder'],
+            record_mode=settings['record_mode'],
+            average_enabled=settings['average_enabled']
+        )
+        for label, daq_model in session.models.items():
+            print(f"{f'[{label}] ' if multiple else ''}Acquisition de {daq_model.get_channel_count()} "
+                  f"canal(aux) à {daq_model.sample_rate:g} Hz")
+        print('Ctrl+C pour arrêter' if not args.duration else f'Durée {args.duration:g} s')
+
+        end_time = time.monotonic() + args.duration if args.duration else None
+        while not stop_event.is_set():
+            timeout = args.status_interval
+            if end_time is not None:
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    break
+                timeout = min(timeout, remaining)
+
+            if not stop_event.wait(timeout):
+                # Une ligne par tâche, avec son débit et son backlog en session multi-tâches
+                for task_stats in session.get_task_stats():
+                    label = task_stats['label']
+                    status = format_status(session.models[label], data_models[label])
+                    if multiple:
+                        status = (f"[{label}] {status} · {task_stats['throughput'] / 1e3:.1f} k points/s"
+                                  f" · backlog {task_stats['backlog_s'] * 1000:.0f} ms")
+                    print(status, flush=True)
+
+    except Exception as e:
+        print(f"\n❌ Erreur pendant l'enregistrement: {e}")
+        exit_code = 1
+
+    finally:
+        # Vider les files d'écriture et fermer les fichiers avant d'arrêter la tâche
+        results = session.stop_recording() if session.is_recording else {}
+        session.stop_acquisition()
+
+        for label in session.models:
+            result = results.get(label)
+            if result:
+                print(f"✓ {f'[{label}] ' if multiple else ''}{result['n_samples']} points périodiques enregistrés")
+                for key in ('filepath', 'full_rate_filepath', 'metrics_filepath'):
+                    if result[key]:
+                        print(f"✓ Fichier: {result[key]}")
+        if results.get('manifest'):
+            print(f"✓ Session: {results['manifest']}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
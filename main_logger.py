@@ -1,53 +1,85 @@
 """
 Logger NI - Application d'acquisition de données National Instruments
 Point d'entrée principal de l'application
+
+Usage:
+    python main_logger.py [--profile-startup]
+
+La fenêtre est affichée avant les imports lourds (matplotlib) ; nidaqmx n'est
+importé qu'à la première utilisation et les tâches DAQmx sont listées en
+arrière-plan.
 """
-import tkinter as tk
+import argparse
 import sys
 import os
 
 # Ajouter le dossier parent au path pour les imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from model.daq_model import DAQModel
-from model.data_model import DataModel
-from view.main_view import MainView
-from controller.main_controller import MainController
-from utils.config import config
+from utils.startup_profiler import StartupProfiler
 
 
 def main():
     """
     Fonction principale de l'application
     """
+    parser = argparse.ArgumentParser(description="Logger NI - Application d'acquisition de données")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Afficher la durée de chaque étape du démarrage")
+    args = parser.parse_args()
+    profiler = StartupProfiler(enabled=args.profile_startup)
+    
     print("=" * 60)
     print("Logger NI - Application d'acquisition de données")
     print("Architecture MVC - Python + Tkinter + DAQmx")
     print("=" * 60)
     
-    # Créer la fenêtre principale Tkinter
+    import tkinter as tk
+    from utils.config import config
+    profiler.mark("Import de Tkinter")
+    
+    # Créer et afficher la fenêtre principale tout de suite
     root = tk.Tk()
+    root.title("Logger NI")
+    loading_label = tk.Label(root, text="Chargement...", font=("Segoe UI", 12), padx=40, pady=30)
+    loading_label.pack()
+    root.update()
+    profiler.mark("Affichage de la fenêtre")
     
     try:
         # Créer les composants MVC
         print("\nInitialisation des composants...")
         
         # Modèles
+        from model.daq_model import DAQModel
+        from model.data_model import DataModel
+        profiler.mark("Import des modèles")
         daq_model = DAQModel(config)
         data_model = DataModel(config)
         print("✓ Modèles créés")
         
-        # Vue
+        # Vue (import de matplotlib)
+        from view.main_view import MainView
+        profiler.mark("Import de la vue (matplotlib)")
+        loading_label.destroy()
         view = MainView(root, config)
+        profiler.mark("Création de la vue")
         print("✓ Vue créée")
         
         # Contrôleur
-        controller = MainController(daq_model, data_model, view)
+        from controller.main_controller import MainController
+        controller = MainController(daq_model, data_model, view, profiler=profiler)
         print("✓ Contrôleur créé")
         
         print("\nDémarrage de l'application...")
         print("-" * 60)
         
+        # Rapport dès que la boucle Tk tourne (l'énumération DAQmx est rapportée à sa fin)
+        def report_startup():
+            profiler.mark("Initialisation et premier affichage")
+            profiler.report()
+        root.after_idle(report_startup)
+        
         # Lancer l'application
         controller.run()
         
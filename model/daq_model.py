@@ -1,21 +1,29 @@
 """
 Modèle DAQ - Gestion de l'acquisition de données avec National Instruments DAQmx
 """
-import nidaqmx
-from nidaqmx.constants import AcquisitionType, TerminalConfiguration
 import numpy as np
 import threading
 import time
 from datetime import datetime
-import csv
 import os
 
+from model.ring_buffer import RingBuffer
+from model.simulation import SimulatedTask
+from model.history_pyramid import HistoryPyramid
+from model.running_stats import PeriodAggregator
+from model.record_writer import RecordWriter, SampleTimes, create_record_file
+from utils.stage_metrics import StageMetrics
+
 
 class DAQModel:
     """
     Classe pour gérer l'acquisition de données avec une carte NI DAQmx
     """
     
+    # Étapes mesurées par bloc : lecture DAQmx, buffer instantané, enregistrement
+    # (soumission aux writers, point périodique), callback, et bloc complet
+    METRIC_STAGES = ("read", "buffer", "record", "callback", "block")
+    
     def __init__(self, config):
         """
         Initialise le modèle DAQ
@@ -30,29 +38,44 @@ class DAQModel:
         self.acquisition_thread = None
         self.data_callback = None
         
-        # Buffers pour les données
-        self.buffer_instantane = []
-        self.buffer_instantane_timestamps = []
-        self.max_instantane_samples = config.INSTANT_MAX_SAMPLES  # 600 points (1 minute à 10Hz)
+        # Buffer circulaire de la fenêtre instantanée (créé quand le nombre de canaux est connu)
+        self.instant_buffer = None
         
-        # Données enregistrées avec timestamps (graphique longue durée)
-        self.recorded_data = []
-        self.recorded_timestamps = []
-        self.max_longue_duree_samples = config.MAX_LONGUE_DUREE_SAMPLES  # 100 000 points max
+        # Historique multi-résolution des points enregistrés (graphique longue durée)
+        self.long_history = None
         
         # Compteur de points pour le calcul précis du temps
         self.total_samples_acquired = 0  # Compteur total de points acquis depuis le début de l'enregistrement
-        self.sample_rate = config.SAMPLE_RATE  # Fréquence d'échantillonnage (Hz)
+        
+        # Fréquence d'échantillonnage (Hz) et paramètres de lecture qui en découlent
+        self.sample_rate = config.SAMPLE_RATE
+        self.samples_per_read = config.SAMPLES_PER_READ
+        self.input_buffer_size = config.SAMPLES_PER_CHANNEL
+        self.read_timeout = config.TIMEOUT
+        self.max_instantane_samples = config.INSTANT_MAX_SAMPLES  # 600 points (1 minute à 10Hz)
+        self.configure_sample_rate()
         
         # Période d'enregistrement (peut être changée dynamiquement)
         self.record_period = 1  # Par défaut 1 seconde
         
-        # Fichier TXT pour enregistrement temps réel
-        self.txt_file = None
-        self.txt_writer = None
+        # Agrégation moyenne/min/max/RMS de chaque période (None: un point instantané par période)
+        self.period_aggregator = None
+        
+        # Enregistrement temps réel : fichiers TXT écrits par des threads dédiés
+        # (_record_lock protège compteurs, historique et writers entre acquisition et arrêt ;
+        # _submit_lock couvre les dépôts dans les files d'écriture, faits hors de _record_lock
+        # pour qu'une file pleine ne bloque pas l'affichage)
+        self.record_mode = config.RECORD_MODE
+        self.record_writer = None  # Fichier résumé (un point par période)
+        self.full_rate_writer = None  # Fichier pleine cadence (tous les points)
+        self._record_lock = threading.Lock()
+        self._submit_lock = threading.Lock()
         self.current_filepath = None
+        self.full_rate_filepath = None
+        self.record_base_path = None  # Chemin des fichiers sans extension
         self.recording_start_time = None  # Temps de début d'enregistrement
         self.last_save_time = None  # Dernier temps de sauvegarde
+        self.last_save_sample_count = 0  # Nombre de points lors du dernier point périodique
         
         # Temps de début d'acquisition (pour affichage temps écoulé)
         self.acquisition_start_time = None
@@ -63,10 +86,85 @@ class DAQModel:
         
         # Nombre de points disponibles dans le buffer
         self.buffer_available_samples = 0
+        
+        # Lecteur de flux et buffers de lecture réutilisés (alloués au démarrage)
+        self.reader = None
+        self._read_buffers = []
+        self._read_buffer_index = 0
+        
+        # Lectures agrandies pour rattraper le backlog DAQmx (moteur POLLING)
+        self._adapted_reads = 0
+        self._max_read_size = 0
+        self._max_backlog = 0
+        
+        # Moteur d'acquisition actif ("POLLING" ou "EVENT") et verrou du callback DAQmx
+        self.acquisition_engine = config.ACQUISITION_ENGINE
+        self._event_lock = threading.Lock()
+        
+        # Latences de lecture (historique circulaire) pour comparer les moteurs
+        self._latency_offsets = np.zeros(config.LATENCY_HISTORY_SIZE, dtype=np.float64)
+        self._processing_times = np.zeros(config.LATENCY_HISTORY_SIZE, dtype=np.float64)
+        self._latency_count = 0
+        self._engine_samples = 0
+        self._engine_reference_time = None
+        
+        # Instant (perf_counter) estimé du premier point de l'enregistrement, pour
+        # aligner plusieurs tâches sur une base de temps commune
+        self.recording_time_origin = None
+        
+        # Durée de chaque étape du chemin critique (histogrammes fixes, toujours actifs)
+        self.metrics = StageMetrics(self.METRIC_STAGES)
+    
+    def configure_sample_rate(self, sample_rate=None):
+        """
+        Calcule les paramètres de lecture à partir de la fréquence d'échantillonnage
+        
+        En mode haute fréquence (Config.HIGH_RATE_ENABLED), la taille des blocs lus,
+        le buffer d'entrée DAQmx et la fenêtre instantanée sont dimensionnés
+        d'après la fréquence ; sinon les valeurs fixes de la configuration sont utilisées.
+        
+        Args:
+            sample_rate: Fréquence par canal en Hz (optionnel, sinon celle de la configuration)
+        """
+        config = self.config
+        
+        if config.HIGH_RATE_ENABLED:
+            if sample_rate is None:
+                sample_rate = config.HIGH_RATE_SAMPLE_RATE
+            sample_rate = min(max(float(sample_rate), config.HIGH_RATE_MIN), config.HIGH_RATE_MAX)
+            
+            self.samples_per_read = max(1, int(round(sample_rate * config.READ_CHUNK_DURATION)))
+            self.input_buffer_size = max(config.SAMPLES_PER_CHANNEL,
+                                         int(sample_rate * config.INPUT_BUFFER_DURATION))
+            self.max_instantane_samples = min(int(sample_rate * config.INSTANT_HISTORY_SECONDS),
+                                              config.HIGH_RATE_INSTANT_MAX_SAMPLES)
+        else:
+            if sample_rate is None:
+                sample_rate = config.SAMPLE_RATE
+            
+            self.samples_per_read = config.SAMPLES_PER_READ
+            self.input_buffer_size = config.SAMPLES_PER_CHANNEL
+            self.max_instantane_samples = int(sample_rate * config.INSTANT_HISTORY_SECONDS)
+        
+        self.sample_rate = float(sample_rate)
+        
+        # Taille maximale d'une lecture de rattrapage (bornée par le buffer DAQmx)
+        self.max_samples_per_read = self.samples_per_read
+        if config.ADAPTIVE_READ_ENABLED:
+            self.max_samples_per_read = max(
+                self.samples_per_read,
+                min(int(self.sample_rate * config.READ_CHUNK_MAX_DURATION), self.input_buffer_size)
+            )
+        
+        # Lecture bloquante : le timeout doit couvrir largement la durée d'un bloc
+        self.read_timeout = max(config.TIMEOUT, 2.0 * self.samples_per_read / self.sample_rate)
     
     def initialize_task_from_nimax(self, task_name):
         """
-        Charge une tâche existante depuis NI MAX et configure le timing à 10Hz
+        Charge une tâche existante depuis NI MAX et configure le timing à la fréquence choisie
+        
+        La tâche nommée Config.SIMULATION_TASK_NAME est remplacée par une tâche
+        simulée (model.simulation.SimulatedTask) de même interface.
         
         Args:
             task_name: Nom de la tâche NI MAX
@@ -75,16 +173,24 @@ class DAQModel:
             True si succès, False sinon
         """
         try:
-            # Charger la tâche sauvegardée depuis NI MAX
-            import nidaqmx.system.storage as storage
-            
-            # Charger la tâche persistée
-            persisted_task = storage.PersistedTask(task_name)
-            
-            # Charger la tâche dans une instance de Task
-            self.task = persisted_task.load()
-            
-            print(f"✓ Tâche '{task_name}' chargée depuis NI MAX")
+            if task_name == self.config.SIMULATION_TASK_NAME:
+                # Tâche simulée : même interface, sans carte ni pilote
+                self.task = self._create_simulated_task(task_name)
+                continuous_mode = SimulatedTask.CONTINUOUS
+                print(f"✓ Tâche simulée '{task_name}' créée")
+            else:
+                # Charger la tâche sauvegardée depuis NI MAX (nidaqmx importé à la demande)
+                import nidaqmx.system.storage as storage
+                from nidaqmx.constants import AcquisitionType
+                
+                # Charger la tâche persistée
+                persisted_task = storage.PersistedTask(task_name)
+                
+                # Charger la tâche dans une instance de Task
+                self.task = persisted_task.load()
+                continuous_mode = AcquisitionType.CONTINUOUS
+                
+                print(f"✓ Tâche '{task_name}' chargée depuis NI MAX")
             
             # Récupérer les noms des canaux (noms personnalisés)
             self.channel_names = []
@@ -102,12 +208,16 @@ class DAQModel:
             
             print(f"✓ {self.n_channels} canal(aux): {', '.join(self.channel_names)}")
             
-            # Reconfigurer le timing pour 10Hz continu
-            self.task.timing.samp_quant_samp_mode = AcquisitionType.CONTINUOUS
-            self.task.timing.samp_clk_rate = 10.0
-            self.task.timing.samp_quant_samp_per_chan = 1000
+            # Reconfigurer le timing pour une acquisition continue à sample_rate
+            self.task.timing.samp_quant_samp_mode = continuous_mode
+            self.task.timing.samp_clk_rate = self.sample_rate
+            self.task.timing.samp_quant_samp_per_chan = self.input_buffer_size
+            
+            # Dimensionner explicitement le buffer d'entrée (DAQmx le sous-estime à haute fréquence)
+            self.task.in_stream.input_buf_size = self.input_buffer_size
             
-            print(f"✓ Timing reconfiguré: 10 Hz, échantillonnage continu")
+            print(f"✓ Timing reconfiguré: {self.sample_rate:g} Hz, échantillonnage continu, "
+                  f"{self.samples_per_read} point(s) par lecture, buffer de {self.input_buffer_size} points")
             
             return True
             
@@ -135,27 +245,58 @@ class DAQModel:
         
         self.data_callback = data_callback
         
+        # Dimensionner lectures, buffer DAQmx et fenêtre instantanée d'après la fréquence
+        self.configure_sample_rate()
+        
         # Vider les buffers pour repartir sur des données fraîches
-        self.buffer_instantane = []
-        self.buffer_instantane_timestamps = []
-        self.recorded_data = []
-        self.recorded_timestamps = []
+        self.instant_buffer = None
+        self.long_history = None
         self.total_samples_acquired = 0
         self.acquisition_start_time = time.time()  # Enregistrer le temps de démarrage
         print("✓ Buffers vidés - nouvelle acquisition")
         
-        # Si un nom de tâche est fourni, utiliser la tâche NI MAX
-        if task_name:
-            if not self.initialize_task_from_nimax(task_name):
-                return False
-        else:
-            # Sinon utiliser la configuration manuelle
-            if not self.initialize_task():
+        # Sans nom de tâche, utiliser la tâche simulée si la simulation est autorisée
+        if not task_name:
+            if not self.config.ENABLE_SIMULATION:
+                print("Aucune tâche DAQmx indiquée")
                 return False
+            task_name = self.config.SIMULATION_TASK_NAME
+        
+        # Charger la tâche NI MAX (ou la tâche simulée)
+        if not self.initialize_task_from_nimax(task_name):
+            return False
         
+        # Allouer le buffer circulaire et les buffers de lecture une fois le nombre de canaux connu
+        self.instant_buffer = RingBuffer(self.n_channels, self.max_instantane_samples, self.sample_rate)
+        self.reader = self._create_reader()
+        self._allocate_read_buffers()
+        
+        self._latency_count = 0
+        self._engine_samples = 0
+        self._adapted_reads = 0
+        self._max_read_size = 0
+        self._max_backlog = 0
+        self.metrics.reset()
+        self.acquisition_engine = self.config.ACQUISITION_ENGINE
         self.is_running = True
-        self.acquisition_thread = threading.Thread(target=self._acquisition_loop, daemon=True)
-        self.acquisition_thread.start()
+        
+        if self.acquisition_engine == "EVENT":
+            # Moteur événementiel : DAQmx appelle _on_every_n_samples tous les N points
+            try:
+                self.task.register_every_n_samples_acquired_into_buffer_event(
+                    self.samples_per_read, self._on_every_n_samples
+                )
+                self._engine_reference_time = time.perf_counter()
+                self.task.start()
+            except Exception as e:
+                print(f"Erreur lors du démarrage du moteur événementiel: {e}")
+                self.is_running = False
+                self.stop_acquisition()
+                return False
+        else:
+            # Moteur de scrutation : boucle de lecture bloquante dans un thread dédié
+            self.acquisition_thread = threading.Thread(target=self._acquisition_loop, daemon=True)
+            self.acquisition_thread.start()
         
         return True
     
@@ -169,6 +310,22 @@ class DAQModel:
         
         if self.acquisition_thread:
             self.acquisition_thread.join(timeout=2.0)
+            self.acquisition_thread = None
+        
+        # Afficher les latences mesurées pour comparer les moteurs
+        stats = self.get_engine_stats()
+        if stats['events'] > 0:
+            print(f"Moteur {stats['engine']}: {stats['events']} lectures, "
+                  f"latence moyenne {stats['latency_mean_ms']:.2f} ms, "
+                  f"p99 {stats['latency_p99_ms']:.2f} ms, max {stats['latency_max_ms']:.2f} ms, "
+                  f"traitement moyen {stats['processing_mean_ms']:.2f} ms")
+            if stats['adapted_reads']:
+                print(f"Rattrapage du backlog DAQmx: {stats['adapted_reads']} lecture(s) agrandie(s), "
+                      f"jusqu'à {stats['max_read_size']} points (backlog max {stats['max_backlog']})")
+        
+        # Attendre la fin d'un éventuel callback DAQmx en cours avant d'arrêter la tâche
+        with self._event_lock:
+            pass
         
         if self.task:
             try:
@@ -178,8 +335,10 @@ class DAQModel:
                 print(f"Erreur lors de l'arrêt de la tâche: {e}")
             finally:
                 self.task = None
+                self.reader = None
     
-    def start_recording(self, file_prefix="data", comment="", record_period=1, save_folder="data"):
+    def start_recording(self, file_prefix="data", comment="", record_period=1, save_folder="data",
+                        record_mode=None, average_enabled=None, timestamp=None):
         """
         Démarre l'enregistrement des données en temps réel
         
@@ -188,171 +347,513 @@ class DAQModel:
             comment: Commentaire à ajouter en en-tête du fichier
             record_period: Période d'enregistrement en secondes
             save_folder: Répertoire où sauvegarder les fichiers
+            record_mode: "DECIMATED" (un point par période) ou "FULL_RATE" (tous les points),
+                         défaut: Config.RECORD_MODE
+            average_enabled: Enregistrer moyenne, min, max et RMS de chaque période au lieu
+                             d'un point instantané, défaut: Config.RECORD_AVERAGE_ENABLED
+            timestamp: Horodatage du nom des fichiers (défaut: maintenant), commun aux
+                       tâches d'une session multi-tâches
         """
-        self.is_recording = True
-        self.recorded_data = []
-        self.recorded_timestamps = []
-        self.total_samples_acquired = 0  # Réinitialiser le compteur de points
-        self.recording_start_time = time.time()  # Temps de départ (pour référence)
-        self.last_save_sample_count = 0  # Dernier nombre de points lors de la sauvegarde
-        self.record_period = record_period  # Stocker la période d'enregistrement
+        if record_mode is None:
+            record_mode = self.config.RECORD_MODE
+        if average_enabled is None:
+            average_enabled = self.config.RECORD_AVERAGE_ENABLED
         
-        # Créer le fichier TXT avec le préfixe
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f'{file_prefix}_{timestamp}.txt'
-        self.current_filepath = os.path.join(save_folder, filename)
+        # Nom de base des fichiers avec le préfixe
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_path = os.path.join(save_folder, f'{file_prefix}_{timestamp}')
+        self.record_base_path = base_path
         
         # Créer le dossier s'il n'existe pas
         os.makedirs(save_folder, exist_ok=True)
         
-        # Ouvrir le fichier TXT
-        self.txt_file = open(self.current_filepath, 'w', newline='', encoding='utf-8')
-        self.txt_writer = csv.writer(self.txt_file, delimiter='\t')
+        save_format = self.config.SAVE_FORMAT
         
-        # Écrire le commentaire en première ligne (si fourni)
-        if comment:
-            self.txt_writer.writerow([f'# {comment}'])
+        full_rate_writer = None
+        summary_writer = None
+        self.full_rate_filepath = None
+        self.current_filepath = None
+        
+        # Fichier pleine cadence : tous les points acquis, écrits par blocs entiers
+        if record_mode == "FULL_RATE":
+            # Temps implicites (indice / fréquence) sauf si des blocs peuvent être abandonnés
+            record_file = create_record_file(
+                save_format, f'{base_path}_full', self.channel_names, comment,
+                sample_rate=self.sample_rate,
+                time_column=self.config.WRITER_BACKPRESSURE == "DROP",
+                txt_precision=self.config.FULL_RATE_TXT_PRECISION,
+                bin_dtype=self.config.BIN_DTYPE
+            )
+            full_rate_writer = self._create_writer(record_file)
+            self.full_rate_filepath = record_file.filepath
+            self.current_filepath = self.full_rate_filepath
         
-        # Écrire les en-têtes de colonnes: Temps + noms des canaux
-        headers = ['Temps'] + self.channel_names
-        self.txt_writer.writerow(headers)
+        # Fichier résumé : un point par période d'enregistrement
+        if record_mode != "FULL_RATE" or self.config.FULL_RATE_SUMMARY_ENABLED:
+            summary_columns = self.channel_names
+            if average_enabled:
+                # Quatre colonnes par canal, dans l'ordre des valeurs de PeriodAggregator
+                summary_columns = [f"{name}_{suffix}" for name in self.channel_names
+                                   for suffix in ("moy", "min", "max", "eff")]
+            record_file = create_record_file(
+                save_format, base_path, summary_columns, comment,
+                bin_dtype=self.config.BIN_DTYPE
+            )
+            summary_writer = self._create_writer(record_file)
+            self.current_filepath = record_file.filepath
         
-        # Forcer l'écriture sur disque
-        self.txt_file.flush()
+        # Remise à zéro des compteurs et activation en une seule étape vis-à-vis du thread
+        # d'acquisition : le premier bloc enregistré est le point 0 et fixe l'origine des temps
+        long_history = HistoryPyramid(
+            self.n_channels,
+            self.config.LONG_HISTORY_LEVEL_CAPACITY,
+            factor=self.config.LONG_HISTORY_FACTOR,
+            n_levels=self.config.LONG_HISTORY_LEVELS
+        )
+        with self._record_lock:
+            self.long_history = long_history
+            self.total_samples_acquired = 0  # Réinitialiser le compteur de points
+            self.recording_time_origin = None  # Connu au premier bloc enregistré
+            self.recording_start_time = time.time()  # Temps de départ (pour référence)
+            self.last_save_sample_count = 0  # Dernier nombre de points lors de la sauvegarde
+            self.record_period = record_period  # Stocker la période d'enregistrement
+            self.record_mode = record_mode
+            self.period_aggregator = (
+                PeriodAggregator(self.n_channels, self._period_samples()) if average_enabled else None
+            )
+            self.full_rate_writer = full_rate_writer
+            self.record_writer = summary_writer
+            self.is_recording = True
         
-        print(f"Enregistrement démarré dans: {self.current_filepath}")
-        print(f"Période d'enregistrement: {record_period} seconde(s)")
+        if self.full_rate_filepath:
+            print(f"Enregistrement pleine cadence ({self.sample_rate:g} Hz) dans: {self.full_rate_filepath}")
+        if summary_writer:
+            print(f"Enregistrement démarré dans: {self.current_filepath}")
+            print(f"Période d'enregistrement: {record_period} seconde(s)"
+                  + (" - moyenne/min/max/eff par période" if self.period_aggregator else ""))
         if comment:
             print(f"Commentaire: {comment}")
     
+    def _create_writer(self, record_file):
+        """
+        Crée et démarre le thread d'écriture d'un fichier d'enregistrement
+        
+        Args:
+            record_file: Fichier de sortie (write_block, flush, close)
+        
+        Returns:
+            RecordWriter: Thread d'écriture alimenté par une file bornée
+        """
+        writer = RecordWriter(
+            record_file,
+            queue_size=self.config.WRITER_QUEUE_SIZE,
+            policy=self.config.WRITER_BACKPRESSURE,
+            spill_folder=self.config.WRITER_SPILL_FOLDER,
+            stop_timeout=self.config.WRITER_STOP_TIMEOUT
+        )
+        writer.start()
+        return writer
+    
+    def _stop_writer(self, writer, label):
+        """
+        Vide la file d'un thread d'écriture, ferme son fichier et affiche ses compteurs
+        """
+        if not writer.stop():
+            print(f"❌ Enregistrement {label} incomplet")
+        stats = writer.get_stats()
+        print(f"Écriture {label}: {stats['blocks_written']} bloc(s), "
+              f"{stats['samples_written']} point(s), "
+              f"file max {stats['max_queue_depth']}, "
+              f"latence moyenne {stats['write_latency_mean_ms']:.2f} ms "
+              f"(max {stats['write_latency_max_ms']:.2f} ms), "
+              f"{stats['dropped_blocks']} perdu(s), {stats['spilled_blocks']} débordé(s)")
+    
     def stop_recording(self):
         """
         Arrête l'enregistrement des données
         """
         self.is_recording = False
         
-        # Fermer le fichier TXT
-        if self.txt_file:
-            self.txt_file.close()
-            self.txt_file = None
-            self.txt_writer = None
+        # Détacher les writers, puis vider leurs files et fermer les fichiers
+        with self._record_lock:
+            full_rate_writer = self.full_rate_writer
+            summary_writer = self.record_writer
+            self.full_rate_writer = None
+            self.record_writer = None
+        
+        # Attendre la fin d'un dépôt en cours dans les files (les writers ne reçoivent plus rien ensuite)
+        with self._submit_lock:
+            pass
+        
+        if full_rate_writer:
+            self._stop_writer(full_rate_writer, "pleine cadence")
+        if summary_writer:
+            self._stop_writer(summary_writer, "résumé")
+        
+        # Métriques du chemin critique à côté des fichiers de l'enregistrement
+        metrics_filepath = None
+        if self.config.METRICS_DUMP_ON_STOP and self.record_base_path:
+            metrics_filepath = f"{self.record_base_path}_metrics.json"
+            try:
+                self.dump_metrics(metrics_filepath)
+                print(f"Métriques sauvegardées dans: {metrics_filepath}")
+            except OSError as e:
+                print(f"Erreur lors de la sauvegarde des métriques: {e}")
+                metrics_filepath = None
         
         self.recording_start_time = None
         self.last_save_time = None
         
-        print(f"Enregistrement arrêté - {len(self.recorded_timestamps)} échantillons")
+        n_samples = len(self.long_history) if self.long_history else 0
+        print(f"Enregistrement arrêté - {n_samples} échantillons")
         
-        # Retourner les données enregistrées
+        # Retourner les données enregistrées (vue d'ensemble de tout l'enregistrement)
+        long_data = self.get_longue_duree_data()
         return {
-            'timestamps': self.recorded_timestamps.copy(),
-            'data': self.recorded_data.copy(),
-            'filepath': self.current_filepath
+            'n_samples': n_samples,
+            'timestamps': long_data['timestamps'],
+            'data': long_data['data'],
+            'filepath': self.current_filepath,
+            'full_rate_filepath': self.full_rate_filepath,
+            'metrics_filepath': metrics_filepath
         }
     
+    def _create_simulated_task(self, task_name):
+        """
+        Crée la tâche simulée décrite par la configuration (SIMULATION_*)
+        """
+        config = self.config
+        return SimulatedTask(
+            name=task_name,
+            n_channels=config.SIMULATION_CHANNELS,
+            sample_rate=self.sample_rate,
+            waveforms=config.SIMULATION_WAVEFORMS,
+            frequency=config.SIMULATION_FREQUENCY,
+            amplitude=config.SIMULATION_AMPLITUDE,
+            realtime=config.SIMULATION_REALTIME,
+            seed=config.SIMULATION_SEED,
+            spike_period=config.SIMULATION_SPIKE_PERIOD
+        )
+    
+    def _create_reader(self):
+        """
+        Crée le lecteur de flux multi-canaux associé à la tâche
+        
+        Returns:
+            Objet exposant read_many_sample(data, number_of_samples_per_channel, timeout)
+        """
+        if isinstance(self.task, SimulatedTask):
+            return self.task.create_reader()
+        
+        from nidaqmx.stream_readers import AnalogMultiChannelReader
+        return AnalogMultiChannelReader(self.task.in_stream)
+    
+    def _allocate_read_buffers(self):
+        """
+        Alloue les deux buffers de lecture réutilisés en alternance (double buffering)
+        
+        Le bloc passé au buffer circulaire et à l'enregistrement reste valide
+        pendant la lecture suivante, qui se fait dans l'autre buffer. Les buffers
+        sont plats et dimensionnés pour la plus grande lecture de rattrapage : un
+        bloc de n points en est une vue contiguë (canaux x n), comme l'attend DAQmx.
+        """
+        size = self.n_channels * self.max_samples_per_read
+        self._read_buffers = [np.zeros(size, dtype=np.float64), np.zeros(size, dtype=np.float64)]
+        self._read_buffer_index = 0
+    
+    def _next_read_size(self, backlog):
+        """
+        Choisit le nombre de points de la prochaine lecture d'après le backlog DAQmx
+        
+        À jour, un bloc normal (latence faible) ; en retard, tout le backlog d'un
+        coup dans la limite de max_samples_per_read, pour rattraper avant que le
+        buffer DAQmx ne déborde.
+        
+        Args:
+            backlog: Points par canal disponibles dans le buffer DAQmx
+        
+        Returns:
+            int: Nombre de points par canal à lire
+        """
+        self._max_backlog = max(self._max_backlog, backlog)
+        if backlog <= self.samples_per_read:
+            return self.samples_per_read
+        
+        n = min(backlog, self.max_samples_per_read)
+        if n > self.samples_per_read:
+            self._adapted_reads += 1
+            self._max_read_size = max(self._max_read_size, n)
+        return n
+    
+    def _read_block(self, n=None):
+        """
+        Lit un bloc de n points par canal directement dans un buffer préalloué
+        
+        Args:
+            n: Points par canal (défaut: samples_per_read, au plus max_samples_per_read)
+        
+        Returns:
+            numpy.ndarray: Bloc lu (canaux x échantillons), vue sur un buffer réutilisé
+        """
+        if n is None:
+            n = self.samples_per_read
+        flat = self._read_buffers[self._read_buffer_index]
+        self._read_buffer_index ^= 1
+        buffer = flat[:self.n_channels * n].reshape(self.n_channels, n)
+        
+        samples_read = self.reader.read_many_sample(
+            buffer,
+            number_of_samples_per_channel=n,
+            timeout=self.read_timeout
+        )
+        
+        if samples_read < buffer.shape[1]:
+            return buffer[:, :samples_read]
+        return buffer
+    
+    def _process_block(self, data):
+        """
+        Traite un bloc acquis : timestamps, fenêtre instantanée, enregistrement et callback
+        
+        Args:
+            data: Bloc de données (canaux x échantillons). Le bloc peut être un buffer
+                  réutilisé : il ne doit pas être conservé au-delà de l'appel.
+        """
+        # Nombre de nouveaux échantillons acquis
+        num_new_samples = data.shape[1]
+        if num_new_samples == 0:
+            return
+        
+        # Mettre à jour le buffer instantané (fenêtre glissante, timestamps implicites)
+        t0 = time.perf_counter_ns()
+        self.instant_buffer.write(data)
+        t1 = time.perf_counter_ns()
+        self.metrics.add("buffer", t1 - t0)
+        
+        # Compteur de points et enregistrement sous le même verrou que start_recording,
+        # qui remet le compteur à zéro pendant l'acquisition
+        full_rate_writer = None
+        summary_writer = None
+        with self._record_lock:
+            # Indice du premier point du bloc : timestamp = indice / fréquence d'échantillonnage
+            first_sample_index = self.total_samples_acquired
+            if first_sample_index == 0 and self._engine_reference_time is not None:
+                # Le premier point du bloc est le point n° _engine_samples depuis le démarrage de la tâche
+                self.recording_time_origin = (self._engine_reference_time
+                                              + self._engine_samples / self.sample_rate)
+            
+            # Incrémenter le compteur total de points
+            self.total_samples_acquired += num_new_samples
+            
+            if self.is_recording:
+                full_rate_writer = self.full_rate_writer
+                
+                # Point périodique (graphique longue durée ici, fichier résumé après le verrou)
+                if self.record_period > 0:
+                    summary = self._record_block(data, first_sample_index)
+                    if summary is not None:
+                        summary_writer = self.record_writer
+            
+            # Verrou de dépôt pris avant de rendre _record_lock : stop_recording attend ce dépôt
+            # avant d'arrêter les writers qu'il vient de détacher
+            submitting = full_rate_writer is not None or summary_writer is not None
+            if submitting:
+                self._submit_lock.acquire()
+        
+        # Dépôt dans les files d'écriture hors de _record_lock : en contre-pression BLOCK,
+        # l'attente d'une place ne bloque pas la lecture de l'historique par l'affichage
+        if submitting:
+            try:
+                # Enregistrement pleine cadence : le bloc entier, avec sa base de temps implicite
+                # (vecteur de timestamps construit par le thread d'écriture si le format le stocke)
+                if full_rate_writer is not None:
+                    full_rate_writer.submit(SampleTimes(first_sample_index, self.sample_rate), data)
+                if summary_writer is not None:
+                    summary_writer.submit(*summary)
+            finally:
+                self._submit_lock.release()
+        t2 = time.perf_counter_ns()
+        self.metrics.add("record", t2 - t1)
+        
+        # Appeler le callback si défini
+        if self.data_callback:
+            self.data_callback(data)
+            self.metrics.add("callback", time.perf_counter_ns() - t2)
+    
+    def _period_samples(self):
+        """
+        Retourne le nombre de points d'une période d'enregistrement
+        """
+        return max(int(self.record_period * self.sample_rate), 1)
+    
+    def _record_block(self, data, first_sample_index):
+        """
+        Enregistre un point par période d'enregistrement (appelé sous _record_lock)
+        
+        Le point est ajouté à l'historique longue durée ; son écriture dans le
+        fichier résumé est faite par l'appelant, après avoir rendu le verrou.
+        
+        Args:
+            data: Bloc de données (canaux x échantillons)
+            first_sample_index: Indice (depuis le début de l'enregistrement) du premier point du bloc
+        
+        Returns:
+            tuple: (timestamps, lignes) à écrire dans le fichier résumé, ou None
+        """
+        if self.period_aggregator is not None:
+            return self._record_aggregated_block(data, first_sample_index)
+        
+        # Calculer le nombre de points attendus depuis le dernier enregistrement
+        expected_samples = int(self.record_period * self.sample_rate)
+        samples_since_last_save = self.total_samples_acquired - self.last_save_sample_count
+        
+        if samples_since_last_save < expected_samples:
+            return None
+        
+        # Temps précis du point enregistré (premier point de ce batch)
+        precise_time = first_sample_index / self.sample_rate
+        
+        # Ajouter à l'historique multi-résolution (pour le graphe, mémoire bornée)
+        if self.long_history is not None:
+            self.long_history.append(precise_time, data[:, 0])
+        
+        # Mettre à jour le dernier nombre de points lors de la sauvegarde
+        self.last_save_sample_count = self.total_samples_acquired
+        
+        # Un seul point (le premier de ce batch), copié par le thread d'écriture au dépôt
+        return [precise_time], data[:, 0:1]
+    
+    def _record_aggregated_block(self, data, first_sample_index):
+        """
+        Cumule le bloc dans la période en cours et enregistre les périodes terminées
+        (moyenne, min, max et RMS de tous les points de la période, appelé sous _record_lock)
+        
+        Args:
+            data: Bloc de données (canaux x échantillons)
+            first_sample_index: Indice (depuis le début de l'enregistrement) du premier point du bloc
+        
+        Returns:
+            tuple: (timestamps, lignes) des périodes terminées pour le fichier résumé, ou None
+        """
+        completed = self.period_aggregator.add(data, first_sample_index)
+        if not completed:
+            return None
+        
+        # Chaque période est datée par son premier point
+        times = [start / self.sample_rate for start, _ in completed]
+        
+        if self.long_history is not None:
+            for precise_time, (_, values) in zip(times, completed):
+                self.long_history.append(precise_time, values[:, 0],
+                                         v_min=values[:, 1], v_max=values[:, 2])
+        
+        self.last_save_sample_count = self.total_samples_acquired
+        
+        # Colonnes : (canal 1 moy, min, max, eff, canal 2 moy, ...) x périodes
+        return times, np.stack([values.reshape(-1) for _, values in completed], axis=1)
+    
+    def _record_latency(self, n_samples, available_time, end_time):
+        """
+        Enregistre la latence d'un bloc lu
+        
+        Args:
+            n_samples: Nombre de points par canal du bloc
+            available_time: Instant (perf_counter) où le bloc lu est disponible
+            end_time: Instant (perf_counter) de fin du traitement du bloc
+        """
+        # Compteur propre au moteur (total_samples_acquired est remis à zéro par start_recording)
+        self._engine_samples += n_samples
+        
+        # Écart entre la fin de lecture et l'instant théorique d'acquisition du dernier point
+        expected_time = self._engine_reference_time + self._engine_samples / self.sample_rate
+        index = self._latency_count % len(self._latency_offsets)
+        self._latency_offsets[index] = available_time - expected_time
+        self._processing_times[index] = end_time - available_time
+        self._latency_count += 1
+    
+    def _on_every_n_samples(self, task_handle, every_n_samples_event_type, number_of_samples, callback_data):
+        """
+        Callback DAQmx du moteur événementiel : lit exactement N points par événement
+        
+        Returns:
+            int: 0 (requis par DAQmx)
+        """
+        with self._event_lock:
+            if not self.is_running:
+                return 0
+            
+            try:
+                block_start = time.perf_counter_ns()
+                self.buffer_available_samples = self.task.in_stream.avail_samp_per_chan
+                data = self._read_block()
+                available_time = time.perf_counter()
+                self.metrics.add("read", time.perf_counter_ns() - block_start)
+                
+                self._process_block(data)
+                self._record_latency(data.shape[1], available_time, time.perf_counter())
+                self.metrics.add("block", time.perf_counter_ns() - block_start)
+                
+            except Exception as e:
+                print(f"Erreur dans le callback d'acquisition: {e}")
+                self.is_running = False
+                self._stop_event_engine()
+        
+        return 0
+    
+    def _stop_event_engine(self):
+        """
+        Arrête la tâche et désenregistre le callback après une erreur du moteur événementiel
+        
+        Appelé depuis le callback (sous _event_lock) : sans cela DAQmx continuerait
+        d'acquérir et d'appeler le callback pour rien. La fermeture de la tâche
+        reste à stop_acquisition, hors du callback.
+        """
+        try:
+            self.task.stop()
+            # Le désenregistrement n'est accepté par DAQmx que tâche arrêtée
+            self.task.register_every_n_samples_acquired_into_buffer_event(self.samples_per_read, None)
+        except Exception as e:
+            print(f"Erreur lors de l'arrêt de la tâche: {e}")
+    
     def _acquisition_loop(self):
         """
         Boucle d'acquisition continue (exécutée dans un thread séparé)
         """
         try:
+            from nidaqmx.errors import DaqError
+        except ImportError:
+            DaqError = ()  # Tâche simulée sans nidaqmx installé : aucune erreur DAQmx possible
+        
+        try:
+            self._engine_reference_time = time.perf_counter()
             self.task.start()
             
             while self.is_running:
                 try:
+                    block_start = time.perf_counter_ns()
+                    
                     # Lire le nombre de points disponibles dans le buffer AVANT la lecture
                     try:
                         self.buffer_available_samples = self.task.in_stream.avail_samp_per_chan
                     except:
                         self.buffer_available_samples = 0
                     
-                    # Lire les données
-                    data = self.task.read(
-                        number_of_samples_per_channel=self.config.SAMPLES_PER_READ,
-                        timeout=self.config.TIMEOUT
-                    )
-                    
-                    # Convertir en numpy array si nécessaire
-                    if not isinstance(data, np.ndarray):
-                        data = np.array(data)
-                    
-                    # Assurer que data est 2D (nombre de canaux x nombre d'échantillons)
-                    if len(data.shape) == 1:
-                        data = data.reshape(1, -1)
-                    
-                    # Nombre de nouveaux échantillons acquis
-                    num_new_samples = data.shape[1]
-                    
-                    # Calculer les timestamps précis basés sur le compteur de points
-                    # timestamp = nombre_de_points / fréquence_échantillonnage
-                    timestamps_for_batch = []
-                    for i in range(num_new_samples):
-                        sample_time = (self.total_samples_acquired + i) / self.sample_rate
-                        timestamps_for_batch.append(sample_time)
-                    
-                    # Incrémenter le compteur total de points
-                    self.total_samples_acquired += num_new_samples
-                    
-                    # Pour compatibilité avec l'affichage, utiliser le dernier timestamp du batch
-                    timestamp = timestamps_for_batch[-1]
-                    
-                    # Mettre à jour le buffer instantané (fenêtre glissante de 10 secondes)
-                    if len(self.buffer_instantane) == 0:
-                        self.buffer_instantane = data.copy()
-                        self.buffer_instantane_timestamps = timestamps_for_batch
-                    else:
-                        self.buffer_instantane = np.concatenate(
-                            (self.buffer_instantane, data), axis=1
-                        )
-                        self.buffer_instantane_timestamps.extend(timestamps_for_batch)
-                        
-                        # Limiter à max_instantane_samples
-                        if self.buffer_instantane.shape[1] > self.max_instantane_samples:
-                            overflow = self.buffer_instantane.shape[1] - self.max_instantane_samples
-                            self.buffer_instantane = self.buffer_instantane[:, overflow:]
-                            self.buffer_instantane_timestamps = self.buffer_instantane_timestamps[overflow:]
-                    
-                    # Si enregistrement actif, vérifier si on doit sauvegarder
-                    if self.is_recording and self.txt_writer:
-                        # Calculer le nombre de points attendus depuis le dernier enregistrement
-                        expected_samples = int(self.record_period * self.sample_rate)
-                        samples_since_last_save = self.total_samples_acquired - self.last_save_sample_count
-                        
-                        if samples_since_last_save >= expected_samples:
-                            # Calculer le temps précis basé sur le nombre de points
-                            precise_time = self.total_samples_acquired / self.sample_rate
-                            
-                            # Enregistrer un seul point (le premier de ce batch)
-                            row = [precise_time] + data[:, 0].tolist()
-                            self.txt_writer.writerow(row)
-                            
-                            # Flush pour écrire immédiatement
-                            self.txt_file.flush()
-                            
-                            # Ajouter aux buffers de données enregistrées (pour le graphe)
-                            if len(self.recorded_data) == 0:
-                                self.recorded_data = data[:, 0:1].copy()  # Premier point seulement
-                            else:
-                                self.recorded_data = np.concatenate(
-                                    (self.recorded_data, data[:, 0:1]), axis=1
-                                )
-                            self.recorded_timestamps.append(precise_time)
-                            
-                            # Limiter à max_longue_duree_samples pour éviter saturation mémoire
-                            if self.recorded_data.shape[1] > self.max_longue_duree_samples:
-                                overflow = self.recorded_data.shape[1] - self.max_longue_duree_samples
-                                self.recorded_data = self.recorded_data[:, overflow:]
-                                self.recorded_timestamps = self.recorded_timestamps[overflow:]
-                            
-                            # Mettre à jour le dernier nombre de points lors de la sauvegarde
-                            self.last_save_sample_count = self.total_samples_acquired
+                    # Lire les données (lecture bloquante : cadence donnée par l'horloge DAQmx),
+                    # en un bloc plus grand si le backlog DAQmx s'accumule
+                    read_size = self.samples_per_read
+                    if self.max_samples_per_read > self.samples_per_read:
+                        read_size = self._next_read_size(self.buffer_available_samples)
+                    read_start = time.perf_counter_ns()
+                    data = self._read_block(read_size)
+                    available_time = time.perf_counter()
+                    self.metrics.add("read", time.perf_counter_ns() - read_start)
                     
-                    # Appeler le callback si défini
-                    if self.data_callback:
-                        self.data_callback(data)
+                    self._process_block(data)
+                    self._record_latency(data.shape[1], available_time, time.perf_counter())
+                    self.metrics.add("block", time.perf_counter_ns() - block_start)
                     
-                    # Petite pause pour éviter la surcharge CPU
-                    time.sleep(0.01)
-                    
-                except nidaqmx.errors.DaqError as e:
+                except DaqError as e:
                     print(f"Erreur DAQ: {e}")
                     break
                     
@@ -364,22 +865,93 @@ class DAQModel:
     def get_instantane_data(self):
         """
         Retourne les données instantanées (fenêtre glissante de 10 secondes)
+        
+        Returns:
+            numpy.ndarray: Vue ordonnée (canaux x échantillons) sur le buffer circulaire
         """
-        return self.buffer_instantane
+        if self.instant_buffer is None:
+            return []
+        return self.instant_buffer.get_data()
     
     def get_instantane_timestamps(self):
         """
         Retourne les timestamps des données instantanées
+        
+        Les timestamps (secondes depuis le début de l'acquisition) sont calculés à la demande.
+        
+        Returns:
+            numpy.ndarray: Timestamps float64 de la fenêtre instantanée
+        """
+        if self.instant_buffer is None:
+            return []
+        return self.instant_buffer.get_timestamps()
+    
+    def get_instantane_snapshot(self, last_version=None):
+        """
+        Retourne une image cohérente de la fenêtre instantanée
+        
+        La copie est faite sous seqlock (le thread d'acquisition n'est jamais
+        bloqué) et n'a lieu que si de nouvelles données sont arrivées : si la
+        version n'a pas changé depuis last_version, rien n'est copié.
+        
+        Args:
+            last_version: Version de la dernière image obtenue par l'appelant
+        
+        Returns:
+            tuple: (timestamps, data, version) avec autant de timestamps que de points,
+                   ou (None, None, version) si la version n'a pas changé ou s'il n'y a pas de buffer
+        """
+        buffer = self.instant_buffer
+        if buffer is None:
+            return None, None, None
+        
+        if last_version is not None and buffer.version == last_version:
+            return None, None, last_version
+        
+        start_index, data, version = buffer.snapshot()
+        timestamps = np.arange(start_index, start_index + data.shape[1], dtype=np.float64) / buffer.sample_rate
+        return timestamps, data, version
+    
+    def get_longue_duree_version(self):
+        """
+        Retourne la version de l'historique longue durée (nombre de points enregistrés)
+        
+        Permet de savoir sans copie si de nouveaux points sont arrivés.
         """
-        return self.buffer_instantane_timestamps
+        if self.long_history is None:
+            return None
+        return len(self.long_history)
     
-    def get_longue_duree_data(self):
+    def get_longue_duree_data(self, t0=None, t1=None, max_points=None):
         """
         Retourne les données enregistrées avec timestamps
+        
+        Les données proviennent du niveau de l'historique adapté à la fenêtre
+        demandée : points bruts si elle en contient peu, enveloppe min/max sinon.
+        
+        Args:
+            t0: Début de la fenêtre en secondes (défaut: début de l'enregistrement)
+            t1: Fin de la fenêtre en secondes (défaut: dernier point)
+            max_points: Nombre maximum d'entrées (défaut: Config.MAX_LONGUE_DUREE_SAMPLES)
+        
+        Returns:
+            dict: {'timestamps': numpy.ndarray, 'data': numpy.ndarray (canaux x points),
+                   'version': nombre de points de l'historique}
         """
+        if self.long_history is None:
+            return {'timestamps': [], 'data': [], 'version': None}
+        
+        if max_points is None:
+            max_points = self.config.MAX_LONGUE_DUREE_SAMPLES
+        
+        # L'historique est modifié par le thread d'acquisition
+        with self._record_lock:
+            timestamps, data = self.long_history.get_envelope(t0, t1, max_points)
+            version = len(self.long_history)
         return {
-            'timestamps': self.recorded_timestamps,
-            'data': self.recorded_data
+            'timestamps': timestamps,
+            'data': data,
+            'version': version
         }
     
     def get_channel_names(self):
@@ -406,6 +978,90 @@ class DAQModel:
         """
         return self.buffer_available_samples
     
+    def get_writer_stats(self):
+        """
+        Retourne les compteurs du thread d'écriture de l'enregistrement en cours
+        (fichier pleine cadence s'il existe, sinon fichier résumé)
+        
+        Returns:
+            dict: Profondeur de file, latences d'écriture, pertes/débordements (None si pas d'enregistrement)
+        """
+        writer = self.full_rate_writer or self.record_writer
+        if writer is None:
+            return None
+        return writer.get_stats()
+    
+    def get_engine_stats(self):
+        """
+        Retourne les statistiques de latence du moteur d'acquisition
+        
+        La latence d'un bloc est l'écart entre la fin de sa lecture et l'instant
+        théorique d'acquisition de son dernier point. Le délai de démarrage de la
+        tâche étant inconnu, l'écart minimal observé sert de référence (latence nulle).
+        
+        Returns:
+            dict: Moteur, nombre de lectures et de points lus par canal, latences/temps
+                  de traitement en ms, et lectures agrandies pour rattraper le backlog
+                  (nombre, plus grande lecture et plus grand backlog, en points par canal)
+        """
+        count = min(self._latency_count, len(self._latency_offsets))
+        stats = {
+            'engine': self.acquisition_engine,
+            'events': self._latency_count,
+            'samples': self._engine_samples,
+            'adapted_reads': self._adapted_reads,
+            'max_read_size': self._max_read_size,
+            'max_backlog': self._max_backlog,
+            'latency_mean_ms': 0.0,
+            'latency_p99_ms': 0.0,
+            'latency_max_ms': 0.0,
+            'processing_mean_ms': 0.0
+        }
+        if count == 0:
+            return stats
+        
+        latencies = (self._latency_offsets[:count] - self._latency_offsets[:count].min()) * 1000.0
+        stats['latency_mean_ms'] = float(latencies.mean())
+        stats['latency_p99_ms'] = float(np.percentile(latencies, 99))
+        stats['latency_max_ms'] = float(latencies.max())
+        stats['processing_mean_ms'] = float(self._processing_times[:count].mean() * 1000.0)
+        return stats
+    
+    def get_metrics(self):
+        """
+        Retourne les durées des étapes du chemin critique et l'état du stockage
+        
+        En scrutation, la lecture inclut l'attente des points (lecture bloquante) :
+        une lecture courte et un buffer DAQmx qui se remplit signalent un retard.
+        
+        Returns:
+            dict: 'stages' (par étape : count, mean_ms, p50_ms, p99_ms, max_ms, last_ms),
+                  'buffer_available', 'engine' et 'writer'
+        """
+        return {
+            'stages': self.metrics.snapshot(),
+            'buffer_available': self.buffer_available_samples,
+            'engine': self.get_engine_stats(),
+            'writer': self.get_writer_stats(),
+        }
+    
+    def dump_metrics(self, filepath):
+        """
+        Écrit les métriques et les histogrammes complets dans un fichier JSON
+        
+        Args:
+            filepath: Chemin du fichier
+        """
+        info = self.get_metrics()
+        self.metrics.dump(filepath, extra={
+            'sample_rate': self.sample_rate,
+            'channels': self.n_channels,
+            'samples_per_read': self.samples_per_read,
+            'total_samples': self.total_samples_acquired,
+            'engine': info['engine'],
+            'writer': info['writer'],
+        })
+    
     def get_elapsed_time(self):
         """
         Retourne le temps écoulé depuis le début de l'acquisition au format "HH:MM:SS"
@@ -431,6 +1087,9 @@ class DAQModel:
             period: Nouvelle période d'enregistrement en secondes
         """
         self.record_period = period
+        if self.period_aggregator is not None and period > 0:
+            # Prise en compte dès la période en cours
+            self.period_aggregator.period_samples = self._period_samples()
         print(f"Période d'enregistrement mise à jour: {period} seconde(s)")
     
     def list_available_devices(self):
@@ -438,7 +1097,8 @@ class DAQModel:
         Liste les périphériques DAQ disponibles
         """
         try:
-            system = nidaqmx.system.System.local()
+            from nidaqmx.system import System
+            system = System.local()
             devices = system.devices
             return [device.name for device in devices]
         except Exception as e:
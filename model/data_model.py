@@ -6,6 +6,9 @@ from datetime import datetime
 import csv
 import os
 
+from model.recording_reader import BinaryRecordingReader
+from model.running_stats import RunningStatistics
+
 
 class DataModel:
     """
@@ -23,6 +26,10 @@ class DataModel:
         self.recording_start_time = None
         self.current_file_path = None
         
+        # Statistiques glissantes (créées au premier bloc, quand le nombre de canaux est connu)
+        self.running_stats = None
+        self.stats_window_samples = None
+        
     def save_to_csv(self, data, filename=None):
         """
         Sauvegarde les données dans un fichier CSV
@@ -80,6 +87,28 @@ class DataModel:
             print(f"Erreur lors de la sauvegarde: {e}")
             return None
     
+    def open_recording(self, filepath):
+        """
+        Ouvre un enregistrement binaire (.bin + .json) sans le charger en mémoire
+        
+        Le fichier est projeté en mémoire : reader.read(t0, t1, channels) retourne
+        directement la fenêtre demandée. Un enregistrement en cours peut être ouvert.
+        
+        Args:
+            filepath: Chemin du fichier .bin ou de son en-tête .json
+        
+        Returns:
+            BinaryRecordingReader: Lecteur de l'enregistrement, ou None en cas d'erreur
+        """
+        try:
+            reader = BinaryRecordingReader(filepath)
+            print(f"Enregistrement ouvert: {reader.filepath} "
+                  f"({reader.n_samples} échantillons, {len(reader.channel_names)} canaux)")
+            return reader
+        except Exception as e:
+            print(f"Erreur lors de l'ouverture de l'enregistrement: {e}")
+            return None
+    
     def get_statistics(self, data, channel_index=0):
         """
         Calcule les statistiques sur un canal de données
@@ -136,6 +165,54 @@ class DataModel:
                 'rms': 0.0
             }
     
+    def reset_running_statistics(self, window_samples=None):
+        """
+        Remet à zéro les statistiques glissantes (début d'acquisition)
+        
+        Args:
+            window_samples: Taille de la fenêtre glissante en points (None: tout l'enregistrement seulement)
+        """
+        self.stats_window_samples = window_samples
+        self.running_stats = None
+    
+    def update_running_statistics(self, data):
+        """
+        Intègre un bloc acquis dans les statistiques glissantes
+        
+        Appelé depuis le thread d'acquisition : le coût dépend de la taille du
+        bloc, pas de la durée de l'enregistrement.
+        
+        Args:
+            data: Bloc de données (canaux x échantillons)
+        """
+        stats = self.running_stats
+        if stats is None or stats.n_channels != data.shape[0]:
+            stats = RunningStatistics(data.shape[0], self.stats_window_samples)
+            self.running_stats = stats
+        stats.update(data)
+    
+    def get_running_statistics(self, channel_index=0, window=False):
+        """
+        Retourne les statistiques glissantes d'un canal (lecture sans parcours des données)
+        
+        Args:
+            channel_index: Index du canal
+            window: True pour la fenêtre glissante, False pour tout l'enregistrement
+        
+        Returns:
+            dict: Dictionnaire avec les statistiques (mêmes clés que get_statistics)
+        """
+        stats = self.running_stats
+        if stats is None:
+            return {'mean': 0.0, 'std': 0.0, 'min': 0.0, 'max': 0.0, 'rms': 0.0}
+        
+        if channel_index >= stats.n_channels:
+            channel_index = 0
+        
+        values = stats.get_statistics(window=window)
+        return {key: float(values[key][channel_index])
+                for key in ('mean', 'std', 'min', 'max', 'rms')}
+    
     def decimate_data(self, data, factor=10):
         """
         Décime les données pour l'affichage (réduit le nombre de points)
@@ -164,3 +241,80 @@ class DataModel:
         except Exception as e:
             print(f"Erreur lors de la décimation: {e}")
             return data
+    
+    def decimate_minmax(self, timestamps, data, n_buckets):
+        """
+        Décime les données par enveloppe min/max pour l'affichage
+        
+        Les échantillons sont regroupés en n_buckets paquets consécutifs (un par
+        pixel de largeur du graphique) ; chaque paquet est réduit à son minimum
+        et son maximum, dans leur ordre d'apparition. Le résultat compte au plus
+        2 x n_buckets points par canal et conserve tous les pics, contrairement
+        à un simple pas de décimation. Le calcul est vectorisé (reshape + réduction).
+        
+        Args:
+            timestamps: Timestamps des échantillons (tableau 1D)
+            data: Données (canaux x échantillons)
+            n_buckets: Nombre de paquets (typiquement la largeur du graphique en pixels)
+        
+        Returns:
+            tuple: (timestamps, data) décimés ; les entrées sont retournées
+                   telles quelles si elles comptent déjà moins de 2 x n_buckets points
+        """
+        data = np.asarray(data)
+        if data.ndim == 1:
+            data = data.reshape(1, -1)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        
+        n_samples = data.shape[1]
+        n_buckets = max(int(n_buckets), 1)
+        if n_samples <= 2 * n_buckets or len(timestamps) < n_samples:
+            return timestamps, data
+        
+        timestamps = timestamps[-n_samples:]
+        bucket_size = -(-n_samples // n_buckets)  # Arrondi supérieur
+        n_full = n_samples // bucket_size
+        
+        t_parts = []
+        d_parts = []
+        
+        # Paquets complets : une seule réduction sur une vue (canaux x paquets x taille)
+        full = n_full * bucket_size
+        if n_full:
+            t_full, d_full = self._minmax_buckets(timestamps[:full], data[:, :full], bucket_size)
+            t_parts.append(t_full)
+            d_parts.append(d_full)
+        
+        # Paquet final incomplet
+        if full < n_samples:
+            t_rest, d_rest = self._minmax_buckets(timestamps[full:], data[:, full:], n_samples - full)
+            t_parts.append(t_rest)
+            d_parts.append(d_rest)
+        
+        return np.concatenate(t_parts), np.concatenate(d_parts, axis=1)
+    
+    def _minmax_buckets(self, timestamps, data, bucket_size):
+        """
+        Réduit des paquets de taille identique à deux points (min et max)
+        
+        Les deux points d'un paquet partagent l'axe temporel (début et fin du
+        paquet) ; leur ordre suit, canal par canal, l'ordre d'apparition du
+        minimum et du maximum pour que le tracé reste fidèle au signal.
+        """
+        n_channels = data.shape[0]
+        buckets = data.reshape(n_channels, -1, bucket_size)
+        
+        arg_min = buckets.argmin(axis=2)
+        arg_max = buckets.argmax(axis=2)
+        values_min = np.take_along_axis(buckets, arg_min[:, :, np.newaxis], axis=2)[:, :, 0]
+        values_max = np.take_along_axis(buckets, arg_max[:, :, np.newaxis], axis=2)[:, :, 0]
+        
+        min_first = arg_min <= arg_max
+        result = np.empty((n_channels, buckets.shape[1], 2), dtype=data.dtype)
+        result[:, :, 0] = np.where(min_first, values_min, values_max)
+        result[:, :, 1] = np.where(min_first, values_max, values_min)
+        
+        bucket_times = timestamps.reshape(-1, bucket_size)
+        times = np.stack((bucket_times[:, 0], bucket_times[:, -1]), axis=1)
+        
+        return times.reshape(-1), result.reshape(n_channels, -1)
@@ -0,0 +1,240 @@
+"""
+Historique multi-résolution - Résumés min/max/moyenne de toute la durée d'un enregistrement
+"""
+import numpy as np
+
+from model.ring_buffer import RingBuffer
+
+
+class HistoryPyramid:
+    """
+    Historique longue durée en pyramide de niveaux de résolution
+
+    Le niveau 0 contient les points bruts ; chaque niveau k > 0 résume le
+    niveau k-1 par paquets de `factor` entrées (temps de début, min, max,
+    moyenne par canal). Chaque niveau est un buffer circulaire de capacité
+    fixe : la mémoire est bornée, les niveaux fins ne conservent que la fin
+    de l'enregistrement et les niveaux grossiers couvrent tout le reste.
+
+    Un ajout coûte O(1) amorti : une écriture au niveau 0, et une au niveau k
+    toutes les factor^k entrées seulement.
+
+    Disposition d'une entrée : [temps, min (canaux), max (canaux), moyenne (canaux)].
+    """
+
+    def __init__(self, n_channels, level_capacity, factor=10, n_levels=7):
+        """
+        Initialise l'historique
+
+        Args:
+            n_channels: Nombre de canaux
+            level_capacity: Nombre d'entrées conservées par niveau
+            factor: Nombre d'entrées d'un niveau résumées par une entrée du niveau suivant
+            n_levels: Nombre de niveaux (le dernier couvre level_capacity x factor^(n_levels-1) points)
+        """
+        if factor < 2:
+            raise ValueError("Le facteur entre niveaux doit être au moins 2")
+
+        self.n_channels = n_channels
+        self.factor = int(factor)
+        self.n_levels = int(n_levels)
+
+        self.levels = [RingBuffer(1 + 3 * n_channels, level_capacity, sample_rate=1.0)
+                       for _ in range(self.n_levels)]
+
+        # Paquet en cours de chaque niveau (l'indice 0 n'est pas utilisé)
+        self._acc_count = np.zeros(self.n_levels, dtype=np.int64)
+        self._acc_time = np.zeros(self.n_levels)
+        self._acc_min = np.zeros((self.n_levels, n_channels))
+        self._acc_max = np.zeros((self.n_levels, n_channels))
+        self._acc_sum = np.zeros((self.n_levels, n_channels))
+
+        self._entry = np.zeros((1 + 3 * n_channels, 1))
+        self.n_samples = 0
+        self.first_time = None
+        self.last_time = None
+
+    def __len__(self):
+        return self.n_samples
+
+    def append(self, timestamp, values, v_min=None, v_max=None):
+        """
+        Ajoute un point à l'historique
+
+        Args:
+            timestamp: Temps du point (secondes)
+            values: Valeurs des canaux (n_channels valeurs), moyennes si le point résume une période
+            v_min: Minimums des canaux sur la période (défaut: values)
+            v_max: Maximums des canaux sur la période (défaut: values)
+        """
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if self.first_time is None:
+            self.first_time = timestamp
+        self.last_time = timestamp
+        self.n_samples += 1
+        self._push(0, timestamp,
+                   values if v_min is None else v_min,
+                   values if v_max is None else v_max,
+                   values)
+
+    def _push(self, level, timestamp, v_min, v_max, v_mean):
+        """
+        Écrit une entrée dans un niveau et la cumule dans le paquet du niveau suivant
+        """
+        n = self.n_channels
+        entry = self._entry[:, 0]
+        entry[0] = timestamp
+        entry[1:1 + n] = v_min
+        entry[1 + n:1 + 2 * n] = v_max
+        entry[1 + 2 * n:] = v_mean
+        self.levels[level].write(self._entry)
+
+        parent = level + 1
+        if parent >= self.n_levels:
+            return
+
+        if self._acc_count[parent] == 0:
+            self._acc_time[parent] = timestamp
+            self._acc_min[parent] = v_min
+            self._acc_max[parent] = v_max
+            self._acc_sum[parent] = v_mean
+        else:
+            np.minimum(self._acc_min[parent], v_min, out=self._acc_min[parent])
+            np.maximum(self._acc_max[parent], v_max, out=self._acc_max[parent])
+            self._acc_sum[parent] += v_mean
+        self._acc_count[parent] += 1
+
+        if self._acc_count[parent] == self.factor:
+            self._acc_count[parent] = 0
+            # Les entrées résumées sont toutes complètes : la moyenne des moyennes est exacte
+            self._push(parent, self._acc_time[parent], self._acc_min[parent],
+                       self._acc_max[parent], self._acc_sum[parent] / self.factor)
+
+    def _level_arrays(self, level):
+        """
+        Retourne (temps, min, max, moyenne) d'un niveau, sous forme de vues
+        """
+        n = self.n_channels
+        entries = self.levels[level].get_data()
+        return (entries[0], entries[1:1 + n], entries[1 + n:1 + 2 * n], entries[1 + 2 * n:])
+
+    def _partial_entry(self, level):
+        """
+        Résume les points pas encore agrégés au niveau donné (paquets en cours des niveaux 1..level)
+
+        Returns:
+            tuple: (temps, min, max, moyenne) ou None si aucun point en attente
+        """
+        timestamp = None
+        v_min = np.full(self.n_channels, np.inf)
+        v_max = np.full(self.n_channels, -np.inf)
+        v_sum = np.zeros(self.n_channels)
+        weight = 0
+
+        for k in range(1, level + 1):
+            count = self._acc_count[k]
+            if count == 0:
+                continue
+            # Une entrée du niveau k-1 résume factor^(k-1) points
+            samples = self.factor ** (k - 1)
+            np.minimum(v_min, self._acc_min[k], out=v_min)
+            np.maximum(v_max, self._acc_max[k], out=v_max)
+            v_sum += self._acc_sum[k] * samples
+            weight += count * samples
+            timestamp = self._acc_time[k]  # Le paquet du niveau le plus grossier commence le plus tôt
+
+        if weight == 0:
+            return None
+        return timestamp, v_min, v_max, v_sum / weight
+
+    def select_level(self, t0=None, t1=None, max_points=1000):
+        """
+        Choisit le niveau le plus fin qui couvre [t0, t1] en au plus max_points entrées
+
+        Returns:
+            int: Indice du niveau
+        """
+        if t0 is None:
+            t0 = self.first_time
+        if t1 is None:
+            t1 = self.last_time
+
+        for level in range(self.n_levels):
+            buffer = self.levels[level]
+            if len(buffer) == 0:
+                continue
+            timestamps = self._level_arrays(level)[0]
+            # Un niveau qui a perdu ses plus anciennes entrées ne couvre plus le début de la fenêtre
+            if buffer.get_start_index() > 0 and timestamps[0] > t0:
+                continue
+            i0 = np.searchsorted(timestamps, t0, side='right') - 1
+            i1 = np.searchsorted(timestamps, t1, side='right')
+            if i1 - max(i0, 0) + 1 <= max_points:
+                return level
+
+        return self.n_levels - 1
+
+    def get_range(self, t0=None, t1=None, max_points=1000):
+        """
+        Retourne les résumés couvrant [t0, t1] au niveau adapté
+
+        Args:
+            t0: Début de la fenêtre (défaut: début de l'enregistrement)
+            t1: Fin de la fenêtre (défaut: dernier point)
+            max_points: Nombre maximum d'entrées retournées
+
+        Returns:
+            tuple: (level, timestamps, min, max, mean), les données étant de forme
+                   (canaux x entrées) ; copies indépendantes de l'historique
+        """
+        empty = np.zeros((self.n_channels, 0))
+        if self.n_samples == 0:
+            return 0, np.zeros(0), empty, empty, empty
+
+        if t0 is None:
+            t0 = self.first_time
+        if t1 is None:
+            t1 = self.last_time
+
+        level = self.select_level(t0, t1, max_points)
+        timestamps, v_min, v_max, v_mean = self._level_arrays(level)
+
+        # Inclure le paquet contenant t0 (il commence avant t0)
+        i0 = max(np.searchsorted(timestamps, t0, side='right') - 1, 0)
+        i1 = np.searchsorted(timestamps, t1, side='right')
+        i0 = max(i0, i1 - max_points)
+
+        parts = [timestamps[i0:i1], v_min[:, i0:i1], v_max[:, i0:i1], v_mean[:, i0:i1]]
+
+        # Points récents pas encore résumés à ce niveau
+        partial = self._partial_entry(level)
+        if partial is not None and partial[0] <= t1:
+            parts = [np.append(parts[0], partial[0])] + [
+                np.concatenate((part, values.reshape(-1, 1)), axis=1)
+                for part, values in zip(parts[1:], partial[1:])
+            ]
+        else:
+            parts = [part.copy() for part in parts]
+
+        return (level, *parts)
+
+    def get_envelope(self, t0=None, t1=None, max_points=1000):
+        """
+        Retourne les données à tracer sur [t0, t1]
+
+        Au niveau 0 les points bruts sont retournés ; aux niveaux résumés (ou si
+        les points sont des agrégats de période) chaque entrée donne deux points
+        (min puis max) au même instant, de sorte que le tracé montre
+        l'enveloppe complète du signal.
+
+        Returns:
+            tuple: (timestamps, data) avec data de forme (canaux x points)
+        """
+        level, timestamps, v_min, v_max, v_mean = self.get_range(t0, t1, max_points)
+        if level == 0 and np.array_equal(v_min, v_max):
+            return timestamps, v_mean
+
+        data = np.empty((self.n_channels, 2 * len(timestamps)))
+        data[:, 0::2] = v_min
+        data[:, 1::2] = v_max
+        return np.repeat(timestamps, 2), data
@@ -0,0 +1,252 @@
+"""
+Session multi-tâches - Acquisition simultanée de plusieurs tâches NI MAX (une par carte)
+"""
+import json
+import os
+import time
+from datetime import datetime
+
+from model.daq_model import DAQModel
+
+
+class MultiTaskSession:
+    """
+    Acquisition concurrente de plusieurs tâches DAQmx réunies en une session d'enregistrement
+
+    Chaque tâche est pilotée par son propre DAQModel : thread de lecture,
+    buffer circulaire, historique et threads d'écriture indépendants. Une
+    carte lente ou en retard ne bloque donc pas les autres.
+
+    L'enregistrement produit les fichiers de chaque tâche (même préfixe et
+    même horodatage, suffixés par le nom de la tâche) et un manifeste JSON
+    <préfixe>_<horodatage>_session.json qui les relie. Le manifeste donne pour
+    chaque tâche le décalage de son premier point sur une base de temps
+    commune : temps commun = temps du fichier + time_offset_s. Avec une seule
+    tâche, les fichiers sont ceux de DAQModel, sans suffixe ni manifeste.
+
+    L'alignement est logiciel (instant estimé du premier point de chaque
+    tâche, à un bloc près) : les horloges des cartes restent indépendantes.
+    Pour un alignement à l'échantillon près, les tâches doivent partager
+    horloge et déclenchement dans NI MAX.
+
+    La session est utilisée par le mode sans interface (headless_logger.py) ;
+    l'interface graphique pilote un seul DAQModel.
+    """
+
+    def __init__(self, config, task_names, data_callback=None):
+        """
+        Initialise la session (acquisition non démarrée)
+
+        Args:
+            config: Objet de configuration (partagé par toutes les tâches)
+            task_names: Noms des tâches NI MAX (Config.SIMULATION_TASK_NAME pour une tâche simulée)
+            data_callback: Fonction appelée avec (nom de la tâche, bloc) pour chaque bloc acquis
+        """
+        if not task_names:
+            raise ValueError("Aucune tâche indiquée")
+
+        self.config = config
+        self.data_callback = data_callback
+        self.manifest_filepath = None
+        self._manifest = None
+
+        # Libellés uniques (une même tâche simulée peut être utilisée plusieurs fois)
+        self.task_names = {}
+        for task_name in task_names:
+            label = task_name
+            suffix = 2
+            while label in self.task_names:
+                label = f"{task_name}_{suffix}"
+                suffix += 1
+            self.task_names[label] = task_name
+
+        self.models = {label: DAQModel(config) for label in self.task_names}
+
+        # Dernière mesure de débit par tâche : (instant, points lus)
+        self._throughput_marks = {}
+
+    @property
+    def is_running(self):
+        return any(model.is_running for model in self.models.values())
+
+    @property
+    def is_recording(self):
+        return any(model.is_recording for model in self.models.values())
+
+    def _make_callback(self, label):
+        """
+        Crée le callback d'une tâche, qui transmet son nom au callback de la session
+        """
+        if self.data_callback is None:
+            return None
+
+        def callback(data):
+            self.data_callback(label, data)
+        return callback
+
+    def start_acquisition(self):
+        """
+        Démarre l'acquisition de toutes les tâches
+
+        Returns:
+            bool: True si toutes les tâches ont démarré (sinon aucune ne reste active)
+        """
+        for label, model in self.models.items():
+            if not model.start_acquisition(data_callback=self._make_callback(label),
+                                           task_name=self.task_names[label]):
+                print(f"❌ Impossible de démarrer la tâche '{label}'")
+                self.stop_acquisition()
+                return False
+
+        self._throughput_marks = {}
+        print(f"✓ {len(self.models)} tâche(s) en acquisition simultanée")
+        return True
+
+    def stop_acquisition(self):
+        """Arrête l'acquisition de toutes les tâches"""
+        for model in self.models.values():
+            if model.is_running or model.task is not None:
+                model.stop_acquisition()
+
+    def start_recording(self, file_prefix="data", comment="", record_period=1, save_folder="data",
+                        record_mode=None, average_enabled=None):
+        """
+        Démarre l'enregistrement de toutes les tâches et écrit le manifeste de la session
+
+        Args:
+            Mêmes paramètres que DAQModel.start_recording
+
+        Returns:
+            str: Chemin du manifeste de la session (None pour une seule tâche)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(save_folder, exist_ok=True)
+        multiple = len(self.models) > 1
+
+        for label, model in self.models.items():
+            model.start_recording(
+                file_prefix=f"{file_prefix}_{label}" if multiple else file_prefix,
+                comment=comment,
+                record_period=record_period,
+                save_folder=save_folder,
+                record_mode=record_mode,
+                average_enabled=average_enabled,
+                timestamp=timestamp
+            )
+
+        if not multiple:
+            return None
+
+        self.manifest_filepath = os.path.join(save_folder, f"{file_prefix}_{timestamp}_session.json")
+        self._manifest = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'comment': comment,
+            'record_period': record_period,
+            'record_mode': record_mode or self.config.RECORD_MODE,
+            'save_format': self.config.SAVE_FORMAT,
+            'time_base': "secondes depuis le plus ancien premier point enregistré (toutes tâches)",
+            'alignment': "logicielle (à un bloc près, horloges des cartes indépendantes)",
+            'tasks': [
+                {
+                    'label': label,
+                    'task_name': self.task_names[label],
+                    'channels': list(model.get_channel_names()),
+                    'sample_rate': model.sample_rate,
+                    'summary_file': os.path.basename(model.current_filepath) if model.current_filepath else None,
+                    'full_rate_file': (os.path.basename(model.full_rate_filepath)
+                                       if model.full_rate_filepath else None),
+                    'time_offset_s': None,
+                }
+                for label, model in self.models.items()
+            ],
+        }
+        self._write_manifest()
+        print(f"Session multi-tâches: {self.manifest_filepath}")
+        return self.manifest_filepath
+
+    def get_time_offsets(self):
+        """
+        Retourne le décalage du premier point enregistré de chaque tâche sur la base de temps commune
+
+        Returns:
+            dict: Décalage en secondes par tâche (None tant qu'aucun bloc n'est enregistré)
+        """
+        origins = {label: model.recording_time_origin for label, model in self.models.items()}
+        known = [origin for origin in origins.values() if origin is not None]
+        if not known:
+            return {label: None for label in origins}
+        reference = min(known)
+        return {label: (origin - reference if origin is not None else None)
+                for label, origin in origins.items()}
+
+    def _write_manifest(self, extra=None):
+        """
+        (Ré)écrit le manifeste de la session avec les décalages connus
+        """
+        offsets = self.get_time_offsets()
+        for entry in self._manifest['tasks']:
+            entry['time_offset_s'] = offsets[entry['label']]
+            if extra and entry['label'] in extra:
+                entry.update(extra[entry['label']])
+
+        with open(self.manifest_filepath, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest, f, indent=2, ensure_ascii=False)
+
+    def stop_recording(self):
+        """
+        Arrête l'enregistrement de toutes les tâches et complète le manifeste
+
+        Returns:
+            dict: Résultat de DAQModel.stop_recording par tâche, et 'manifest'
+        """
+        results = {}
+        for label, model in self.models.items():
+            if model.is_recording:
+                results[label] = model.stop_recording()
+
+        if self._manifest is not None:
+            self._write_manifest(extra={
+                label: {'periodic_samples': result['n_samples'],
+                        'samples_per_channel': self.models[label].total_samples_acquired}
+                for label, result in results.items()
+            })
+        results['manifest'] = self.manifest_filepath
+        return results
+
+    def get_task_stats(self):
+        """
+        Retourne le débit et le backlog de chaque tâche
+
+        Le débit est mesuré entre deux appels (points par seconde, tous canaux).
+
+        Returns:
+            list: Un dict par tâche : 'label', 'channels', 'sample_rate', 'samples' (points par
+                  canal lus), 'throughput' (points/s), 'backlog' (points par canal en attente
+                  dans le buffer DAQmx), 'backlog_s', 'adapted_reads' et 'writer' (compteurs
+                  d'écriture ou None)
+        """
+        now = time.perf_counter()
+        stats = []
+        for label, model in self.models.items():
+            engine = model.get_engine_stats()
+            samples = engine['samples']
+
+            throughput = 0.0
+            mark = self._throughput_marks.get(label)
+            if mark is not None and now > mark[0]:
+                throughput = (samples - mark[1]) * model.n_channels / (now - mark[0])
+            self._throughput_marks[label] = (now, samples)
+
+            backlog = model.get_buffer_available_samples()
+            stats.append({
+                'label': label,
+                'channels': model.n_channels,
+                'sample_rate': model.sample_rate,
+                'samples': samples,
+                'throughput': throughput,
+                'backlog': backlog,
+                'backlog_s': backlog / model.sample_rate if model.sample_rate else 0.0,
+                'adapted_reads': engine['adapted_reads'],
+                'writer': model.get_writer_stats(),
+            })
+        return stats
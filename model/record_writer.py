@@ -0,0 +1,665 @@
+"""
+Écriture des enregistrements - Fichiers de sortie et thread d'écriture découplé
+"""
+import csv
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+
+
+class SampleTimes(namedtuple('SampleTimes', ['first_sample_index', 'sample_rate'])):
+    """
+    Base de temps implicite d'un bloc acquis à cadence régulière
+
+    Le temps du i-ème point du bloc vaut (first_sample_index + i) / sample_rate.
+    Elle remplace le vecteur de timestamps dans write_block et RecordWriter.submit :
+    le vecteur n'est construit que par les fichiers qui stockent le temps.
+    """
+
+    __slots__ = ()
+
+    @property
+    def start_time(self):
+        """Temps du premier point du bloc"""
+        return self.first_sample_index / self.sample_rate
+
+    def timestamps(self, n):
+        """
+        Construit le vecteur des temps des n points du bloc
+
+        Returns:
+            np.ndarray: Timestamps (float64)
+        """
+        return np.arange(self.first_sample_index, self.first_sample_index + n,
+                         dtype=np.float64) / self.sample_rate
+
+
+def block_timestamps(timestamps, n):
+    """
+    Retourne le vecteur des temps d'un bloc de n points
+
+    Args:
+        timestamps: Vecteur de timestamps ou SampleTimes
+        n: Nombre de points du bloc
+    """
+    if isinstance(timestamps, SampleTimes):
+        return timestamps.timestamps(n)
+    return timestamps
+
+
+def block_start_time(timestamps):
+    """
+    Retourne le temps du premier point d'un bloc
+
+    Args:
+        timestamps: Vecteur de timestamps ou SampleTimes
+    """
+    if isinstance(timestamps, SampleTimes):
+        return timestamps.start_time
+    return float(timestamps[0])
+
+
+class TxtRecordFile:
+    """
+    Fichier d'enregistrement texte (séparateur tabulation)
+
+    Format : commentaire optionnel en première ligne ("# ..."), en-têtes
+    (Temps + noms des canaux), puis une ligne par échantillon.
+
+    Sans précision, les valeurs sont écrites en représentation exacte (csv).
+    Avec une précision, tout le bloc est formaté en une seule opération
+    (environ 4x plus rapide), ce qui est nécessaire à pleine cadence.
+    """
+
+    def __init__(self, filepath, headers, comment="", precision=None, time_decimals=6):
+        """
+        Crée le fichier et écrit les en-têtes
+
+        Args:
+            filepath: Chemin du fichier à créer
+            headers: En-têtes de colonnes (Temps + noms des canaux)
+            comment: Commentaire écrit en première ligne (optionnel)
+            precision: Chiffres significatifs des valeurs (None = représentation exacte)
+            time_decimals: Décimales de la colonne Temps quand precision est fournie
+        """
+        self.filepath = filepath
+        self._file = open(filepath, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file, delimiter='\t')
+
+        # Format d'une ligne complète pour l'écriture en bloc
+        self._row_format = None
+        if precision is not None:
+            columns = [f'%.{time_decimals}f'] + [f'%.{precision}g'] * (len(headers) - 1)
+            self._row_format = '\t'.join(columns) + '\n'
+
+        # Écrire le commentaire en première ligne (si fourni)
+        if comment:
+            self._writer.writerow([f'# {comment}'])
+
+        self._writer.writerow(headers)
+        self._file.flush()
+
+    def write_block(self, timestamps, data):
+        """
+        Écrit un bloc d'échantillons (une ligne par échantillon)
+
+        Args:
+            timestamps: Timestamps du bloc (un par échantillon) ou SampleTimes
+            data: Données du bloc (canaux x échantillons)
+        """
+        rows = np.column_stack((block_timestamps(timestamps, data.shape[1]), data.T))
+
+        if self._row_format:
+            self._file.write((self._row_format * rows.shape[0]) % tuple(rows.ravel().tolist()))
+        else:
+            self._writer.writerows(rows.tolist())
+
+    def flush(self):
+        """Force l'écriture sur disque"""
+        self._file.flush()
+
+    def close(self):
+        """Ferme le fichier"""
+        self._file.close()
+
+
+class BinaryRecordFile:
+    """
+    Fichier d'enregistrement binaire brut (.bin) avec en-tête JSON séparé (.json)
+
+    Chaque échantillon occupe un enregistrement de taille fixe, en little-endian :
+    [temps (float64, optionnel)] + une valeur par canal (float64 ou float32).
+    Sans colonne temps, le temps du i-ème enregistrement vaut
+    start_time + i / sample_rate (acquisition régulière, sans perte).
+    """
+
+    FORMAT_NAME = "logger-ni-bin"
+    FORMAT_VERSION = 1
+
+    # Tentatives de remplacement de l'en-tête (Windows refuse tant qu'un lecteur l'a ouvert)
+    HEADER_REPLACE_ATTEMPTS = 5
+    HEADER_REPLACE_DELAY = 0.01
+
+    def __init__(self, filepath, channel_names, comment="", sample_rate=None,
+                 time_column=True, dtype="float64"):
+        """
+        Crée le fichier binaire et son en-tête JSON
+
+        Args:
+            filepath: Chemin du fichier .bin (l'en-tête est écrit à côté, en .json)
+            channel_names: Noms des canaux
+            comment: Commentaire stocké dans l'en-tête
+            sample_rate: Fréquence des enregistrements (Hz), obligatoire sans colonne temps
+            time_column: Stocker le temps de chaque échantillon
+            dtype: Type des valeurs ("float64" ou "float32")
+        """
+        if not time_column and not sample_rate:
+            raise ValueError("Une fréquence d'échantillonnage est nécessaire sans colonne temps")
+
+        self.filepath = filepath
+        self.header_path = os.path.splitext(filepath)[0] + '.json'
+        self.n_samples = 0
+
+        value_dtype = np.dtype(dtype).newbyteorder('<')
+        fields = [('time', '<f8')] if time_column else []
+        fields.append(('data', value_dtype, (len(channel_names),)))
+        self._record_dtype = np.dtype(fields)
+
+        self.header = {
+            'format': self.FORMAT_NAME,
+            'version': self.FORMAT_VERSION,
+            'data_file': os.path.basename(filepath),
+            'channel_names': list(channel_names),
+            'n_channels': len(channel_names),
+            'dtype': value_dtype.str,
+            'time_dtype': '<f8' if time_column else None,
+            'record_size': self._record_dtype.itemsize,
+            'header_bytes': 0,
+            'sample_rate': float(sample_rate) if sample_rate else None,
+            'start_time': 0.0,
+            'comment': comment,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'n_samples': None,
+            'complete': False
+        }
+
+        self._header_pending = False
+        self._file = open(filepath, 'wb')
+        self._write_header()
+
+    def _write_header(self):
+        """
+        Écrit l'en-tête JSON (réécrit à la fermeture avec le nombre de points)
+
+        L'en-tête est écrit dans un fichier temporaire du même dossier puis
+        substitué d'un bloc : un lecteur du fichier en cours d'écriture ne voit
+        jamais d'en-tête tronqué. Sous Windows, la substitution échoue tant qu'un
+        lecteur a l'en-tête ouvert : elle est retentée, puis reportée à la
+        prochaine écriture si le fichier reste occupé.
+
+        Returns:
+            bool: True si l'en-tête est à jour sur disque
+        """
+        temp_path = self.header_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.header, f, indent=4, ensure_ascii=False)
+
+        for attempt in range(self.HEADER_REPLACE_ATTEMPTS):
+            try:
+                os.replace(temp_path, self.header_path)
+                self._header_pending = False
+                return True
+            except PermissionError:
+                time.sleep(self.HEADER_REPLACE_DELAY * (attempt + 1))
+
+        self._header_pending = True
+        return False
+
+    def write_block(self, timestamps, data):
+        """
+        Écrit un bloc d'échantillons en un seul appel
+
+        Args:
+            timestamps: Timestamps du bloc (un par échantillon) ou SampleTimes
+            data: Données du bloc (canaux x échantillons)
+        """
+        n = data.shape[1]
+        if self.n_samples == 0 and n > 0:
+            # L'origine des temps implicites est le premier point écrit
+            self.header['start_time'] = block_start_time(timestamps)
+            if self.header['time_dtype'] is None:
+                self._header_pending = True
+
+        records = np.empty(n, dtype=self._record_dtype)
+        if self.header['time_dtype']:
+            records['time'] = block_timestamps(timestamps, n)
+        records['data'] = data.T
+
+        self._file.write(records.tobytes())
+        self.n_samples += n
+
+        # En-tête mis à jour après les données : un en-tête occupé ne fait perdre aucun bloc
+        if self._header_pending:
+            self._write_header()
+
+    def flush(self):
+        """Force l'écriture sur disque"""
+        self._file.flush()
+
+    def close(self):
+        """Ferme le fichier et complète l'en-tête"""
+        self._file.close()
+        self.header['n_samples'] = self.n_samples
+        self.header['complete'] = True
+        if not self._write_header():
+            print(f"❌ En-tête non mis à jour (fichier occupé): {self.header_path} "
+                  f"- version complète dans {self.header_path}.tmp")
+
+
+class TdmsRecordFile:
+    """
+    Fichier d'enregistrement TDMS (nécessite le paquet optionnel npTDMS)
+
+    Un segment TDMS est écrit par bloc, avec un canal par voie dans le groupe
+    "Data". Sans colonne temps, les propriétés waveform (wf_start_offset,
+    wf_increment) portent la base de temps ; sinon un canal "Temps" est ajouté.
+    """
+
+    GROUP_NAME = "Data"
+
+    def __init__(self, filepath, channel_names, comment="", sample_rate=None, time_column=True):
+        """
+        Crée le fichier TDMS
+
+        Args:
+            filepath: Chemin du fichier .tdms
+            channel_names: Noms des canaux
+            comment: Commentaire stocké dans les propriétés du fichier
+            sample_rate: Fréquence des enregistrements (Hz), obligatoire sans colonne temps
+            time_column: Stocker le temps de chaque échantillon dans un canal "Temps"
+        """
+        try:
+            from nptdms import TdmsWriter, RootObject, GroupObject, ChannelObject
+        except ImportError:
+            raise RuntimeError("Le format TDMS nécessite le paquet npTDMS (pip install npTDMS)")
+
+        if not time_column and not sample_rate:
+            raise ValueError("Une fréquence d'échantillonnage est nécessaire sans colonne temps")
+
+        self._channel_object = ChannelObject
+        self.filepath = filepath
+        self.channel_names = list(channel_names)
+        self.sample_rate = sample_rate
+        self.time_column = time_column
+        self.n_samples = 0
+
+        self._writer = TdmsWriter(filepath)
+        self._writer.open()
+        self._writer.write_segment([
+            RootObject(properties={'comment': comment, 'created': datetime.now().isoformat(timespec='seconds')}),
+            GroupObject(self.GROUP_NAME)
+        ])
+
+    def write_block(self, timestamps, data):
+        """
+        Écrit un bloc d'échantillons dans un nouveau segment
+
+        Args:
+            timestamps: Timestamps du bloc (un par échantillon) ou SampleTimes
+            data: Données du bloc (canaux x échantillons)
+        """
+        objects = []
+        if self.time_column:
+            objects.append(self._channel_object(self.GROUP_NAME, 'Temps',
+                                                np.asarray(block_timestamps(timestamps, data.shape[1]),
+                                                           dtype=np.float64)))
+
+        for i, name in enumerate(self.channel_names):
+            properties = {}
+            if self.n_samples == 0 and not self.time_column:
+                properties = {'wf_start_offset': block_start_time(timestamps),
+                              'wf_increment': 1.0 / self.sample_rate}
+            objects.append(self._channel_object(self.GROUP_NAME, name, data[i], properties=properties))
+
+        self._writer.write_segment(objects)
+        self.n_samples += data.shape[1]
+
+    def flush(self):
+        """Les segments TDMS sont écrits directement à chaque bloc"""
+        pass
+
+    def close(self):
+        """Ferme le fichier"""
+        self._writer.close()
+
+
+# Extension des fichiers pour chaque format (CSV: ancien nom du format texte)
+RECORD_FILE_EXTENSIONS = {"TXT": ".txt", "CSV": ".txt", "BIN": ".bin", "TDMS": ".tdms"}
+
+
+def create_record_file(save_format, base_path, channel_names, comment="", sample_rate=None,
+                       time_column=True, txt_precision=None, bin_dtype="float64"):
+    """
+    Crée le fichier d'enregistrement correspondant au format demandé
+
+    Args:
+        save_format: "TXT" (ou "CSV"), "BIN" ou "TDMS"
+        base_path: Chemin sans extension
+        channel_names: Noms des canaux
+        comment: Commentaire d'en-tête
+        sample_rate: Fréquence des enregistrements (Hz), pour les temps implicites
+        time_column: Stocker explicitement le temps de chaque point (toujours vrai en TXT)
+        txt_precision: Chiffres significatifs en TXT (None = représentation exacte)
+        bin_dtype: Type des valeurs en BIN ("float64" ou "float32")
+
+    Returns:
+        Fichier d'enregistrement (write_block, flush, close, filepath)
+    """
+    save_format = save_format.upper()
+    if save_format not in RECORD_FILE_EXTENSIONS:
+        raise ValueError(f"Format d'enregistrement inconnu: {save_format} "
+                         f"(attendu: {', '.join(RECORD_FILE_EXTENSIONS)})")
+
+    filepath = base_path + RECORD_FILE_EXTENSIONS[save_format]
+
+    if save_format == "BIN":
+        return BinaryRecordFile(filepath, channel_names, comment, sample_rate, time_column, bin_dtype)
+    if save_format == "TDMS":
+        return TdmsRecordFile(filepath, channel_names, comment, sample_rate, time_column)
+    return TxtRecordFile(filepath, ['Temps'] + list(channel_names), comment, precision=txt_precision)
+
+
+class RecordWriter:
+    """
+    Thread d'écriture alimenté par une file bornée de blocs d'échantillons
+
+    Le thread d'acquisition ne fait que déposer des blocs dans la file ; les
+    écritures (et flush) sur un stockage lent se font dans ce thread. Quand la
+    file est pleine, la politique de contre-pression s'applique :
+        - "BLOCK" : l'acquisition attend qu'une place se libère (aucune perte)
+        - "DROP"  : le bloc est abandonné et comptabilisé
+        - "SPILL" : le bloc est écrit dans un fichier tampon sur disque local,
+                    puis recopié dans l'enregistrement dès que la file se vide
+    """
+
+    POLICIES = ("BLOCK", "DROP", "SPILL")
+
+    def __init__(self, record_file, queue_size=256, policy="SPILL", spill_folder=None, stop_timeout=30.0):
+        """
+        Initialise le thread d'écriture
+
+        Args:
+            record_file: Fichier de sortie (write_block, flush, close)
+            queue_size: Nombre maximum de blocs en attente
+            policy: Politique quand la file est pleine ("BLOCK", "DROP" ou "SPILL")
+            spill_folder: Dossier local du fichier tampon (défaut: dossier temporaire)
+            stop_timeout: Délai maximal (secondes) accordé à stop() pour vider la file
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Politique d'écriture inconnue: {policy} (attendu: {', '.join(self.POLICIES)})")
+
+        self.record_file = record_file
+        self.policy = policy
+        self.spill_folder = spill_folder or tempfile.gettempdir()
+        self.stop_timeout = stop_timeout
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+
+        # Fichier tampon (politique SPILL), ouvert à la première utilisation
+        self._spill_lock = threading.Lock()
+        self._spill_path = None
+        self._spill_out = None
+        self._spill_in = None
+        self._spill_pending = 0
+        self._spilling = False
+
+        # Compteurs
+        self.blocks_written = 0
+        self.samples_written = 0
+        self.max_queue_depth = 0
+        self.dropped_blocks = 0
+        self.dropped_samples = 0
+        self.spilled_blocks = 0
+        self.blocked_time = 0.0
+        self.write_errors = 0
+        self.last_write_latency = 0.0
+        self.max_write_latency = 0.0
+        self._total_write_latency = 0.0
+
+    def start(self):
+        """Démarre le thread d'écriture"""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, timestamps, data):
+        """
+        Dépose un bloc à écrire (appelé depuis le thread d'acquisition)
+
+        Le bloc est copié : l'appelant peut réutiliser ses buffers immédiatement.
+        Pour un bloc à cadence régulière, passer SampleTimes(premier indice,
+        fréquence) : les timestamps ne sont construits que si le fichier les stocke.
+
+        Args:
+            timestamps: Timestamps du bloc ou SampleTimes
+            data: Données du bloc (canaux x échantillons)
+
+        Returns:
+            bool: False si le bloc a été abandonné (politique DROP, ou thread d'écriture arrêté)
+        """
+        if not isinstance(timestamps, SampleTimes):
+            timestamps = np.array(timestamps, dtype=np.float64)
+        block = (timestamps, np.array(data, dtype=np.float64))
+
+        if self.policy == "SPILL":
+            with self._spill_lock:
+                # Une fois le débordement commencé, tout passe par le fichier tampon (ordre préservé)
+                if self._spilling:
+                    self._spill(block)
+                    return True
+                try:
+                    self._queue.put_nowait(block)
+                except queue.Full:
+                    self._spilling = True
+                    self._spill(block)
+        elif self.policy == "DROP":
+            try:
+                self._queue.put_nowait(block)
+            except queue.Full:
+                self.dropped_blocks += 1
+                self.dropped_samples += block[1].shape[1]
+                return False
+        else:
+            start = time.perf_counter()
+            while True:
+                try:
+                    self._queue.put(block, timeout=0.1)
+                    break
+                except queue.Full:
+                    # Attente sans fin si le thread d'écriture est arrêté : le bloc est perdu
+                    if self._thread is None or not self._thread.is_alive():
+                        self.blocked_time += time.perf_counter() - start
+                        self.dropped_blocks += 1
+                        self.dropped_samples += block[1].shape[1]
+                        return False
+            self.blocked_time += time.perf_counter() - start
+
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return True
+
+    def stop(self):
+        """
+        Vide la file (et le fichier tampon), puis ferme le fichier de sortie
+
+        L'attente est bornée par stop_timeout : si le thread d'écriture s'est
+        arrêté sur une erreur (file pleine que plus personne ne vide) ou reste
+        bloqué sur le stockage, l'arrêt est signalé au lieu d'attendre indéfiniment.
+
+        Returns:
+            bool: True si tous les blocs reçus ont été écrits
+        """
+        thread = self._thread
+        self._thread = None
+        if thread is None:
+            return True
+
+        # Marqueur de fin déposé dès qu'une place se libère, tant que le thread vit
+        deadline = time.monotonic() + self.stop_timeout
+        while thread.is_alive():
+            try:
+                self._queue.put(None, timeout=min(0.1, max(deadline - time.monotonic(), 0.001)))
+                break
+            except queue.Full:
+                if time.monotonic() >= deadline:
+                    break
+        thread.join(max(deadline - time.monotonic(), 0))
+
+        if thread.is_alive():
+            # Le thread possède encore le fichier : il n'est pas fermé ici
+            print(f"❌ Thread d'écriture bloqué depuis {self.stop_timeout:g} s: "
+                  f"{self._queue.qsize()} bloc(s) en file et {self._spill_pending} débordé(s) non écrits, "
+                  f"fichier {getattr(self.record_file, 'filepath', '')} laissé ouvert")
+            return False
+
+        lost_blocks = self._queue.qsize() + self._spill_pending
+        if lost_blocks:
+            print(f"❌ Thread d'écriture arrêté prématurément: {lost_blocks} bloc(s) non écrits")
+
+        self.record_file.close()
+
+        with self._spill_lock:
+            self._remove_spill_file()
+        return lost_blocks == 0
+
+    def _spill(self, block):
+        """
+        Ajoute un bloc au fichier tampon local (appelé sous _spill_lock)
+        """
+        if self._spill_path is None:
+            fd, self._spill_path = tempfile.mkstemp(prefix="logger_spill_", suffix=".npy",
+                                                    dir=self.spill_folder)
+            self._spill_out = os.fdopen(fd, 'wb')
+            self._spill_in = open(self._spill_path, 'rb')
+
+        timestamps, data = block
+        if isinstance(timestamps, SampleTimes):
+            # Base de temps implicite stockée en 2D (un vecteur de timestamps est 1D)
+            timestamps = np.array([timestamps], dtype=np.float64)
+        np.save(self._spill_out, timestamps)
+        np.save(self._spill_out, data)
+        self._spill_out.flush()
+        self._spill_pending += 1
+        self.spilled_blocks += 1
+
+    def _write_spilled_block(self):
+        """
+        Recopie le plus ancien bloc du fichier tampon dans l'enregistrement
+        """
+        timestamps = np.load(self._spill_in)
+        if timestamps.ndim == 2:
+            timestamps = SampleTimes(int(timestamps[0, 0]), float(timestamps[0, 1]))
+        data = np.load(self._spill_in)
+        self._write(timestamps, data)
+
+        with self._spill_lock:
+            self._spill_pending -= 1
+            if self._spill_pending == 0:
+                # Retard rattrapé : le fichier tampon est supprimé (recréé au prochain débordement)
+                self._spilling = False
+                self._remove_spill_file()
+
+    def _remove_spill_file(self):
+        """
+        Ferme et supprime le fichier tampon s'il existe (appelé sous _spill_lock)
+        """
+        if self._spill_path is None:
+            return
+        self._spill_out.close()
+        self._spill_in.close()
+        os.remove(self._spill_path)
+        self._spill_path = None
+        self._spill_out = None
+        self._spill_in = None
+
+    def _write(self, timestamps, data):
+        """
+        Écrit un bloc et mesure la latence d'écriture
+        """
+        start = time.perf_counter()
+        try:
+            self.record_file.write_block(timestamps, data)
+
+            # Flush dès que l'écriture a rattrapé l'acquisition
+            if self._queue.empty():
+                self.record_file.flush()
+        except Exception as e:
+            self.write_errors += 1
+            print(f"Erreur d'écriture de l'enregistrement: {e}")
+            return
+
+        latency = time.perf_counter() - start
+        self.last_write_latency = latency
+        self.max_write_latency = max(self.max_write_latency, latency)
+        self._total_write_latency += latency
+        self.blocks_written += 1
+        self.samples_written += data.shape[1]
+
+    def _run(self):
+        """
+        Boucle du thread d'écriture
+        """
+        while True:
+            # La file vide en premier : les blocs du fichier tampon sont plus récents
+            if self._spill_pending and self._queue.empty():
+                self._write_spilled_block()
+                continue
+
+            try:
+                block = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            if block is None:
+                break
+            self._write(*block)
+
+        # Arrêt demandé : écrire les blocs restants du fichier tampon
+        while self._spill_pending:
+            self._write_spilled_block()
+
+        try:
+            self.record_file.flush()
+        except Exception as e:
+            print(f"Erreur d'écriture de l'enregistrement: {e}")
+
+    def get_stats(self):
+        """
+        Retourne les compteurs du thread d'écriture
+
+        Returns:
+            dict: Profondeur de file, latences d'écriture (ms) et pertes/débordements
+        """
+        return {
+            'policy': self.policy,
+            'queue_depth': self._queue.qsize(),
+            'max_queue_depth': self.max_queue_depth,
+            'blocks_written': self.blocks_written,
+            'samples_written': self.samples_written,
+            'dropped_blocks': self.dropped_blocks,
+            'dropped_samples': self.dropped_samples,
+            'spilled_blocks': self.spilled_blocks,
+            'spill_pending': self._spill_pending,
+            'blocked_time_s': self.blocked_time,
+            'write_errors': self.write_errors,
+            'write_latency_last_ms': self.last_write_latency * 1000.0,
+            'write_latency_mean_ms': (self._total_write_latency / self.blocks_written * 1000.0
+                                      if self.blocks_written else 0.0),
+            'write_latency_max_ms': self.max_write_latency * 1000.0,
+        }
@@ -0,0 +1,162 @@
+"""
+Lecture des enregistrements binaires - Accès direct par le temps via memory-mapping
+"""
+import json
+import math
+import os
+
+import numpy as np
+
+
+class BinaryRecordingReader:
+    """
+    Lecteur d'un enregistrement binaire (.bin + en-tête .json) projeté en mémoire
+
+    Le fichier n'est jamais chargé entièrement : np.memmap projette les
+    enregistrements de taille fixe et une fenêtre [t0, t1] se traduit en
+    indices (donc en offsets) directement à partir de la fréquence et de
+    l'en-tête. Un fichier encore en cours d'écriture peut être ouvert ;
+    refresh() prend en compte les nouveaux points.
+    """
+
+    def __init__(self, filepath):
+        """
+        Ouvre un enregistrement binaire
+
+        Args:
+            filepath: Chemin du fichier .bin ou de son en-tête .json
+        """
+        base_path = os.path.splitext(filepath)[0]
+        self.header_path = base_path + '.json'
+
+        with open(self.header_path, 'r', encoding='utf-8') as f:
+            self.header = json.load(f)
+
+        self.filepath = os.path.join(os.path.dirname(self.header_path), self.header['data_file'])
+        self.channel_names = self.header['channel_names']
+        self.sample_rate = self.header['sample_rate']
+        self.start_time = self.header['start_time']
+        self.has_time_column = self.header['time_dtype'] is not None
+
+        fields = [('time', self.header['time_dtype'])] if self.has_time_column else []
+        fields.append(('data', self.header['dtype'], (self.header['n_channels'],)))
+        self._record_dtype = np.dtype(fields)
+
+        if self._record_dtype.itemsize != self.header['record_size']:
+            raise ValueError(f"Taille d'enregistrement incohérente dans {self.header_path}")
+
+        self._records = None
+        self.n_samples = 0
+        self.refresh()
+
+    def refresh(self):
+        """
+        Met à jour la projection si le fichier a grandi (enregistrement en cours)
+
+        Returns:
+            int: Nombre d'échantillons complets disponibles
+        """
+        if not self.header['complete']:
+            # L'en-tête peut avoir été complété depuis l'ouverture (origine des temps, fin)
+            with open(self.header_path, 'r', encoding='utf-8') as f:
+                self.header = json.load(f)
+            self.start_time = self.header['start_time']
+
+        size = os.path.getsize(self.filepath) - self.header['header_bytes']
+        n_samples = max(size, 0) // self._record_dtype.itemsize
+
+        if n_samples != self.n_samples or self._records is None:
+            if n_samples > 0:
+                self._records = np.memmap(self.filepath, dtype=self._record_dtype, mode='r',
+                                          offset=self.header['header_bytes'], shape=(n_samples,))
+            else:
+                self._records = np.zeros(0, dtype=self._record_dtype)
+            self.n_samples = n_samples
+
+        return self.n_samples
+
+    def close(self):
+        """Libère la projection mémoire"""
+        self._records = None
+        self.n_samples = 0
+
+    @property
+    def duration(self):
+        """Durée couverte par l'enregistrement (secondes)"""
+        if self.n_samples == 0:
+            return 0.0
+        return self.get_time(self.n_samples - 1) - self.get_time(0)
+
+    def get_time(self, index):
+        """
+        Retourne le temps de l'échantillon d'indice donné
+        """
+        if self.has_time_column:
+            return float(self._records['time'][index])
+        return self.start_time + index / self.sample_rate
+
+    def index_at(self, t):
+        """
+        Retourne l'indice du premier échantillon dont le temps est >= t
+
+        O(1) pour un enregistrement régulier (temps implicites), O(log n) par
+        recherche dichotomique sur la colonne temps sinon.
+        """
+        if self.has_time_column:
+            return int(np.searchsorted(self._records['time'], t, side='left'))
+
+        index = math.ceil(round((t - self.start_time) * self.sample_rate, 9))
+        return min(max(index, 0), self.n_samples)
+
+    def _channel_selection(self, channels):
+        """
+        Convertit une sélection de canaux (noms ou indices) en clé d'indexation
+        """
+        if channels is None:
+            return slice(None)
+
+        indices = [self.channel_names.index(c) if isinstance(c, str) else int(c) for c in channels]
+
+        # Canaux consécutifs : une tranche, donc une vue sans copie
+        if indices and indices == list(range(indices[0], indices[-1] + 1)):
+            return slice(indices[0], indices[-1] + 1)
+        return indices
+
+    def read(self, t0=None, t1=None, channels=None):
+        """
+        Lit la fenêtre temporelle [t0, t1[ pour une sélection de canaux
+
+        Args:
+            t0: Début de la fenêtre en secondes (défaut: début de l'enregistrement)
+            t1: Fin de la fenêtre en secondes, exclue (défaut: fin de l'enregistrement)
+            channels: Noms ou indices des canaux (défaut: tous)
+
+        Returns:
+            tuple: (timestamps, data) avec data de forme (canaux x échantillons).
+                   data est une vue sur le fichier projeté (sauf sélection de canaux non consécutifs).
+        """
+        if not self.header['complete']:
+            self.refresh()
+
+        i0 = 0 if t0 is None else self.index_at(t0)
+        i1 = self.n_samples if t1 is None else self.index_at(t1)
+        i1 = max(i0, i1)
+
+        return self.read_samples(i0, i1, channels)
+
+    def read_samples(self, i0, i1, channels=None):
+        """
+        Lit les échantillons d'indices [i0, i1[
+
+        Returns:
+            tuple: (timestamps, data) avec data de forme (canaux x échantillons)
+        """
+        window = self._records[i0:i1]
+        data = window['data'][:, self._channel_selection(channels)].T
+
+        if self.has_time_column:
+            timestamps = window['time']
+        else:
+            timestamps = self.start_time + np.arange(i0, i1, dtype=np.float64) / self.sample_rate
+
+        return timestamps, data
@@ -0,0 +1,171 @@
+"""
+Buffer circulaire - Fenêtre glissante multi-canaux à capacité fixe
+"""
+import time
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Buffer circulaire NumPy à capacité fixe pour la fenêtre instantanée
+
+    Les données sont stockées en double (positions i et i + capacité) dans un
+    tableau de taille 2 x capacité : la fenêtre ordonnée est donc toujours une
+    tranche contiguë, ce qui permet de la lire sans copie. Une écriture coûte
+    O(taille du bloc), quelle que soit la taille de la fenêtre.
+
+    Les timestamps ne sont pas stockés : l'échantillonnage étant régulier, ils
+    se déduisent de l'indice absolu du premier point de la fenêtre et de la
+    fréquence, et ne sont calculés qu'à la demande.
+    
+    Un écrivain unique (thread d'acquisition) et des lecteurs concurrents sont
+    synchronisés par un compteur de séquence (seqlock) : il est impair pendant
+    une écriture, et snapshot() recommence sa copie si le compteur a changé.
+    L'écrivain n'attend jamais les lecteurs.
+    """
+
+    def __init__(self, n_channels, capacity, sample_rate, dtype=np.float64):
+        """
+        Initialise le buffer circulaire
+
+        Args:
+            n_channels: Nombre de canaux
+            capacity: Nombre maximum d'échantillons conservés par canal
+            sample_rate: Fréquence d'échantillonnage (Hz), pour le calcul des timestamps
+            dtype: Type des données stockées
+        """
+        if capacity <= 0:
+            raise ValueError("La capacité du buffer circulaire doit être positive")
+
+        self.n_channels = n_channels
+        self.capacity = int(capacity)
+        self.sample_rate = float(sample_rate)
+
+        # Stockage doublé : données (canaux x 2*capacité)
+        self._data = np.zeros((n_channels, 2 * self.capacity), dtype=dtype)
+
+        self._head = 0  # Position de la prochaine écriture (dans [0, capacité[)
+        self._count = 0  # Nombre d'échantillons valides (<= capacité)
+        self._total_written = 0  # Indice absolu du prochain échantillon écrit
+        self._sequence = 0  # Compteur de séquence (impair pendant une écriture)
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def version(self):
+        """
+        Version des données : augmente à chaque écriture (nombre d'écritures terminées)
+        """
+        return self._sequence // 2
+
+    def clear(self):
+        """
+        Vide le buffer (sans réallouer la mémoire)
+        """
+        self._sequence += 1
+        self._head = 0
+        self._count = 0
+        self._total_written = 0
+        self._sequence += 1
+
+    def write(self, data):
+        """
+        Ajoute un bloc d'échantillons à la fin de la fenêtre
+
+        Args:
+            data: Bloc de données (canaux x échantillons)
+        """
+        n = data.shape[1]
+        if n == 0:
+            return
+
+        self._sequence += 1  # Écriture en cours
+        try:
+            self._write(data, n)
+        finally:
+            self._sequence += 1
+
+    def _write(self, data, n):
+        """
+        Copie le bloc dans les deux moitiés du stockage (appelé entre les incréments de séquence)
+        """
+        self._total_written += n
+
+        # Seuls les `capacité` derniers points d'un bloc trop grand sont utiles
+        if n > self.capacity:
+            data = data[:, -self.capacity:]
+            n = self.capacity
+
+        cap = self.capacity
+        start = self._head
+        first = min(n, cap - start)  # Partie écrite avant le repli
+        rest = n - first
+
+        # Écriture dans les deux copies (position p et p + capacité)
+        for offset in (0, cap):
+            self._data[:, offset + start:offset + start + first] = data[:, :first]
+            if rest:
+                self._data[:, offset:offset + rest] = data[:, first:]
+
+        self._head = (start + n) % cap
+        self._count = min(self._count + n, cap)
+
+    def _window(self):
+        """
+        Retourne les bornes [début, fin[ de la fenêtre ordonnée dans le stockage doublé
+        """
+        # La copie haute [capacité, 2*capacité[ termine toujours la fenêtre en head + capacité
+        end = self._head + self.capacity
+        return end - self._count, end
+
+    def get_data(self):
+        """
+        Retourne la fenêtre ordonnée (canaux x échantillons), sans copie
+
+        Returns:
+            numpy.ndarray: Vue en lecture seule sur les données
+        """
+        start, end = self._window()
+        view = self._data[:, start:end]
+        view.flags.writeable = False
+        return view
+
+    def snapshot(self):
+        """
+        Copie cohérente de la fenêtre, même pendant les écritures d'un autre thread
+
+        Returns:
+            tuple: (start_index, data, version) où data est une copie
+                   (canaux x échantillons) et start_index l'indice absolu de son premier point
+        """
+        while True:
+            sequence = self._sequence
+            if sequence % 2:
+                # Écriture en cours : laisser le thread d'acquisition terminer
+                time.sleep(0)
+                continue
+
+            start, end = self._window()
+            start_index = self._total_written - self._count
+            data = self._data[:, start:end].copy()
+
+            if self._sequence == sequence:
+                return start_index, data, sequence // 2
+
+    def get_start_index(self):
+        """
+        Retourne l'indice absolu (depuis le premier write) du premier point de la fenêtre
+        """
+        return self._total_written - self._count
+
+    def get_timestamps(self):
+        """
+        Calcule les timestamps de la fenêtre ordonnée (indice absolu / fréquence)
+
+        Returns:
+            numpy.ndarray: Timestamps float64 en secondes
+        """
+        start_index = self.get_start_index()
+        return np.arange(start_index, start_index + self._count, dtype=np.float64) / self.sample_rate
@@ -0,0 +1,269 @@
+"""
+Statistiques glissantes - Moyenne, écart-type, min, max et RMS mis à jour par bloc
+"""
+import threading
+from collections import deque
+
+import numpy as np
+
+
+class RunningStatistics:
+    """
+    Statistiques par canal mises à jour incrémentalement, bloc par bloc
+
+    Chaque bloc est résumé une seule fois (effectif, moyenne, somme des carrés
+    des écarts M2, min, max, somme des carrés) puis fusionné dans le cumul de
+    tout l'enregistrement par la formule de Welford/Chan : la mise à jour ne
+    dépend pas de la taille de l'historique et reste numériquement stable.
+
+    Pour la fenêtre glissante, les cumuls (effectif, sommes des écarts à une
+    référence et de leurs carrés, somme des carrés) sont tenus à jour : un bloc
+    y est ajouté à son arrivée et retiré quand il sort de la fenêtre. Les min et
+    max de la fenêtre sont en tête de files monotones par canal. Lecture et mise
+    à jour ne dépendent donc pas du nombre de blocs de la fenêtre, qui couvre au
+    moins window_samples points (à un bloc près).
+
+    Les mises à jour (thread d'acquisition) et les lectures (interface) sont
+    protégées par un verrou.
+    """
+
+    def __init__(self, n_channels, window_samples=None):
+        """
+        Initialise les statistiques
+
+        Args:
+            n_channels: Nombre de canaux
+            window_samples: Taille de la fenêtre glissante en points (None: pas de fenêtre)
+        """
+        self.n_channels = n_channels
+        self.window_samples = window_samples
+        self._lock = threading.Lock()
+
+        self._count = 0
+        self._mean = np.zeros(n_channels)
+        self._m2 = np.zeros(n_channels)
+        self._min = np.full(n_channels, np.inf)
+        self._max = np.full(n_channels, -np.inf)
+        self._sum_squares = np.zeros(n_channels)
+
+        # Contributions des blocs de la fenêtre glissante, retirées à leur sortie :
+        # (effectif, somme des écarts, somme des carrés des écarts, somme des carrés)
+        self._blocks = deque()
+        self._window_count = 0
+        self._first_block = 0  # Numéro du plus ancien bloc de la fenêtre
+        # Écarts pris par rapport à la moyenne du premier bloc : limite l'annulation numérique
+        self._window_shift = None
+        self._window_sum = np.zeros(n_channels)
+        self._window_shifted_squares = np.zeros(n_channels)
+        self._window_sum_squares = np.zeros(n_channels)
+        # Files monotones par canal de (numéro de bloc, valeur) : croissante pour le min,
+        # décroissante pour le max ; la tête est l'extremum de la fenêtre
+        self._window_min = [deque() for _ in range(n_channels)]
+        self._window_max = [deque() for _ in range(n_channels)]
+
+    def update(self, data):
+        """
+        Intègre un bloc de données
+
+        Args:
+            data: Bloc (canaux x échantillons)
+        """
+        n = data.shape[1]
+        if n == 0:
+            return
+
+        block_mean = data.mean(axis=1)
+        block_m2 = ((data - block_mean[:, np.newaxis]) ** 2).sum(axis=1)
+        block = (n, block_mean, block_m2, data.min(axis=1), data.max(axis=1),
+                 np.einsum('ij,ij->i', data, data))
+
+        with self._lock:
+            # Fusion de Welford/Chan dans le cumul de l'enregistrement
+            total = self._count + n
+            delta = block_mean - self._mean
+            self._mean += delta * (n / total)
+            self._m2 += block_m2 + delta ** 2 * (self._count * n / total)
+            self._count = total
+            np.minimum(self._min, block[3], out=self._min)
+            np.maximum(self._max, block[4], out=self._max)
+            self._sum_squares += block[5]
+
+            if self.window_samples:
+                self._window_append(block)
+                # Oublier les blocs devenus inutiles pour couvrir la fenêtre
+                while self._window_count - self._blocks[0][0] >= self.window_samples:
+                    self._window_popleft()
+
+    def _window_append(self, block):
+        """
+        Ajoute la contribution d'un bloc à la fenêtre glissante (appelé sous _lock)
+        """
+        n, block_mean, block_m2, block_min, block_max, block_sum_squares = block
+        if self._window_shift is None:
+            self._window_shift = block_mean.copy()
+
+        offset = block_mean - self._window_shift
+        contribution = (n, n * offset, block_m2 + n * offset ** 2, block_sum_squares)
+        self._blocks.append(contribution)
+        self._window_count += n
+        self._window_sum += contribution[1]
+        self._window_shifted_squares += contribution[2]
+        self._window_sum_squares += contribution[3]
+
+        # Les valeurs dominées par celles du nouveau bloc ne seront plus jamais l'extremum
+        index = self._first_block + len(self._blocks) - 1
+        for channel_queue, value in zip(self._window_min, block_min.tolist()):
+            while channel_queue and channel_queue[-1][1] >= value:
+                channel_queue.pop()
+            channel_queue.append((index, value))
+        for channel_queue, value in zip(self._window_max, block_max.tolist()):
+            while channel_queue and channel_queue[-1][1] <= value:
+                channel_queue.pop()
+            channel_queue.append((index, value))
+
+    def _window_popleft(self):
+        """
+        Retire la contribution du plus ancien bloc de la fenêtre (appelé sous _lock)
+        """
+        n, block_sum, block_shifted_squares, block_sum_squares = self._blocks.popleft()
+        self._window_count -= n
+        self._window_sum -= block_sum
+        self._window_shifted_squares -= block_shifted_squares
+        self._window_sum_squares -= block_sum_squares
+
+        for channel_queue in self._window_min + self._window_max:
+            if channel_queue[0][0] == self._first_block:
+                channel_queue.popleft()
+        self._first_block += 1
+
+    def _whole_run(self):
+        """
+        Retourne (effectif, moyenne, M2, min, max, somme des carrés) de tout l'enregistrement
+        """
+        return (self._count, self._mean.copy(), self._m2.copy(),
+                self._min.copy(), self._max.copy(), self._sum_squares.copy())
+
+    def _window(self):
+        """
+        Retourne (effectif, moyenne, M2, min, max, somme des carrés) de la fenêtre glissante
+        """
+        if not self._blocks:
+            return self._whole_run()
+
+        count = self._window_count
+        mean_offset = self._window_sum / count
+        # Les retraits successifs peuvent laisser un résidu négatif infime
+        m2 = np.maximum(self._window_shifted_squares - count * mean_offset ** 2, 0.0)
+
+        return (count, self._window_shift + mean_offset, m2,
+                np.array([channel_queue[0][1] for channel_queue in self._window_min]),
+                np.array([channel_queue[0][1] for channel_queue in self._window_max]),
+                self._window_sum_squares.copy())
+
+    def get_statistics(self, window=False):
+        """
+        Retourne les statistiques de tous les canaux
+
+        Args:
+            window: True pour la fenêtre glissante, False pour tout l'enregistrement
+
+        Returns:
+            dict: 'count' et tableaux par canal 'mean', 'std', 'min', 'max', 'rms'
+        """
+        with self._lock:
+            count, mean, m2, v_min, v_max, sum_squares = self._window() if window else self._whole_run()
+
+        if count == 0:
+            zeros = np.zeros(self.n_channels)
+            return {'count': 0, 'mean': zeros, 'std': zeros.copy(), 'min': zeros.copy(),
+                    'max': zeros.copy(), 'rms': zeros.copy()}
+
+        return {
+            'count': count,
+            'mean': mean,
+            'std': np.sqrt(m2 / count),
+            'min': v_min,
+            'max': v_max,
+            'rms': np.sqrt(sum_squares / count)
+        }
+
+
+class PeriodAggregator:
+    """
+    Agrégation par période d'enregistrement : moyenne, min, max et RMS de tous les points
+
+    Les blocs acquis sont cumulés par tranches entières (somme, somme des
+    carrés, min, max) : la mémoire est O(canaux) quelle que soit la durée de
+    la période, et un bloc qui chevauche la fin d'une période est coupé à
+    l'échantillon près.
+    """
+
+    def __init__(self, n_channels, period_samples):
+        """
+        Initialise l'agrégateur
+
+        Args:
+            n_channels: Nombre de canaux
+            period_samples: Nombre de points par période
+        """
+        self.n_channels = n_channels
+        self.period_samples = max(int(period_samples), 1)
+
+        self._count = 0
+        self._period_start = 0
+        self._sum = np.zeros(n_channels)
+        self._sum_squares = np.zeros(n_channels)
+        self._min = np.full(n_channels, np.inf)
+        self._max = np.full(n_channels, -np.inf)
+
+    def add(self, data, first_sample_index):
+        """
+        Cumule un bloc et retourne les périodes terminées
+
+        Args:
+            data: Bloc (canaux x échantillons)
+            first_sample_index: Indice absolu du premier point du bloc
+
+        Returns:
+            list: Tuples (indice du premier point de la période, tableau (canaux x 4) :
+                  moyenne, min, max, RMS)
+        """
+        completed = []
+        n = data.shape[1]
+        start = 0
+
+        while start < n:
+            if self._count == 0:
+                self._period_start = first_sample_index + start
+
+            # La période peut avoir été raccourcie en cours de route (set_record_period)
+            take = min(n - start, max(self.period_samples - self._count, 1))
+            segment = data[:, start:start + take]
+
+            self._sum += segment.sum(axis=1)
+            self._sum_squares += np.einsum('ij,ij->i', segment, segment)
+            np.minimum(self._min, segment.min(axis=1), out=self._min)
+            np.maximum(self._max, segment.max(axis=1), out=self._max)
+            self._count += take
+            start += take
+
+            if self._count >= self.period_samples:
+                completed.append((self._period_start, self._emit()))
+
+        return completed
+
+    def _emit(self):
+        """
+        Calcule les valeurs de la période en cours et remet les cumuls à zéro
+        """
+        values = np.stack((self._sum / self._count,
+                           self._min,
+                           self._max,
+                           np.sqrt(self._sum_squares / self._count)), axis=1)
+
+        self._count = 0
+        self._sum[:] = 0.0
+        self._sum_squares[:] = 0.0
+        self._min[:] = np.inf
+        self._max[:] = -np.inf
+        return values
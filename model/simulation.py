@@ -0,0 +1,249 @@
+"""
+Simulation - Sources de données DAQ sans matériel (tests et benchmarks)
+"""
+import threading
+import time
+
+import numpy as np
+
+
+class _SimulatedChannel:
+    """Canal d'entrée analogique simulé (seul le nom est utilisé)"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class _SimulatedTiming:
+    """Paramètres de timing, acceptés tels quels (attributs de nidaqmx.task.Timing)"""
+
+    def __init__(self, sample_rate):
+        self.samp_quant_samp_mode = SimulatedTask.CONTINUOUS
+        self.samp_clk_rate = sample_rate
+        self.samp_quant_samp_per_chan = 1000
+
+
+class _SimulatedInStream:
+    """Flux d'entrée simulé (attributs de nidaqmx.task.InStream utilisés par DAQModel)"""
+
+    def __init__(self, task):
+        self._task = task
+        self.input_buf_size = 1000
+
+    @property
+    def avail_samp_per_chan(self):
+        """Points acquis mais pas encore lus (toujours 0 en mode rapide)"""
+        return self._task.available_samples()
+
+
+class SimulatedTask:
+    """
+    Tâche DAQmx simulée reproduisant l'interface de nidaqmx.Task utilisée par DAQModel
+
+    Les canaux produisent des signaux déterministes, fonctions du seul indice
+    d'échantillon (et de la graine pour le bruit) : une même configuration
+    donne toujours les mêmes données, quelle que soit la taille des lectures.
+    Les formes d'onde (sinus, bruit, paliers, pics) sont attribuées aux canaux
+    à tour de rôle.
+
+    En mode temps réel, une lecture attend que les points soient "acquis" à la
+    fréquence d'horloge ; en mode rapide, les points sont produits aussi vite
+    que le lecteur les demande (benchmarks du pipeline).
+    """
+
+    CONTINUOUS = "CONTINUOUS"
+    WAVEFORMS = ("sine", "noise", "steps", "spikes")
+
+    def __init__(self, name="Simulation", n_channels=4, sample_rate=1000.0, waveforms=WAVEFORMS,
+                 frequency=None, amplitude=5.0, realtime=True, seed=0, spike_period=1.0):
+        """
+        Initialise la tâche simulée
+
+        Args:
+            name: Nom de la tâche
+            n_channels: Nombre de canaux
+            sample_rate: Fréquence d'échantillonnage par canal (Hz), modifiable via timing.samp_clk_rate
+            waveforms: Formes d'onde attribuées aux canaux à tour de rôle
+            frequency: Fréquence des sinus et des paliers (Hz), None = fréquence d'échantillonnage / 100
+            amplitude: Amplitude des signaux
+            realtime: Cadencer les lectures sur l'horloge simulée
+            seed: Graine du bruit
+            spike_period: Intervalle entre deux pics (secondes)
+        """
+        unknown = set(waveforms) - set(self.WAVEFORMS)
+        if unknown:
+            raise ValueError(f"Forme(s) d'onde simulée(s) inconnue(s): {', '.join(sorted(unknown))}")
+
+        self.name = name
+        self.ai_channels = [_SimulatedChannel(f"Sim_{i}_{waveforms[i % len(waveforms)]}")
+                            for i in range(n_channels)]
+        self.timing = _SimulatedTiming(sample_rate)
+        self.in_stream = _SimulatedInStream(self)
+
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.realtime = realtime
+        self.spike_period = spike_period
+
+        self.samples_read = 0
+        self._start_time = None
+
+        # Canaux regroupés par forme d'onde (un calcul vectorisé par groupe)
+        kinds = np.array([waveforms[i % len(waveforms)] for i in range(n_channels)])
+        self._rows = {kind: np.flatnonzero(kinds == kind) for kind in self.WAVEFORMS}
+        self._phases = (np.arange(n_channels) * (2 * np.pi / max(n_channels, 1))).reshape(-1, 1)
+        # Un générateur par canal de bruit : la suite ne dépend pas de la taille des lectures
+        self._noise = [np.random.Generator(np.random.PCG64([seed, int(row)])) for row in self._rows['noise']]
+
+        self._callback = None
+        self._callback_samples = 0
+        self._event_thread = None
+        self._running = False
+
+    @property
+    def sample_rate(self):
+        return float(self.timing.samp_clk_rate)
+
+    def register_every_n_samples_acquired_into_buffer_event(self, sample_interval, callback_method):
+        """
+        Appelle callback_method(task_handle, event_type, n, callback_data) tous les sample_interval points
+        """
+        self._callback = callback_method
+        self._callback_samples = int(sample_interval)
+
+    def start(self):
+        """Démarre l'horloge simulée (et le thread d'événements si un callback est enregistré)"""
+        self._start_time = time.perf_counter()
+        self._running = True
+        if self._callback is not None:
+            self._event_thread = threading.Thread(target=self._event_loop, name="SimulatedTaskEvents",
+                                                  daemon=True)
+            self._event_thread.start()
+
+    def stop(self):
+        """Arrête l'horloge simulée"""
+        self._running = False
+        if self._event_thread is not None and self._event_thread is not threading.current_thread():
+            self._event_thread.join(timeout=2.0)
+        self._event_thread = None
+
+    def close(self):
+        """Libère la tâche"""
+        self.stop()
+        self._callback = None
+
+    def available_samples(self):
+        """
+        Retourne le nombre de points acquis par l'horloge simulée et pas encore lus
+        """
+        if not self.realtime or self._start_time is None:
+            return 0
+        acquired = int((time.perf_counter() - self._start_time) * self.sample_rate)
+        return max(acquired - self.samples_read, 0)
+
+    def _event_loop(self):
+        """
+        Thread d'événements : signale chaque bloc de points acquis (moteur événementiel)
+        """
+        n = self._callback_samples
+        events = 0
+        while self._running:
+            if self.realtime:
+                delay = self._start_time + (events + 1) * n / self.sample_rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                    continue
+            events += 1
+            self._callback(0, 0, n, None)
+
+    def _wait_for_samples(self, n, timeout):
+        """
+        Attend que les n points suivants soient acquis (mode temps réel)
+        """
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+
+        ready_time = self._start_time + (self.samples_read + n) / self.sample_rate
+        delay = ready_time - time.perf_counter()
+        if delay > timeout:
+            raise TimeoutError("Timeout de lecture de la tâche simulée")
+        if delay > 0:
+            time.sleep(delay)
+
+    def read_into(self, data, n, timeout=10.0):
+        """
+        Remplit data[:, :n] avec les n points suivants de chaque canal
+
+        Returns:
+            int: Nombre de points lus par canal
+        """
+        if self.realtime:
+            self._wait_for_samples(n, timeout)
+
+        out = data[:, :n]
+        rate = self.sample_rate
+        # Par défaut 100 points par période, quelle que soit la fréquence d'échantillonnage
+        frequency = self.frequency or rate / 100.0
+        sample_index = np.arange(self.samples_read, self.samples_read + n, dtype=np.float64)
+
+        rows = self._rows['sine']
+        if len(rows):
+            out[rows] = np.sin(sample_index * (2 * np.pi * frequency / rate) + self._phases[rows])
+            out[rows] *= self.amplitude
+
+        for row, generator in zip(self._rows['noise'], self._noise):
+            generator.standard_normal(n, out=out[row])
+            out[row] *= 0.2 * self.amplitude
+
+        rows = self._rows['steps']
+        if len(rows):
+            # Paliers de 4 niveaux, changement tous les 1/frequence secondes
+            levels = np.floor(sample_index * (frequency / rate)) % 4
+            out[rows] = (levels - 1.5) * (self.amplitude / 1.5)
+
+        rows = self._rows['spikes']
+        if len(rows):
+            # Ligne de base faible et un pic d'amplitude pleine tous les spike_period secondes
+            interval = max(int(round(self.spike_period * rate)), 1)
+            out[rows] = np.sin(sample_index * (2 * np.pi * frequency / rate)) * (0.05 * self.amplitude)
+            spikes = np.flatnonzero(sample_index % interval == 0)
+            if len(spikes):
+                out[np.ix_(rows, spikes)] = self.amplitude
+
+        self.samples_read += n
+        return n
+
+    def read(self, number_of_samples_per_channel=1, timeout=10.0):
+        """
+        Lecture au format de Task.read() (listes Python, une par canal)
+
+        Returns:
+            list: Liste de listes (une par canal)
+        """
+        data = np.empty((len(self.ai_channels), number_of_samples_per_channel), dtype=np.float64)
+        self.read_into(data, number_of_samples_per_channel, timeout)
+        return data.tolist()
+
+    def create_reader(self):
+        """
+        Retourne le lecteur multi-canaux associé (interface de AnalogMultiChannelReader)
+        """
+        return SimulatedReader(self)
+
+
+class SimulatedReader:
+    """
+    Lecteur de SimulatedTask (interface de nidaqmx.stream_readers.AnalogMultiChannelReader)
+    """
+
+    def __init__(self, task):
+        self.task = task
+
+    def read_many_sample(self, data, number_of_samples_per_channel, timeout=10.0):
+        """
+        Remplit data (canaux x échantillons) avec les points suivants
+
+        Returns:
+            int: Nombre de points lus par canal
+        """
+        return self.task.read_into(data, number_of_samples_per_channel, timeout)
@@ -0,0 +1,170 @@
+"""
+Script de test pour vérifier l'enregistrement binaire et sa relecture par memory-mapping
+"""
+import sys
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model.record_writer import BinaryRecordFile
+from model.recording_reader import BinaryRecordingReader
+
+
+CHANNELS = ["Tension 1", "Tension 2", "Tension 3"]
+SAMPLE_RATE = 1000.0
+
+
+def write_blocks(record_file, n_blocks, block_size=100, first_index=0):
+    """Écrit des blocs dont la valeur encode (canal, indice)"""
+    for b in range(n_blocks):
+        index = np.arange(first_index + b * block_size, first_index + (b + 1) * block_size)
+        data = np.vstack([index + 1e6 * c for c in range(len(CHANNELS))]).astype(np.float64)
+        record_file.write_block(index / SAMPLE_RATE, data)
+
+
+def test_fenetre_temps_implicite():
+    """Test de la lecture d'une fenêtre [t0, t1[ avec temps implicites"""
+    with tempfile.TemporaryDirectory() as folder:
+        record_file = BinaryRecordFile(os.path.join(folder, "essai.bin"), CHANNELS,
+                                       sample_rate=SAMPLE_RATE, time_column=False)
+        write_blocks(record_file, 10)
+        record_file.close()
+
+        reader = BinaryRecordingReader(os.path.join(folder, "essai.json"))
+        assert reader.n_samples == 1000
+
+        timestamps, data = reader.read(0.25, 0.5)
+        assert data.shape == (3, 250)
+        assert np.allclose(timestamps, np.arange(250, 500) / SAMPLE_RATE)
+        assert np.array_equal(data[1], np.arange(250, 500) + 1e6)
+        assert np.shares_memory(data, reader._records)
+        reader.close()
+
+
+def test_selection_canaux_et_colonne_temps():
+    """Test de la sélection de canaux avec colonne temps explicite (float32)"""
+    with tempfile.TemporaryDirectory() as folder:
+        record_file = BinaryRecordFile(os.path.join(folder, "essai.bin"), CHANNELS,
+                                       time_column=True, dtype="float32")
+        write_blocks(record_file, 5)
+        record_file.close()
+
+        reader = BinaryRecordingReader(os.path.join(folder, "essai.bin"))
+        timestamps, data = reader.read(0.1, 0.2, channels=["Tension 1", "Tension 3"])
+        assert data.shape == (2, 100)
+        assert data.dtype == np.float32
+        assert np.allclose(timestamps, np.arange(100, 200) / SAMPLE_RATE)
+        assert np.allclose(data[1], np.arange(100, 200) + 2e6)
+        reader.close()
+
+
+def test_fichier_en_cours_ecriture():
+    """Test de l'ouverture d'un fichier encore en cours d'écriture"""
+    with tempfile.TemporaryDirectory() as folder:
+        record_file = BinaryRecordFile(os.path.join(folder, "essai.bin"), CHANNELS,
+                                       sample_rate=SAMPLE_RATE, time_column=False)
+        write_blocks(record_file, 2)
+        record_file.flush()
+
+        reader = BinaryRecordingReader(os.path.join(folder, "essai.bin"))
+        assert reader.n_samples == 200
+
+        write_blocks(record_file, 3, first_index=200)
+        record_file.flush()
+        timestamps, data = reader.read(0.45)
+        assert reader.n_samples == 500
+        assert data.shape == (3, 50)
+        record_file.close()
+        reader.close()
+
+
+def test_entete_reecrit_pendant_lecture():
+    """Test que la relecture de l'en-tête ne voit jamais un en-tête en cours de réécriture"""
+    with tempfile.TemporaryDirectory() as folder:
+        for i in range(100):
+            # L'en-tête est réécrit au premier bloc (origine des temps) et à la fermeture
+            path = os.path.join(folder, f"essai_{i}.bin")
+            record_file = BinaryRecordFile(path, CHANNELS, sample_rate=SAMPLE_RATE, time_column=False)
+            reader = BinaryRecordingReader(path)
+
+            def write():
+                write_blocks(record_file, 3, first_index=500)
+                record_file.close()
+
+            writer = threading.Thread(target=write)
+            writer.start()
+            while writer.is_alive():
+                reader.refresh()
+            writer.join()
+
+            assert reader.refresh() == 300
+            assert reader.header['complete'] and reader.start_time == 0.5
+            reader.close()
+
+        assert len(os.listdir(folder)) == 200  # Aucun fichier temporaire restant
+
+
+def test_entete_occupe():
+    """Test qu'un en-tête verrouillé par un lecteur (Windows) ne fait perdre aucun bloc"""
+    replace = os.replace
+    refused = []
+
+    def occupied_replace(src, dst):
+        # Refus tant que le « lecteur » garde l'en-tête ouvert
+        if refused is not None:
+            refused.append(dst)
+            raise PermissionError(13, "Le fichier est utilisé par un autre processus", dst)
+        replace(src, dst)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "essai.bin")
+        record_file = BinaryRecordFile(path, CHANNELS, sample_rate=SAMPLE_RATE, time_column=False)
+        reader = BinaryRecordingReader(path)
+
+        os.replace = occupied_replace
+        try:
+            write_blocks(record_file, 2, first_index=100)
+            record_file.flush()
+            assert refused  # Remplacement tenté et refusé...
+            assert reader.refresh() == 200  # ...sans perte de données
+            assert reader.start_time == 0.0  # Ancien en-tête, intact
+        finally:
+            refused = None
+            os.replace = replace
+
+        # Fichier libéré : l'en-tête en attente est écrit au bloc suivant
+        write_blocks(record_file, 1, first_index=300)
+        record_file.flush()
+        assert reader.refresh() == 300
+        assert reader.start_time == 0.1
+        timestamps, data = reader.read_samples(0, 300)
+        assert np.allclose(timestamps, np.arange(100, 400) / SAMPLE_RATE)
+        assert np.array_equal(data[0], np.arange(100, 400))
+
+        record_file.close()
+        reader.close()
+        assert sorted(os.listdir(folder)) == ["essai.bin", "essai.json"]
+
+
+def main():
+    """Fonction principale de test"""
+    print("=" * 60)
+    print("Test de l'enregistrement binaire (memory-mapping)")
+    print("=" * 60)
+
+    for test in [test_fenetre_temps_implicite, test_selection_canaux_et_colonne_temps,
+                 test_fichier_en_cours_ecriture, test_entete_reecrit_pendant_lecture,
+                 test_entete_occupe]:
+        test()
+        print(f"  ✓ {test.__doc__}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
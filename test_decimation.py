@@ -0,0 +1,59 @@
+"""
+Script de test pour vérifier la décimation min/max (enveloppe) des graphiques
+"""
+import sys
+import os
+
+import numpy as np
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model.data_model import DataModel
+from utils.config import Config
+
+
+def test_enveloppe_conserve_les_pics():
+    """Test que les pics isolés survivent à la décimation"""
+    model = DataModel(Config())
+    timestamps = np.arange(100003) / 1000.0
+    data = np.random.randn(3, 100003)
+    data[1, 54321] = 50.0
+    data[2, 7] = -50.0
+
+    dec_timestamps, dec_data = model.decimate_minmax(timestamps, data, 800)
+
+    assert dec_data.shape[1] <= 2 * 800
+    assert len(dec_timestamps) == dec_data.shape[1]
+    assert np.all(np.diff(dec_timestamps) >= 0)
+    assert np.array_equal(dec_data.max(axis=1), data.max(axis=1))
+    assert np.array_equal(dec_data.min(axis=1), data.min(axis=1))
+
+
+def test_peu_de_points_inchanges():
+    """Test que les données déjà plus petites que l'enveloppe sont retournées telles quelles"""
+    model = DataModel(Config())
+    timestamps = np.arange(100) / 10.0
+    data = np.random.randn(2, 100)
+
+    dec_timestamps, dec_data = model.decimate_minmax(timestamps, data, 800)
+
+    assert np.array_equal(dec_data, data)
+    assert np.array_equal(dec_timestamps, timestamps)
+
+
+def main():
+    """Fonction principale de test"""
+    print("=" * 60)
+    print("Test de la décimation min/max")
+    print("=" * 60)
+
+    for test in [test_enveloppe_conserve_les_pics, test_peu_de_points_inchanges]:
+        test()
+        print(f"  ✓ {test.__doc__}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
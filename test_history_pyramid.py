@@ -0,0 +1,65 @@
+"""
+Script de test pour vérifier l'historique multi-résolution (graphique longue durée)
+"""
+import sys
+import os
+
+import numpy as np
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model.history_pyramid import HistoryPyramid
+
+
+def test_niveaux_exacts():
+    """Test que chaque niveau résume exactement le niveau précédent (min/max/moyenne)"""
+    history = HistoryPyramid(n_channels=2, level_capacity=1000, factor=10, n_levels=3)
+    values = np.random.randn(2, 1000)
+    for i in range(1000):
+        history.append(float(i), values[:, i])
+
+    timestamps, v_min, v_max, v_mean = history._level_arrays(2)
+    buckets = values.reshape(2, -1, 100)
+    assert np.array_equal(timestamps, np.arange(0, 1000, 100))
+    assert np.array_equal(v_min, buckets.min(axis=2))
+    assert np.array_equal(v_max, buckets.max(axis=2))
+    assert np.allclose(v_mean, buckets.mean(axis=2))
+
+
+def test_tout_l_enregistrement_en_memoire_bornee():
+    """Test qu'un long enregistrement reste visible en entier, pics compris"""
+    history = HistoryPyramid(n_channels=1, level_capacity=500, factor=10, n_levels=5)
+    n = 259200  # 3 jours à 1 point par seconde
+    values = np.sin(np.arange(n) / 1000.0)
+    values[12345] = 40.0
+    for i in range(n):
+        history.append(float(i), values[i:i + 1])
+
+    timestamps, data = history.get_envelope(max_points=400)
+    assert len(timestamps) <= 2 * 400
+    assert timestamps[0] == 0.0
+    assert data.max() == 40.0
+    assert np.isclose(data.min(), values.min())
+
+    # Zoom sur la fin : les points bruts sont retournés
+    level, timestamps, _, _, v_mean = history.get_range(n - 100, n - 1, max_points=400)
+    assert level == 0
+    assert np.array_equal(v_mean[0], values[n - 100:])
+
+
+def main():
+    """Fonction principale de test"""
+    print("=" * 60)
+    print("Test de l'historique multi-résolution")
+    print("=" * 60)
+
+    for test in [test_niveaux_exacts, test_tout_l_enregistrement_en_memoire_bornee]:
+        test()
+        print(f"  ✓ {test.__doc__}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Script de test pour vérifier les politiques de contre-pression du thread d'écriture
+"""
+import sys
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model.record_writer import RecordWriter, SampleTimes, TxtRecordFile, block_start_time
+
+
+class SlowRecordFile:
+    """Fichier d'enregistrement factice dont chaque écriture attend l'ouverture d'une porte"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.writing = threading.Event()
+        self.blocks = []
+        self.time_bases = []
+        self.closed = False
+
+    def write_block(self, timestamps, data):
+        self.writing.set()
+        self.gate.wait()
+        self.blocks.append(int(block_start_time(timestamps)))
+        self.time_bases.append(timestamps)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def block(index, size=10):
+    """Bloc numéroté par son premier timestamp"""
+    return [index] * size, np.full((2, size), float(index))
+
+
+def wait_until(condition, timeout=5.0):
+    """Attend qu'une condition soit vraie"""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < deadline, "Délai dépassé"
+        time.sleep(0.01)
+
+
+def occupy(writer, record_file, index):
+    """Bloque le thread d'écriture sur un bloc : la file ne se vide plus"""
+    record_file.gate.clear()
+    record_file.writing.clear()
+    writer.submit(*block(index))
+    assert record_file.writing.wait(5.0)
+
+
+def spill_files(folder):
+    return [name for name in os.listdir(folder) if name.startswith("logger_spill_")]
+
+
+def test_block():
+    """Test que la politique BLOCK fait attendre l'acquisition sans perte"""
+    record_file = SlowRecordFile()
+    writer = RecordWriter(record_file, queue_size=2, policy="BLOCK")
+    writer.start()
+    occupy(writer, record_file, 0)
+
+    submitter = threading.Thread(target=lambda: [writer.submit(*block(i)) for i in range(1, 6)])
+    submitter.start()
+    time.sleep(0.2)
+    assert submitter.is_alive()  # File pleine : submit attend
+
+    record_file.gate.set()
+    submitter.join(5.0)
+    writer.stop()
+
+    assert record_file.blocks == list(range(6))
+    assert writer.blocked_time > 0
+    assert writer.dropped_blocks == 0 and record_file.closed
+
+
+def test_drop():
+    """Test que la politique DROP abandonne et compte les blocs quand la file est pleine"""
+    record_file = SlowRecordFile()
+    writer = RecordWriter(record_file, queue_size=2, policy="DROP")
+    writer.start()
+    occupy(writer, record_file, 0)
+
+    accepted = [writer.submit(*block(i)) for i in range(1, 6)]
+    assert accepted == [True, True, False, False, False]
+
+    record_file.gate.set()
+    writer.stop()
+
+    stats = writer.get_stats()
+    assert record_file.blocks == [0, 1, 2]
+    assert stats['dropped_blocks'] == 3 and stats['dropped_samples'] == 30
+    assert stats['blocks_written'] == 3
+
+
+def test_spill():
+    """Test que la politique SPILL écrit tous les blocs dans l'ordre et supprime le fichier tampon rattrapé"""
+    with tempfile.TemporaryDirectory() as folder:
+        record_file = SlowRecordFile()
+        writer = RecordWriter(record_file, queue_size=2, policy="SPILL", spill_folder=folder)
+        writer.start()
+        index = 0
+
+        # Deux ralentissements successifs : un fichier tampon par ralentissement
+        for _ in range(2):
+            occupy(writer, record_file, index)
+            for index in range(index + 1, index + 10):
+                writer.submit(*block(index))
+            index += 1
+            assert writer.get_stats()['spill_pending'] == 7
+            assert len(spill_files(folder)) == 1
+
+            record_file.gate.set()
+            wait_until(lambda: len(record_file.blocks) == index)
+            wait_until(lambda: not spill_files(folder))
+            assert writer.get_stats()['spill_pending'] == 0
+
+        # Retour au fonctionnement normal, par la file (sans la remplir)
+        for index in range(index, index + 2):
+            writer.submit(*block(index))
+        writer.stop()
+
+        assert record_file.blocks == list(range(index + 1))
+        assert writer.spilled_blocks == 14 and writer.dropped_blocks == 0
+        assert not spill_files(folder)
+
+
+def test_base_de_temps_implicite():
+    """Test que SampleTimes traverse la file et le fichier tampon sans construire de timestamps"""
+    with tempfile.TemporaryDirectory() as folder:
+        record_file = SlowRecordFile()
+        writer = RecordWriter(record_file, queue_size=2, policy="SPILL", spill_folder=folder)
+        writer.start()
+        record_file.gate.clear()
+        record_file.writing.clear()
+        writer.submit(SampleTimes(0, 1.0), np.zeros((2, 10)))
+        assert record_file.writing.wait(5.0)
+        for i in range(1, 6):
+            writer.submit(SampleTimes(10 * i, 1.0), np.zeros((2, 10)))
+        assert writer.get_stats()['spill_pending'] == 3
+
+        record_file.gate.set()
+        writer.stop()
+
+        assert record_file.blocks == list(range(0, 60, 10))
+        assert record_file.time_bases == [SampleTimes(10 * i, 1.0) for i in range(6)]
+
+        # Fichier texte : la colonne Temps est construite à l'écriture
+        path = os.path.join(folder, "essai.txt")
+        txt_file = TxtRecordFile(path, ["Temps", "A"], precision=6, time_decimals=3)
+        txt_file.write_block(SampleTimes(4, 2.0), np.array([[1.0, 2.0, 3.0]]))
+        txt_file.close()
+        with open(path, encoding='utf-8') as f:
+            assert f.read().splitlines()[1:] == ["2.000\t1", "2.500\t2", "3.000\t3"]
+
+
+def test_arret_borne():
+    """Test que stop() rend la main et signale l'échec si le thread d'écriture reste bloqué"""
+    record_file = SlowRecordFile()
+    writer = RecordWriter(record_file, queue_size=2, policy="BLOCK", stop_timeout=0.3)
+    writer.start()
+    occupy(writer, record_file, 0)
+    for i in range(1, 3):
+        writer.submit(*block(i))
+
+    start = time.perf_counter()
+    assert writer.stop() is False
+    assert time.perf_counter() - start < 2.0
+    assert not record_file.closed  # Le thread bloqué possède encore le fichier
+
+    # Thread d'écriture arrêté : submit abandonne le bloc au lieu d'attendre une place
+    assert writer.submit(*block(3)) is False
+    assert writer.dropped_blocks == 1
+    record_file.gate.set()
+
+
+def main():
+    """Fonction principale de test"""
+    print("=" * 60)
+    print("Test du thread d'écriture (contre-pression)")
+    print("=" * 60)
+
+    for test in [test_block, test_drop, test_spill, test_base_de_temps_implicite, test_arret_borne]:
+        test()
+        print(f"  ✓ {test.__doc__}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
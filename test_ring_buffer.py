@@ -0,0 +1,109 @@
+"""
+Script de test pour vérifier le buffer circulaire de la fenêtre instantanée
+"""
+import sys
+import os
+import threading
+
+import numpy as np
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model.ring_buffer import RingBuffer
+
+
+def test_remplissage_partiel():
+    """Test d'une fenêtre pas encore pleine"""
+    buffer = RingBuffer(n_channels=2, capacity=10, sample_rate=10.0)
+    data = np.arange(8, dtype=np.float64).reshape(2, 4)
+    buffer.write(data)
+
+    assert len(buffer) == 4
+    assert np.array_equal(buffer.get_data(), data)
+    assert np.allclose(buffer.get_timestamps(), [0.0, 0.1, 0.2, 0.3])
+
+
+def test_repli_conserve_ordre():
+    """Test du repli en fin de buffer : la fenêtre reste ordonnée"""
+    buffer = RingBuffer(n_channels=3, capacity=7, sample_rate=1.0)
+    reference = np.empty((3, 0))
+    total = 0
+
+    for batch_size in [3, 5, 1, 6, 2, 4]:
+        block = np.random.rand(3, batch_size)
+        total += batch_size
+        buffer.write(block)
+        reference = np.concatenate((reference, block), axis=1)[:, -7:]
+
+        assert np.array_equal(buffer.get_data(), reference)
+        assert buffer.get_start_index() == total - reference.shape[1]
+        assert np.array_equal(buffer.get_timestamps(), np.arange(total - reference.shape[1], total))
+
+
+def test_bloc_plus_grand_que_capacite():
+    """Test d'un bloc plus grand que la capacité : seuls les derniers points restent"""
+    buffer = RingBuffer(n_channels=1, capacity=5, sample_rate=1.0)
+    data = np.arange(12, dtype=np.float64).reshape(1, -1)
+    buffer.write(data)
+
+    assert np.array_equal(buffer.get_data(), data[:, -5:])
+    assert np.array_equal(buffer.get_timestamps(), np.arange(7, 12))
+
+
+def test_vue_sans_copie():
+    """Test que la lecture retourne une vue en lecture seule (pas de copie)"""
+    buffer = RingBuffer(n_channels=2, capacity=4, sample_rate=10.0)
+    buffer.write(np.ones((2, 6)))
+
+    view = buffer.get_data()
+    assert np.shares_memory(view, buffer._data)
+    assert not view.flags.writeable
+
+
+def test_snapshot_coherent_pendant_ecriture():
+    """Test que snapshot() reste cohérent pendant les écritures d'un autre thread"""
+    buffer = RingBuffer(n_channels=2, capacity=1000, sample_rate=1.0)
+    stop = threading.Event()
+
+    def writer():
+        index = 0
+        while not stop.is_set():
+            # Chaque point vaut son indice absolu : une image déchirée serait détectée
+            block = np.arange(index, index + 37, dtype=np.float64)
+            buffer.write(np.vstack((block, -block)))
+            index += 37
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        last_version = -1
+        for _ in range(200):
+            start_index, data, version = buffer.snapshot()
+            assert version >= last_version
+            last_version = version
+            expected = np.arange(start_index, start_index + data.shape[1])
+            assert np.array_equal(data[0], expected)
+            assert np.array_equal(data[1], -expected)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def main():
+    """Fonction principale de test"""
+    print("=" * 60)
+    print("Test du buffer circulaire (fenêtre instantanée)")
+    print("=" * 60)
+
+    for test in [test_remplissage_partiel, test_repli_conserve_ordre,
+                 test_bloc_plus_grand_que_capacite, test_vue_sans_copie,
+                 test_snapshot_coherent_pendant_ecriture]:
+        test()
+        print(f"  ✓ {test.__doc__}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
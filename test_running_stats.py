@@ -0,0 +1,101 @@
+"""
+Script de test pour vérifier les statistiques glissantes (Welford par bloc)
+"""
+import sys
+import os
+
+import numpy as np
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model.running_stats import RunningStatistics, PeriodAggregator
+
+
+def test_tout_l_enregistrement():
+    """Test que le cumul par blocs donne les statistiques du tableau complet"""
+    stats = RunningStatistics(n_channels=3)
+    data = 1000.0 + np.random.randn(3, 5000)  # Moyenne élevée : vérifie la stabilité numérique
+    for start in range(0, 5000, 137):
+        stats.update(data[:, start:start + 137])
+
+    result = stats.get_statistics()
+    assert result['count'] == 5000
+    assert np.allclose(result['mean'], data.mean(axis=1))
+    assert np.allclose(result['std'], data.std(axis=1))
+    assert np.array_equal(result['min'], data.min(axis=1))
+    assert np.array_equal(result['max'], data.max(axis=1))
+    assert np.allclose(result['rms'], np.sqrt(np.mean(data ** 2, axis=1)))
+
+
+def test_fenetre_glissante():
+    """Test que la fenêtre glissante ne garde que les derniers blocs"""
+    stats = RunningStatistics(n_channels=1, window_samples=300)
+    data = np.random.randn(1, 2000)
+    data[0, 10] = 100.0  # Pic ancien, hors de la fenêtre à la fin
+    for start in range(0, 2000, 100):
+        stats.update(data[:, start:start + 100])
+
+    result = stats.get_statistics(window=True)
+    recent = data[:, -result['count']:]
+    assert 300 <= result['count'] < 400
+    assert np.allclose(result['mean'], recent.mean(axis=1))
+    assert np.allclose(result['std'], recent.std(axis=1))
+    assert result['max'][0] == recent.max()
+    assert stats.get_statistics()['max'][0] == 100.0
+
+
+def test_fenetre_incrementale():
+    """Test que les cumuls de la fenêtre suivent un recalcul complet, bloc après bloc"""
+    rng = np.random.default_rng(0)
+    stats = RunningStatistics(n_channels=2, window_samples=500)
+    data = 1000.0 + rng.standard_normal((2, 20000)) * np.linspace(0.1, 10.0, 20000)
+    start = 0
+    while start < data.shape[1]:
+        block = data[:, start:start + int(rng.integers(1, 200))]
+        stats.update(block)
+        start += block.shape[1]
+
+        result = stats.get_statistics(window=True)
+        recent = data[:, max(start - result['count'], 0):start]
+        assert result['count'] == recent.shape[1] and result['count'] >= min(start, 500)
+        assert np.allclose(result['mean'], recent.mean(axis=1))
+        assert np.allclose(result['std'], recent.std(axis=1))
+        assert np.array_equal(result['min'], recent.min(axis=1))
+        assert np.array_equal(result['max'], recent.max(axis=1))
+        assert np.allclose(result['rms'], np.sqrt(np.mean(recent ** 2, axis=1)))
+
+
+def test_agregation_par_periode():
+    """Test que chaque période résume exactement ses points, blocs coupés aux frontières"""
+    aggregator = PeriodAggregator(n_channels=2, period_samples=250)
+    data = np.random.randn(2, 1000)
+    periods = []
+    for start in range(0, 1000, 137):
+        periods += aggregator.add(data[:, start:start + 137], start)
+
+    assert [start for start, _ in periods] == [0, 250, 500, 750]
+    for start, values in periods:
+        chunk = data[:, start:start + 250]
+        assert np.allclose(values[:, 0], chunk.mean(axis=1))
+        assert np.array_equal(values[:, 1], chunk.min(axis=1))
+        assert np.array_equal(values[:, 2], chunk.max(axis=1))
+        assert np.allclose(values[:, 3], np.sqrt(np.mean(chunk ** 2, axis=1)))
+
+
+def main():
+    """Fonction principale de test"""
+    print("=" * 60)
+    print("Test des statistiques glissantes")
+    print("=" * 60)
+
+    for test in [test_tout_l_enregistrement, test_fenetre_glissante, test_fenetre_incrementale,
+                 test_agregation_par_periode]:
+        test()
+        print(f"  ✓ {test.__doc__}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
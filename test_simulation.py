@@ -0,0 +1,286 @@
+"""
+Script de test pour vérifier la tâche DAQ simulée
+"""
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model.daq_model import DAQModel
+from model.multi_task import MultiTaskSession
+from model.recording_reader import BinaryRecordingReader
+from model.simulation import SimulatedTask
+from utils.config import Config
+
+
+def test_signaux_deterministes():
+    """Test que les signaux ne dépendent pas de la taille des lectures"""
+    whole = SimulatedTask(n_channels=6, sample_rate=1000.0, realtime=False)
+    chunked = SimulatedTask(n_channels=6, sample_rate=1000.0, realtime=False)
+
+    reference = np.empty((6, 3000))
+    whole.create_reader().read_many_sample(reference, 3000)
+
+    data = np.empty((6, 3000))
+    reader = chunked.create_reader()
+    for start in range(0, 3000, 250):
+        block = np.empty((6, 250))
+        reader.read_many_sample(block, 250)
+        data[:, start:start + 250] = block
+
+    assert np.array_equal(data, reference)
+    # Canal "spikes" : un pic d'amplitude pleine par seconde
+    assert np.count_nonzero(reference[3] == 5.0) == 3
+    # Canal "steps" : quatre niveaux
+    assert len(np.unique(reference[2])) == 4
+
+
+def test_acquisition_simulee():
+    """Test d'une acquisition complète par DAQModel sur la tâche simulée"""
+    config = Config()
+    config.SIMULATION_CHANNELS = 3
+    model = DAQModel(config)
+
+    assert model.start_acquisition(task_name=config.SIMULATION_TASK_NAME)
+    time.sleep(0.5)
+    model.stop_acquisition()
+
+    assert model.get_channel_count() == 3
+    assert model.total_samples_acquired > 0
+    timestamps, data, version = model.get_instantane_snapshot()
+    assert data.shape == (3, len(timestamps))
+
+
+def run_engine(engine, duration=0.6):
+    """Acquisition simulée à 5 kHz avec le moteur demandé ; retourne (modèle, tailles des blocs reçus)"""
+    config = Config()
+    config.HIGH_RATE_ENABLED = True
+    config.HIGH_RATE_SAMPLE_RATE = 5000.0
+    config.ACQUISITION_ENGINE = engine
+    model = DAQModel(config)
+    blocks = []
+
+    assert model.start_acquisition(data_callback=lambda data: blocks.append(data.shape[1]),
+                                   task_name=config.SIMULATION_TASK_NAME)
+    time.sleep(duration)
+    model.stop_acquisition()
+    return model, blocks
+
+
+def test_moteur_evenementiel():
+    """Test que le moteur EVENT livre les mêmes points que le moteur POLLING, avec des latences cohérentes"""
+    results = {engine: run_engine(engine) for engine in ("POLLING", "EVENT")}
+
+    for engine, (model, blocks) in results.items():
+        stats = model.get_engine_stats()
+        assert stats['engine'] == engine
+        # Un callback par lecture, et tous les points lus sont livrés
+        assert len(blocks) == stats['events'] == model.get_metrics()['stages']['block']['count'] > 0
+        assert sum(blocks) == stats['samples'] == model.total_samples_acquired
+        assert 0.0 <= stats['latency_mean_ms'] <= stats['latency_p99_ms'] <= stats['latency_max_ms'] < 100.0
+        assert stats['processing_mean_ms'] > 0.0
+
+    # EVENT : exactement N points par événement, et le même débit que la scrutation
+    event_model, event_blocks = results["EVENT"]
+    polling_model, polling_blocks = results["POLLING"]
+    assert set(event_blocks) == {event_model.samples_per_read}
+    assert abs(sum(event_blocks) - sum(polling_blocks)) <= 3 * event_model.samples_per_read
+
+
+def test_erreur_callback_evenementiel():
+    """Test qu'une erreur dans le callback EVENT arrête la tâche et désenregistre le callback"""
+    config = Config()
+    config.HIGH_RATE_ENABLED = True
+    config.HIGH_RATE_SAMPLE_RATE = 5000.0
+    config.ACQUISITION_ENGINE = "EVENT"
+    model = DAQModel(config)
+    calls = []
+
+    def failing_callback(data):
+        calls.append(data.shape[1])
+        raise RuntimeError("Erreur simulée")
+
+    assert model.start_acquisition(data_callback=failing_callback, task_name=config.SIMULATION_TASK_NAME)
+    task = model.task
+    deadline = time.perf_counter() + 5.0
+    while model.is_running and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.2)
+
+    assert not model.is_running and len(calls) == 1
+    assert not task._running and task._callback is None  # Plus d'acquisition ni d'appel au callback
+    model.stop_acquisition()
+    assert model.task is None
+
+
+def test_enregistrement_pendant_acquisition():
+    """Test qu'un enregistrement démarré en cours d'acquisition contient tous les points depuis le premier"""
+    config = Config()
+    config.HIGH_RATE_ENABLED = True
+    config.HIGH_RATE_SAMPLE_RATE = 5000.0
+    config.SAVE_FORMAT = "BIN"
+    config.RECORD_MODE = "FULL_RATE"
+    model = DAQModel(config)
+
+    with tempfile.TemporaryDirectory() as folder:
+        assert model.start_acquisition(task_name=config.SIMULATION_TASK_NAME)
+        try:
+            time.sleep(0.2)
+            model.start_recording(record_period=0.1, save_folder=folder)
+            time.sleep(0.4)
+        finally:
+            model.stop_acquisition()
+        result = model.stop_recording()
+
+        reader = BinaryRecordingReader(result['full_rate_filepath'])
+        n_samples = reader.n_samples
+        timestamps, data = reader.read_samples(0, n_samples)
+        timestamps, data = timestamps.copy(), data.copy()
+        reader.close()
+
+    # Tous les points comptés depuis le début de l'enregistrement sont écrits, à partir de t = 0
+    assert n_samples == model.total_samples_acquired > 0
+    assert timestamps[0] == 0.0
+    assert model.recording_time_origin is not None
+
+    # Et ce sont les points de la tâche à partir de l'indice du premier point enregistré
+    start = model.get_engine_stats()['samples'] - model.total_samples_acquired
+    reference = SimulatedTask(n_channels=config.SIMULATION_CHANNELS, sample_rate=5000.0, realtime=False)
+    expected = np.empty((config.SIMULATION_CHANNELS, start + n_samples))
+    reference.create_reader().read_many_sample(expected, expected.shape[1])
+    assert np.array_equal(data, expected[:, start:].astype(data.dtype))
+
+
+def test_ecriture_bloquee_hors_verrou():
+    """Test qu'une file d'écriture pleine (BLOCK) ne bloque pas la lecture de l'historique"""
+    config = Config()
+    config.HIGH_RATE_ENABLED = True
+    config.HIGH_RATE_SAMPLE_RATE = 5000.0
+    config.RECORD_MODE = "FULL_RATE"
+    config.WRITER_BACKPRESSURE = "BLOCK"
+    config.WRITER_QUEUE_SIZE = 1
+    model = DAQModel(config)
+    gate = threading.Event()
+
+    with tempfile.TemporaryDirectory() as folder:
+        assert model.start_acquisition(task_name=config.SIMULATION_TASK_NAME)
+        try:
+            model.start_recording(record_period=0.1, save_folder=folder)
+            # Stockage figé : le thread d'écriture attend, la file se remplit, le dépôt attend
+            record_file = model.full_rate_writer.record_file
+            write_block = record_file.write_block
+            record_file.write_block = lambda timestamps, data: (gate.wait(), write_block(timestamps, data))
+            time.sleep(0.4)
+            blocked_at = model.total_samples_acquired
+
+            start = time.perf_counter()
+            model.get_longue_duree_data()
+            assert time.perf_counter() - start < 0.1
+            time.sleep(0.2)
+            assert model.total_samples_acquired == blocked_at  # L'acquisition attend bien la file
+        finally:
+            gate.set()
+            model.stop_recording()
+            model.stop_acquisition()
+
+
+def test_rattrapage_backlog():
+    """Test qu'un traitement bloqué est rattrapé par une lecture agrandie"""
+    config = Config()
+    config.HIGH_RATE_ENABLED = True
+    config.HIGH_RATE_SAMPLE_RATE = 10000.0
+    model = DAQModel(config)
+    blocks = []
+
+    def slow_callback(data):
+        blocks.append(data.shape[1])
+        if len(blocks) == 5:
+            time.sleep(0.4)  # Le backlog DAQmx s'accumule pendant ce temps
+
+    assert model.start_acquisition(data_callback=slow_callback, task_name=config.SIMULATION_TASK_NAME)
+    time.sleep(1.2)
+    backlog = model.task.available_samples()
+    model.stop_acquisition()
+
+    stats = model.get_engine_stats()
+    assert stats['adapted_reads'] >= 1
+    assert model.samples_per_read < stats['max_read_size'] <= model.max_samples_per_read
+    assert max(blocks) == stats['max_read_size']
+    assert backlog < 2 * model.samples_per_read  # Rattrapé avant la fin
+
+
+def test_session_multi_taches():
+    """Test de l'enregistrement simultané de deux tâches avec manifeste de session"""
+    config = Config()
+    session = MultiTaskSession(config, [config.SIMULATION_TASK_NAME] * 2)
+    assert list(session.models) == ["Simulation", "Simulation_2"]
+
+    with tempfile.TemporaryDirectory() as folder:
+        assert session.start_acquisition()
+        try:
+            manifest_path = session.start_recording(record_period=0.1, save_folder=folder)
+            time.sleep(0.5)
+            results = session.stop_recording()
+        finally:
+            session.stop_acquisition()
+
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        assert results['manifest'] == manifest_path
+        assert [task['label'] for task in manifest['tasks']] == ["Simulation", "Simulation_2"]
+        for task in manifest['tasks']:
+            assert task['time_offset_s'] is not None and task['time_offset_s'] >= 0
+            assert task['periodic_samples'] > 0
+            assert os.path.exists(os.path.join(folder, task['summary_file']))
+
+
+def test_decalages_session_en_cours_acquisition():
+    """Test que le manifeste donne un décalage numérique par tâche pour des enregistrements successifs"""
+    config = Config()
+    config.HIGH_RATE_ENABLED = True
+    config.HIGH_RATE_SAMPLE_RATE = 5000.0
+    session = MultiTaskSession(config, [config.SIMULATION_TASK_NAME] * 2)
+
+    with tempfile.TemporaryDirectory() as folder:
+        assert session.start_acquisition()
+        try:
+            for i in range(3):
+                time.sleep(0.1)  # Enregistrement démarré pendant l'acquisition
+                session.start_recording(file_prefix=f"essai{i}", record_period=0.1, save_folder=folder)
+                time.sleep(0.2)
+                manifest_path = session.stop_recording()['manifest']
+
+                with open(manifest_path, encoding='utf-8') as f:
+                    offsets = [task['time_offset_s'] for task in json.load(f)['tasks']]
+                assert all(isinstance(offset, float) for offset in offsets)
+                assert min(offsets) == 0.0
+        finally:
+            session.stop_acquisition()
+
+
+def main():
+    """Fonction principale de test"""
+    print("=" * 60)
+    print("Test de la tâche DAQ simulée")
+    print("=" * 60)
+
+    for test in [test_signaux_deterministes, test_acquisition_simulee, test_moteur_evenementiel,
+                 test_erreur_callback_evenementiel, test_enregistrement_pendant_acquisition,
+                 test_ecriture_bloquee_hors_verrou,
+                 test_rattrapage_backlog, test_session_multi_taches,
+                 test_decalages_session_en_cours_acquisition]:
+        test()
+        print(f"  ✓ {test.__doc__}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Script de test pour vérifier les histogrammes de durée des étapes d'acquisition
+"""
+import sys
+import os
+import json
+import tempfile
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.stage_metrics import StageMetrics
+
+
+def test_statistiques():
+    """Test que moyenne, maximum et percentiles (à un facteur 2 près) sont corrects"""
+    metrics = StageMetrics(["read", "record"])
+    for _ in range(99):
+        metrics.add("read", 10_000)  # 10 µs
+    metrics.add("read", 5_000_000)  # 5 ms
+
+    stats = metrics.snapshot()
+    assert stats['read']['count'] == 100
+    assert stats['record']['count'] == 0
+    assert abs(stats['read']['mean_ms'] - (99 * 0.01 + 5.0) / 100) < 1e-9
+    assert stats['read']['max_ms'] == 5.0
+    assert stats['read']['last_ms'] == 5.0
+    assert 0.01 <= stats['read']['p50_ms'] < 0.02
+    assert 0.01 <= stats['read']['p99_ms'] < 0.02
+
+    metrics.reset()
+    assert metrics.snapshot()['read']['count'] == 0
+
+
+def test_export_json():
+    """Test que l'export contient les statistiques et les histogrammes bruts"""
+    metrics = StageMetrics(["block"], n_buckets=8)
+    metrics.add("block", 10 ** 12)  # Hors échelle : dernière classe
+    with tempfile.TemporaryDirectory() as folder:
+        filepath = os.path.join(folder, "metrics.json")
+        metrics.dump(filepath, extra={'sample_rate': 1000.0})
+        with open(filepath, encoding='utf-8') as f:
+            content = json.load(f)
+
+    assert content['sample_rate'] == 1000.0
+    assert content['stages']['block']['count'] == 1
+    assert content['histograms']['counts']['block'][-1] == 1
+
+
+def main():
+    """Fonction principale de test"""
+    print("=" * 60)
+    print("Test des métriques du chemin critique")
+    print("=" * 60)
+
+    for test in [test_statistiques, test_export_json]:
+        test()
+        print(f"  ✓ {test.__doc__}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,12 +22,59 @@ class Config:
     # Timeout pour la lecture (secondes)
     TIMEOUT = 1.0
     
+    # Moteur d'acquisition: "POLLING" (boucle de lecture dans un thread)
+    # ou "EVENT" (callback DAQmx tous les N points, N = taille du bloc lu)
+    ACQUISITION_ENGINE = "POLLING"
+    
+    # Nombre de latences conservées pour les statistiques du moteur d'acquisition
+    LATENCY_HISTORY_SIZE = 10000
+    
+    # Écrire les durées des étapes d'acquisition (histogrammes) dans <fichier>_metrics.json
+    # à l'arrêt de l'enregistrement
+    METRICS_DUMP_ON_STOP = False
+    
     # Historique du graphique instantané (en secondes)
     INSTANT_HISTORY_SECONDS = 60  # 1 minute
     INSTANT_MAX_SAMPLES = SAMPLE_RATE * INSTANT_HISTORY_SECONDS  # 600 points à 10Hz
     
-    # Historique du graphique longue durée (nombre de points maximum)
-    MAX_LONGUE_DUREE_SAMPLES = 1000  # 100 000 points max (évite la saturation mémoire)
+    # ========== MODE HAUTE FRÉQUENCE ==========
+    
+    # Activer l'acquisition haute fréquence (vibrations, transitoires)
+    HIGH_RATE_ENABLED = False
+    
+    # Fréquence d'échantillonnage par canal en mode haute fréquence (Hz)
+    HIGH_RATE_SAMPLE_RATE = 10000.0
+    
+    # Plage autorisée en mode haute fréquence (Hz)
+    HIGH_RATE_MIN = 1000.0
+    HIGH_RATE_MAX = 100000.0
+    
+    # Durée couverte par chaque lecture (secondes) -> taille du bloc lu
+    READ_CHUNK_DURATION = 0.05  # 50 ms par lecture (20 lectures/s)
+    
+    # Taille de lecture adaptative (moteur POLLING) : en retard, lire d'un coup tout le
+    # backlog DAQmx, dans la limite de READ_CHUNK_MAX_DURATION secondes ; à jour, lire
+    # des blocs normaux (SAMPLES_PER_READ, ou READ_CHUNK_DURATION en haute fréquence)
+    ADAPTIVE_READ_ENABLED = True
+    READ_CHUNK_MAX_DURATION = 1.0
+    
+    # Durée couverte par le buffer d'entrée DAQmx (secondes)
+    INPUT_BUFFER_DURATION = 10.0
+    
+    # Nombre maximum de points de la fenêtre instantanée en mode haute fréquence
+    HIGH_RATE_INSTANT_MAX_SAMPLES = 200000
+    
+    # Durée de la fenêtre glissante des statistiques affichées (secondes)
+    STATISTICS_WINDOW_DURATION = 10.0
+    
+    # Nombre maximum d'entrées tracées sur le graphique longue durée
+    MAX_LONGUE_DUREE_SAMPLES = 1000
+    
+    # Historique longue durée multi-résolution : entrées par niveau, facteur entre
+    # niveaux et nombre de niveaux (le dernier couvre 4000 x 10^6 périodes)
+    LONG_HISTORY_LEVEL_CAPACITY = 4000
+    LONG_HISTORY_FACTOR = 10
+    LONG_HISTORY_LEVELS = 7
     
     # Plage de tension
     MIN_VOLTAGE = -10.0
@@ -50,18 +97,73 @@ class Config:
     # 0 = pas d'enregistrement automatique
     DEFAULT_RECORD_PERIOD = 60  # 60 secondes par défaut
     
+    # Mode d'enregistrement:
+    # "DECIMATED" = un point par période d'enregistrement
+    # "FULL_RATE" = tous les points acquis, sans perte (essais transitoires)
+    RECORD_MODE = "DECIMATED"
+    
+    # En mode FULL_RATE, écrire aussi le fichier résumé (un point par période)
+    FULL_RATE_SUMMARY_ENABLED = True
+    
+    # Fichier résumé : moyenne, min, max et RMS de tous les points de chaque période
+    # au lieu de la valeur instantanée du premier point (réglable dans l'interface)
+    RECORD_AVERAGE_ENABLED = False
+    
+    # Chiffres significatifs des valeurs dans le fichier pleine cadence (format texte)
+    FULL_RATE_TXT_PRECISION = 9
+    
     # ========== PARAMÈTRES D'AFFICHAGE ==========
     
     # Durée d'affichage du graphique instantané (secondes)
     INSTANT_DISPLAY_DURATION = 1.0
     
+    # Rendu des graphiques par blitting (False = redessin complet à chaque trame)
+    PLOT_USE_BLIT = True
+    
+    # Décimation min/max des courbes à environ 2 points par pixel de largeur
+    PLOT_ENVELOPE_ENABLED = True
+    
+    # Marge de l'axe x du graphique longue durée, élargi par paliers (1.25 = +25 %)
+    LONG_PLOT_XLIM_GROWTH = 1.25
+    
+    # Préparation des trames (décimation, échelle) dans un thread dédié
+    # (False = préparation dans le thread de l'interface)
+    PLOT_WORKER_ENABLED = True
+    
+    # Rafraîchissement adaptatif de l'interface (secondes) : période minimale,
+    # période maximale, période lorsque la fenêtre est réduite, et rapport
+    # minimal entre la période et le coût mesuré d'une mise à jour
+    GUI_REFRESH_MIN_PERIOD = 0.1
+    GUI_REFRESH_MAX_PERIOD = 1.0
+    GUI_REFRESH_MINIMIZED_PERIOD = 1.0
+    GUI_REFRESH_COST_FACTOR = 3.0
+    
     # Facteur de décimation pour l'affichage longue durée
     DECIMATION_FACTOR = 10
     
     # ========== PARAMÈTRES DE SAUVEGARDE ==========
     
     # Format de sauvegarde
-    SAVE_FORMAT = "CSV"  # Options: "CSV", "TDMS"
+    # "TXT" (texte tabulé, "CSV" accepté), "BIN" (binaire brut + en-tête JSON),
+    # "TDMS" (nécessite le paquet npTDMS)
+    SAVE_FORMAT = "TXT"
+    
+    # Type des valeurs en format BIN ("float64" ou "float32")
+    BIN_DTYPE = "float64"
+    
+    # Taille de la file d'écriture (nombre de blocs en attente)
+    WRITER_QUEUE_SIZE = 256
+    
+    # Politique quand la file d'écriture est pleine (stockage trop lent):
+    # "BLOCK" (l'acquisition attend), "DROP" (blocs perdus et comptés),
+    # "SPILL" (débordement dans un fichier tampon sur disque local)
+    WRITER_BACKPRESSURE = "SPILL"
+    
+    # Dossier local du fichier tampon (None = dossier temporaire du système)
+    WRITER_SPILL_FOLDER = None
+    
+    # Délai maximal (secondes) pour vider la file et arrêter le thread d'écriture
+    WRITER_STOP_TIMEOUT = 30.0
     
     # Dossier de sauvegarde par défaut
     DEFAULT_SAVE_FOLDER = "data"
@@ -72,13 +174,33 @@ class Config:
     # ========== MODE SIMULATION ==========
     
     # Activer le mode simulation si aucune carte DAQ n'est détectée
+    # (la tâche simulée est alors proposée dans la liste des tâches)
     ENABLE_SIMULATION = True
     
-    # Fréquence du signal simulé (Hz)
-    SIMULATION_FREQUENCY = 10.0
+    # Nom de la tâche simulée (utilisable aussi avec une carte, ex: headless_logger.py --task Simulation)
+    SIMULATION_TASK_NAME = "Simulation"
+    
+    # Nombre de canaux simulés
+    SIMULATION_CHANNELS = 4
+    
+    # Formes d'onde attribuées aux canaux à tour de rôle ("sine", "noise", "steps", "spikes")
+    SIMULATION_WAVEFORMS = ("sine", "noise", "steps", "spikes")
+    
+    # Fréquence du signal simulé (Hz), None = fréquence d'échantillonnage / 100
+    # (une fréquence fixe égale à la fréquence d'échantillonnage donnerait un sinus nul)
+    SIMULATION_FREQUENCY = None
     
     # Amplitude du signal simulé
     SIMULATION_AMPLITUDE = 5.0
+    
+    # Cadence temps réel (False = points produits aussi vite que possible, pour les benchmarks)
+    SIMULATION_REALTIME = True
+    
+    # Graine du bruit simulé
+    SIMULATION_SEED = 0
+    
+    # Intervalle entre deux pics simulés (secondes)
+    SIMULATION_SPIKE_PERIOD = 1.0
 
 
 # Instance globale de configuration
@@ -1,8 +1,8 @@
 """
 Utilitaires DAQmx - Fonctions pour lister et gérer les tâches
+
+nidaqmx est importé à la demande : le démarrage de l'application n'en dépend pas.
 """
-import nidaqmx
-from nidaqmx.system import System
 
 
 def list_available_tasks():
@@ -13,6 +13,7 @@ def list_available_tasks():
         list: Liste des noms de tâches disponibles
     """
     try:
+        from nidaqmx.system import System
         system = System.local()
         tasks = system.tasks
         task_names = [task.name for task in tasks]
@@ -34,6 +35,7 @@ def get_task_channels(task_name):
         list: Liste des noms de canaux
     """
     try:
+        import nidaqmx
         with nidaqmx.Task(task_name) as task:
             channels = [channel.name for channel in task.ai_channels]
             return channels
@@ -50,6 +52,7 @@ def list_available_devices():
         list: Liste des noms de périphériques
     """
     try:
+        from nidaqmx.system import System
         system = System.local()
         devices = system.devices
         device_names = [device.name for device in devices]
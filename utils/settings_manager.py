@@ -21,6 +21,7 @@ class SettingsManager:
         self.settings = {
             'task_name': '',
             'record_period': 60,
+            'average_enabled': False,
             'file_prefix': 'data',
             'file_comment': '',
             'last_save_folder': 'data',
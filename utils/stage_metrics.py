@@ -0,0 +1,120 @@
+"""
+Métriques du chemin critique - Durée de chaque étape de l'acquisition en histogrammes fixes
+"""
+import json
+
+import numpy as np
+
+
+class StageMetrics:
+    """
+    Histogrammes de durée par étape (lecture, buffer, enregistrement, callback...)
+
+    Chaque durée (perf_counter_ns) est rangée dans un histogramme à classes
+    logarithmiques : la classe k couvre [base x 2^(k-1), base x 2^k[ ns. Les
+    compteurs sont des tableaux alloués une fois : add() ne fait aucune
+    allocation et peut rester actif en permanence dans la boucle d'acquisition.
+
+    Les percentiles sont estimés par la borne haute de leur classe (précision
+    d'un facteur 2) ; moyenne, maximum et dernière durée sont exacts.
+
+    add() est appelé par le seul thread d'acquisition ; une lecture concurrente
+    (interface) peut voir une étape en retard d'une mesure, sans conséquence.
+    """
+
+    def __init__(self, stages, n_buckets=32, base_ns=1000):
+        """
+        Initialise les histogrammes
+
+        Args:
+            stages: Noms des étapes, dans l'ordre d'affichage
+            n_buckets: Nombre de classes par histogramme
+            base_ns: Borne haute de la première classe en ns (1 µs par défaut)
+        """
+        self.stages = list(stages)
+        self.n_buckets = n_buckets
+        self.base_ns = base_ns
+        self._index = {stage: i for i, stage in enumerate(self.stages)}
+
+        shape = (len(self.stages), n_buckets)
+        self._counts = np.zeros(shape, dtype=np.int64)
+        self._total_ns = np.zeros(len(self.stages), dtype=np.int64)
+        self._max_ns = np.zeros(len(self.stages), dtype=np.int64)
+        self._last_ns = np.zeros(len(self.stages), dtype=np.int64)
+
+        # Borne haute de chaque classe en ms (la dernière classe recueille tout le reste)
+        self._upper_ms = base_ns * 2.0 ** np.arange(n_buckets) / 1e6
+
+    def add(self, stage, duration_ns):
+        """
+        Enregistre la durée d'une étape
+
+        Args:
+            stage: Nom de l'étape
+            duration_ns: Durée en nanosecondes (différence de perf_counter_ns)
+        """
+        i = self._index[stage]
+        bucket = min((duration_ns // self.base_ns).bit_length(), self.n_buckets - 1)
+        self._counts[i, bucket] += 1
+        self._total_ns[i] += duration_ns
+        self._last_ns[i] = duration_ns
+        if duration_ns > self._max_ns[i]:
+            self._max_ns[i] = duration_ns
+
+    def reset(self):
+        """Remet tous les compteurs à zéro"""
+        self._counts[:] = 0
+        self._total_ns[:] = 0
+        self._max_ns[:] = 0
+        self._last_ns[:] = 0
+
+    def _percentile(self, counts, total, q):
+        """
+        Borne haute de la classe contenant le quantile q (0-1)
+        """
+        bucket = int(np.searchsorted(np.cumsum(counts), q * total))
+        return float(self._upper_ms[min(bucket, self.n_buckets - 1)])
+
+    def snapshot(self):
+        """
+        Retourne les statistiques de chaque étape
+
+        Returns:
+            dict: Pour chaque étape : 'count', 'mean_ms', 'p50_ms', 'p99_ms', 'max_ms', 'last_ms'
+        """
+        counts = self._counts.copy()
+        totals = self._total_ns.copy()
+        result = {}
+        for i, stage in enumerate(self.stages):
+            count = int(counts[i].sum())
+            stats = {'count': count, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p99_ms': 0.0,
+                     'max_ms': self._max_ns[i] / 1e6, 'last_ms': self._last_ns[i] / 1e6}
+            if count:
+                stats['mean_ms'] = totals[i] / count / 1e6
+                stats['p50_ms'] = self._percentile(counts[i], count, 0.50)
+                stats['p99_ms'] = self._percentile(counts[i], count, 0.99)
+            result[stage] = stats
+        return result
+
+    def histograms(self):
+        """
+        Retourne les histogrammes bruts (bornes hautes des classes en ms et compteurs par étape)
+        """
+        return {
+            'upper_ms': self._upper_ms.tolist(),
+            'counts': {stage: self._counts[i].tolist() for i, stage in enumerate(self.stages)}
+        }
+
+    def dump(self, filepath, extra=None):
+        """
+        Écrit les statistiques et les histogrammes dans un fichier JSON
+
+        Args:
+            filepath: Chemin du fichier
+            extra: Informations supplémentaires à inclure (dict)
+        """
+        content = dict(extra or {})
+        content['stages'] = self.snapshot()
+        content['histograms'] = self.histograms()
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(content, f, indent=2)
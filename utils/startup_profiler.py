@@ -0,0 +1,47 @@
+"""
+Profil de démarrage - Mesure des étapes du lancement de l'application
+"""
+import time
+
+
+class StartupProfiler:
+    """
+    Chronomètre des étapes du démarrage (option --profile-startup)
+
+    Chaque appel à mark() clôt une étape ; report() affiche la durée de
+    chaque étape et le temps total depuis la création du profileur. Désactivé,
+    le profileur ne mesure ni n'affiche rien.
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Args:
+            enabled: Activer les mesures
+        """
+        self.enabled = enabled
+        self._start = time.perf_counter()
+        self._last = self._start
+        self.stages = []
+
+    def mark(self, stage):
+        """
+        Clôt l'étape en cours sous le nom donné
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last, now - self._start))
+        self._last = now
+
+    def report(self, title="Profil de démarrage"):
+        """
+        Affiche les étapes mesurées depuis le dernier rapport
+        """
+        if not self.enabled or not self.stages:
+            return
+        print("-" * 60)
+        print(title)
+        for stage, duration, elapsed in self.stages:
+            print(f"  {stage:<40} {duration * 1000:8.1f} ms  (t = {elapsed * 1000:7.1f} ms)")
+        print("-" * 60)
+        self.stages = []
@@ -3,11 +3,12 @@ Vue principale - Interface graphique Tkinter pour le Logger NI
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
 
+from view.plot_panel import PlotPanel, auto_ylim, grow_xlim, instant_xlim
+
 
 class MainView:
     """
@@ -47,6 +48,7 @@ class MainView:
         # Variables de contrôle
         self.selected_task = tk.StringVar(value="")
         self.record_period = tk.IntVar(value=60)
+        self.average_enabled = tk.BooleanVar(value=False)  # Moyenne/min/max/eff par période
         self.file_prefix = tk.StringVar(value="data")
         self.save_directory = tk.StringVar(value="data")
         self.file_comment = tk.StringVar(value="")
@@ -55,11 +57,30 @@ class MainView:
         # Variable pour le nombre de points disponibles dans le buffer
         self.buffer_available = tk.StringVar(value="0")
         
+        # Durées p99 des étapes d'acquisition (buffer, enregistrement, callback)
+        self.metrics_text = tk.StringVar(value="-")
+        
         # Variable pour le temps écoulé depuis le début de l'acquisition
         self.elapsed_time = tk.StringVar(value="00:00:00")
         
+        # État du thread d'écriture (profondeur de file et latence)
+        self.writer_status = tk.StringVar(value="-")
+        
+        # Cadence d'affichage obtenue et coût d'une mise à jour
+        self.refresh_status = tk.StringVar(value="-")
+        
+        # Statistiques du premier canal (fenêtre glissante)
+        self.statistics_text = tk.StringVar(value="-")
+        
+        # Fréquence d'échantillonnage effective du modèle et durée de la fenêtre instantanée
+        # (mises à jour au démarrage de l'acquisition ; fenêtre plus courte en haute fréquence)
+        self.sample_rate = self.config.SAMPLE_RATE
+        self.instant_window = self.config.INSTANT_HISTORY_SECONDS
+        self.sample_rate_text = tk.StringVar(value=f"📡 {self.config.SAMPLE_RATE} Hz")
+        
         # Variables pour l'échelle des graphiques
         self.auto_scale = tk.BooleanVar(value=True)
+        self.scale_version = 0  # Incrémenté à chaque changement d'échelle (graphiques à retracer)
         self.y_min = tk.DoubleVar(value=-10.0)
         self.y_max = tk.DoubleVar(value=10.0)
         
@@ -183,6 +204,20 @@ class MainView:
             fg=self.colors['text_gray']
         ).pack(side=tk.LEFT, padx=10)
         
+        self.average_check = tk.Checkbutton(
+            config_frame,
+            text="Moyenne sur la période (moy/min/max/eff)",
+            variable=self.average_enabled,
+            font=("Segoe UI", 9),
+            bg=self.colors['bg_dark'],
+            fg=self.colors['text_white'],
+            selectcolor=self.colors['bg_light'],
+            activebackground=self.colors['bg_dark'],
+            activeforeground=self.colors['text_white'],
+            anchor=tk.W
+        )
+        self.average_check.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
         # Préfixe nom fichier
         tk.Label(
             config_frame,
@@ -385,7 +420,7 @@ class MainView:
         
         tk.Label(
             info_frame,
-            text=f"📡 {self.config.SAMPLE_RATE} Hz",
+            textvariable=self.sample_rate_text,
             font=("Segoe UI", 9),
             bg=self.colors['bg_dark'],
             fg=self.colors['text_gray'],
@@ -488,6 +523,90 @@ class MainView:
         )
         self.buffer_label.pack(anchor=tk.W)
         
+        # Durées des étapes du chemin critique d'acquisition
+        metrics_frame = tk.Frame(bottom_bar, bg=self.colors['bg_light'])
+        metrics_frame.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        tk.Label(
+            metrics_frame,
+            text="⏱️ Traitement (p99)",
+            font=("Segoe UI", 9, "bold"),
+            bg=self.colors['bg_light'],
+            fg=self.colors['accent_blue']
+        ).pack(anchor=tk.W)
+        
+        self.metrics_label = tk.Label(
+            metrics_frame,
+            textvariable=self.metrics_text,
+            font=("Segoe UI", 10, "bold"),
+            bg=self.colors['bg_light'],
+            fg=self.colors['accent_yellow']
+        )
+        self.metrics_label.pack(anchor=tk.W)
+        
+        # Indicateur d'écriture (file d'attente et latence)
+        writer_frame = tk.Frame(bottom_bar, bg=self.colors['bg_light'])
+        writer_frame.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        tk.Label(
+            writer_frame,
+            text="💾 Écriture",
+            font=("Segoe UI", 9, "bold"),
+            bg=self.colors['bg_light'],
+            fg=self.colors['accent_blue']
+        ).pack(anchor=tk.W)
+        
+        self.writer_label = tk.Label(
+            writer_frame,
+            textvariable=self.writer_status,
+            font=("Segoe UI", 10, "bold"),
+            bg=self.colors['bg_light'],
+            fg=self.colors['accent_yellow']
+        )
+        self.writer_label.pack(anchor=tk.W)
+        
+        # Statistiques glissantes du premier canal
+        statistics_frame = tk.Frame(bottom_bar, bg=self.colors['bg_light'])
+        statistics_frame.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        tk.Label(
+            statistics_frame,
+            text=f"📈 Canal 1 ({self.config.STATISTICS_WINDOW_DURATION:g} s)",
+            font=("Segoe UI", 9, "bold"),
+            bg=self.colors['bg_light'],
+            fg=self.colors['accent_blue']
+        ).pack(anchor=tk.W)
+        
+        self.statistics_label = tk.Label(
+            statistics_frame,
+            textvariable=self.statistics_text,
+            font=("Segoe UI", 10, "bold"),
+            bg=self.colors['bg_light'],
+            fg=self.colors['accent_yellow']
+        )
+        self.statistics_label.pack(anchor=tk.W)
+        
+        # Cadence d'affichage (rafraîchissement adaptatif)
+        refresh_frame = tk.Frame(bottom_bar, bg=self.colors['bg_light'])
+        refresh_frame.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        tk.Label(
+            refresh_frame,
+            text="🖥️ Affichage",
+            font=("Segoe UI", 9, "bold"),
+            bg=self.colors['bg_light'],
+            fg=self.colors['accent_purple']
+        ).pack(anchor=tk.W)
+        
+        self.refresh_label = tk.Label(
+            refresh_frame,
+            textvariable=self.refresh_status,
+            font=("Segoe UI", 10, "bold"),
+            bg=self.colors['bg_light'],
+            fg=self.colors['accent_yellow']
+        )
+        self.refresh_label.pack(anchor=tk.W)
+        
         # Indicateur de temps écoulé
         elapsed_time_frame = tk.Frame(bottom_bar, bg=self.colors['bg_light'])
         elapsed_time_frame.pack(side=tk.LEFT, padx=20, pady=15)
@@ -584,6 +703,7 @@ class MainView:
     
     def _on_auto_scale_changed(self):
         """Callback pour le changement d'échelle auto"""
+        self.scale_version += 1
         if self.auto_scale.get():
             # Désactiver les spinbox
             self.min_spinbox.config(state=tk.DISABLED)
@@ -597,6 +717,7 @@ class MainView:
     
     def _on_scale_changed(self):
         """Callback pour le changement d'échelle manuelle"""
+        self.scale_version += 1
         if not self.auto_scale.get():
             try:
                 y_min = float(self.y_min.get())
@@ -630,7 +751,7 @@ class MainView:
         self.ax_instant = self.fig_instant.add_subplot(111)
         self.ax_instant.set_facecolor('#1a1a2e')
         self.ax_instant.set_xlabel('Temps (s)', fontsize=11, color=self.colors['text_white'], fontweight='bold')
-        self.ax_instant.set_xlim(0, 60)  # 1 minute
+        self.ax_instant.set_xlim(0, self.instant_window)  # 1 minute en mode standard
         self.ax_instant.set_ylim(-10, 10)
         self.ax_instant.grid(True, alpha=0.15, color=self.colors['text_gray'], linestyle='--')
         self.ax_instant.tick_params(colors=self.colors['text_gray'], labelsize=9)
@@ -642,6 +763,10 @@ class MainView:
         self.canvas_instant = FigureCanvasTkAgg(self.fig_instant, tab1)
         self.canvas_instant.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Rendu par blitting : seules les lignes sont redessinées à chaque trame
+        self.panel_instant = PlotPanel(self.fig_instant, self.ax_instant, self.canvas_instant,
+                                       use_blit=self.config.PLOT_USE_BLIT)
+        
         # Graphique longue durée
         self.fig_long = Figure(figsize=(10, 6), facecolor=self.colors['bg_medium'])
         self.ax_long = self.fig_long.add_subplot(111)
@@ -658,6 +783,9 @@ class MainView:
         self.fig_long.tight_layout()
         self.canvas_long = FigureCanvasTkAgg(self.fig_long, tab2)
         self.canvas_long.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        self.panel_long = PlotPanel(self.fig_long, self.ax_long, self.canvas_long,
+                                    use_blit=self.config.PLOT_USE_BLIT)
     
     def setup_plot_channels(self, channel_names):
         """
@@ -700,6 +828,10 @@ class MainView:
         for text in legend_long.get_texts():
             text.set_color(self.colors['text_white'])
         
+        # Les lignes sont animées (blitting) ; le fond avec la légende sera recapturé
+        self.panel_instant.set_lines(self.lines_instant)
+        self.panel_long.set_lines(self.lines_long)
+        
         print(f"✓ {len(channel_names)} canal(aux) configuré(s) dans les graphiques: {', '.join(channel_names)}")
     
     def update_instantane_plot(self, data, timestamps=None):
@@ -708,7 +840,7 @@ class MainView:
         
         Args:
             data: Données à afficher (numpy array)
-            timestamps: Liste des timestamps (optionnel)
+            timestamps: Timestamps des données (numpy array, optionnel)
         """
         if data is None or (isinstance(data, np.ndarray) and data.size == 0):
             return
@@ -723,39 +855,38 @@ class MainView:
             
             # Créer l'axe temporel
             num_samples = data.shape[1]
-            if timestamps and len(timestamps) >= num_samples:
-                # Utiliser les timestamps réels, convertis en temps relatif
-                time_axis = np.array(timestamps[-num_samples:])
+            if timestamps is not None and len(timestamps) == num_samples:
+                # Utiliser les timestamps réels (image cohérente), convertis en temps relatif
+                time_axis = np.asarray(timestamps)
                 time_axis = time_axis - time_axis[0]  # Temps relatif à partir du premier point
             else:
-                # Fallback : axe temporel calculé
-                time_axis = np.linspace(0, num_samples / self.config.SAMPLE_RATE, num_samples)
-            
-            # Mettre à jour chaque canal
-            for i in range(min(data.shape[0], len(self.lines_instant))):
-                self.lines_instant[i].set_data(time_axis, data[i, :])
-            
-            # Ajuster les limites (fenêtre de 60 secondes)
-            if len(time_axis) > 0:
-                self.ax_instant.set_xlim(0, max(60, time_axis[-1]))
-            
-            # Calculer les limites y selon le mode (auto ou manuel)
-            if self.auto_scale.get():
-                all_data = data.flatten()
-                if len(all_data) > 0:
-                    y_min = np.min(all_data)
-                    y_max = np.max(all_data)
-                    margin = (y_max - y_min) * 0.1 if y_max != y_min else 1.0
-                    self.ax_instant.set_ylim(y_min - margin, y_max + margin)
-            else:
-                # Utiliser les limites manuelles
-                self.ax_instant.set_ylim(self.y_min.get(), self.y_max.get())
+                # Fallback : axe temporel calculé à la fréquence effective de l'acquisition
+                time_axis = np.arange(num_samples, dtype=np.float64) / self.sample_rate
             
-            self.canvas_instant.draw()
+            self.draw_instantane_frame(time_axis, data, (float(np.min(data)), float(np.max(data))))
             
         except Exception as e:
             print(f"Erreur lors de la mise à jour du graphique instantané: {e}")
     
+    def draw_instantane_frame(self, time_axis, data, y_range):
+        """
+        Trace une trame préparée sur le graphique instantané (set_data + blitting)
+        
+        Args:
+            time_axis: Axe temporel relatif (tableau 1D)
+            data: Données (canaux x points)
+            y_range: Tuple (min, max) des données
+        """
+        if len(self.lines_instant) == 0 or len(time_axis) == 0:
+            return
+        
+        # Limites : durée de la fenêtre instantanée, échelle y auto ou manuelle
+        xlim = instant_xlim(self.instant_window, time_axis[-1])
+        ylim = self._compute_ylim(self.ax_instant, y_range)
+        
+        # Seul un changement de limites provoque un rendu complet
+        self.panel_instant.update(time_axis, data, xlim, ylim)
+    
     def update_longue_duree_plot(self, timestamps, data):
         """
         Met à jour le graphique longue durée avec timestamps réels (graphique XY)
@@ -767,7 +898,7 @@ class MainView:
         if data is None or (isinstance(data, np.ndarray) and data.size == 0):
             return
         
-        if not timestamps or len(timestamps) == 0:
+        if timestamps is None or len(timestamps) == 0:
             return
         
         if len(self.lines_long) == 0:
@@ -782,31 +913,101 @@ class MainView:
             time_array = np.array(timestamps)
             time_axis = time_array - time_array[0]
             
-            # Mettre à jour chaque canal
-            for i in range(min(data.shape[0], len(self.lines_long))):
-                self.lines_long[i].set_data(time_axis, data[i, :])
-            
-            # Ajuster les limites
-            if len(time_axis) > 0:
-                self.ax_long.set_xlim(0, time_axis[-1])
-            
-            # Calculer les limites y selon le mode (auto ou manuel)
-            if self.auto_scale.get():
-                all_data = data.flatten()
-                if len(all_data) > 0:
-                    y_min = np.min(all_data)
-                    y_max = np.max(all_data)
-                    margin = (y_max - y_min) * 0.1 if y_max != y_min else 1.0
-                    self.ax_long.set_ylim(y_min - margin, y_max + margin)
-            else:
-                # Utiliser les limites manuelles
-                self.ax_long.set_ylim(self.y_min.get(), self.y_max.get())
-            
-            self.canvas_long.draw()
+            self.draw_longue_duree_frame(time_axis, data, (float(np.min(data)), float(np.max(data))))
             
         except Exception as e:
             print(f"Erreur lors de la mise à jour du graphique longue durée: {e}")
     
+    def draw_longue_duree_frame(self, time_axis, data, y_range):
+        """
+        Trace une trame préparée sur le graphique longue durée (set_data + blitting)
+        
+        Args:
+            time_axis: Axe temporel relatif au premier point (tableau 1D)
+            data: Données (canaux x points)
+            y_range: Tuple (min, max) des données
+        """
+        if len(self.lines_long) == 0 or len(time_axis) == 0:
+            return
+        
+        # Limites : tout l'historique (axe x élargi par paliers), échelle y auto ou manuelle
+        xlim = self._grow_xlim(self.ax_long, time_axis[-1])
+        ylim = self._compute_ylim(self.ax_long, y_range)
+        
+        self.panel_long.update(time_axis, data, xlim, ylim)
+    
+    def _grow_xlim(self, ax, t_end):
+        """
+        Calcule les limites x d'un axe qui s'étend avec les données (par paliers, voir grow_xlim)
+        
+        Args:
+            ax: Axe concerné
+            t_end: Temps du dernier point (relatif au premier)
+        
+        Returns:
+            tuple: Limites (0, x_max)
+        """
+        return grow_xlim(ax.get_xlim(), t_end, self.config.LONG_PLOT_XLIM_GROWTH)
+    
+    def _compute_ylim(self, ax, y_range):
+        """
+        Calcule les limites y selon le mode (auto ou manuel)
+        
+        En mode auto, les limites actuelles sont conservées tant que les données
+        y tiennent et en occupent une part suffisante (voir auto_ylim).
+        
+        Args:
+            ax: Axe concerné
+            y_range: Tuple (min, max) des données affichées
+        
+        Returns:
+            tuple: Limites (y_min, y_max)
+        """
+        if not self.auto_scale.get():
+            # Utiliser les limites manuelles
+            return (self.y_min.get(), self.y_max.get())
+        
+        return auto_ylim(ax.get_ylim(), y_range)
+    
+    def get_visible_plot(self):
+        """
+        Retourne le graphique de l'onglet sélectionné
+        
+        Returns:
+            str: 'instant' ou 'long'
+        """
+        return 'instant' if self.notebook.index(self.notebook.select()) == 0 else 'long'
+    
+    def is_minimized(self):
+        """
+        Indique si la fenêtre est réduite (aucun graphique visible)
+        """
+        return self.root.state() == 'iconic' or not self.root.winfo_viewable()
+    
+    def get_plot_widths(self):
+        """
+        Retourne la largeur des zones de tracé en pixels
+        
+        Returns:
+            dict: {'instant': largeur, 'long': largeur}
+        """
+        return {
+            'instant': self.panel_instant.get_pixel_width(),
+            'long': self.panel_long.get_pixel_width()
+        }
+    
+    def get_frame_stats(self):
+        """
+        Retourne les statistiques de temps de trame des deux graphiques
+        
+        Returns:
+            dict: {'instant': ..., 'long': ...} (voir PlotPanel.get_frame_stats)
+        """
+        return {
+            'instant': self.panel_instant.get_frame_stats(),
+            'long': self.panel_long.get_frame_stats()
+        }
+    
     def _on_start_clicked(self):
         """Callback pour le bouton Démarrer"""
         if self.on_start_recording:
@@ -980,7 +1181,7 @@ class MainView:
             ("🖼️ Interface", "Tkinter + Matplotlib"),
             ("⚙️ API", "National Instruments DAQmx"),
             ("📡 Configuration", "Tâches NI MAX"),
-            ("🔊 Fréquence", f"{self.config.SAMPLE_RATE} Hz")
+            ("🔊 Fréquence", self.sample_rate_text.get().replace("📡 ", ""))
         ]
         
         for label, value in infos:
@@ -1018,6 +1219,19 @@ class MainView:
             relief=tk.FLAT
         ).pack(pady=20)
     
+    def set_sample_rate(self, sample_rate, instant_window=None):
+        """
+        Met à jour la fréquence d'échantillonnage affichée (et celle de l'axe temporel calculé)
+        
+        Args:
+            sample_rate: Fréquence par canal en Hz
+            instant_window: Durée de la fenêtre instantanée en secondes
+                            (défaut: Config.INSTANT_HISTORY_SECONDS)
+        """
+        self.sample_rate = sample_rate
+        self.instant_window = instant_window or self.config.INSTANT_HISTORY_SECONDS
+        self.sample_rate_text.set(f"📡 {sample_rate:g} Hz")
+    
     def set_config_controls_state(self, enabled):
         """
         Active ou désactive les contrôles de configuration
@@ -1034,6 +1248,7 @@ class MainView:
         self.directory_entry.config(state=state)
         self.browse_button.config(state=state)
         self.comment_entry.config(state=state)
+        self.average_check.config(state=state)  # Colonnes du fichier fixées au démarrage
         
         # La période d'enregistrement reste toujours activée
         # self.period_spinbox.config(state=tk.NORMAL)  # Toujours activé
@@ -0,0 +1,215 @@
+"""
+Panneau de graphique - Rendu matplotlib par blitting avec mesure du temps de trame
+"""
+import time
+from collections import deque
+
+import numpy as np
+
+
+def instant_xlim(window, t_end):
+    """
+    Limites x du graphique instantané : la durée de la fenêtre glissante
+
+    Args:
+        window: Durée de la fenêtre instantanée en secondes
+        t_end: Temps du dernier point (relatif au premier)
+
+    Returns:
+        tuple: Limites (0, x_max)
+    """
+    return (0, max(window, t_end))
+
+
+def grow_xlim(current, t_end, growth):
+    """
+    Limites x d'un axe qui s'étend avec les données (graphique longue durée)
+
+    L'axe est élargi par paliers (marge de growth) plutôt qu'à chaque nouveau
+    point : entre deux paliers les limites ne changent pas et la trame reste
+    rendue par blitting, sans nouvelle mise en page.
+
+    Args:
+        current: Limites x actuelles de l'axe
+        t_end: Temps du dernier point (relatif au premier)
+        growth: Facteur d'élargissement (Config.LONG_PLOT_XLIM_GROWTH)
+
+    Returns:
+        tuple: Limites (0, x_max)
+    """
+    x_min, x_max = current
+    # Conserver tant que le dernier point est visible et que l'axe n'est pas
+    # exagérément large (nouvel enregistrement plus court que le précédent)
+    if x_min == 0 and t_end <= x_max <= max(t_end * 2 * growth, 1.0):
+        return (x_min, x_max)
+    return (0, max(t_end * growth, 1.0))
+
+
+def auto_ylim(current, y_range):
+    """
+    Limites y en échelle automatique
+
+    Les limites actuelles sont conservées tant que les données y tiennent et
+    en occupent une part suffisante : cela évite un rendu complet (perte du
+    blitting) à chaque trame pour une variation minime.
+
+    Args:
+        current: Limites y actuelles de l'axe
+        y_range: Tuple (min, max) des données affichées
+
+    Returns:
+        tuple: Limites (y_min, y_max)
+    """
+    y_min, y_max = y_range
+    margin = (y_max - y_min) * 0.1 if y_max != y_min else 1.0
+    target = (y_min - margin, y_max + margin)
+
+    current_min, current_max = current
+    fits = current_min <= y_min and y_max <= current_max
+    if fits and (current_max - current_min) <= 2 * (target[1] - target[0]):
+        return (current_min, current_max)
+    return target
+
+
+class PlotPanel:
+    """
+    Graphique temps réel (un axe, une ligne par canal) rendu par blitting
+
+    Le fond (axes, graduations, grille, légende) est rendu une seule fois puis
+    mis en cache ; chaque mise à jour restaure ce fond et ne redessine que les
+    lignes. Un rendu complet n'a lieu que lorsque les limites des axes changent
+    (ou après un redimensionnement). Sans blitting, chaque mise à jour appelle
+    canvas.draw(), ce qui permet de comparer les deux chemins.
+
+    Le canvas peut être un FigureCanvasTkAgg (interface) ou un FigureCanvasAgg
+    (benchmarks sans affichage).
+    """
+
+    def __init__(self, figure, axes, canvas, use_blit=True, frame_history=200):
+        """
+        Initialise le panneau
+
+        Args:
+            figure: Figure matplotlib
+            axes: Axes du graphique
+            canvas: Canvas matplotlib de la figure
+            use_blit: Utiliser le blitting (sinon redessin complet à chaque trame)
+            frame_history: Nombre de trames conservées pour les statistiques
+        """
+        self.figure = figure
+        self.ax = axes
+        self.canvas = canvas
+        self.use_blit = use_blit and getattr(canvas, 'supports_blit', False)
+        self.lines = []
+
+        self._background = None
+        self._frame_times = deque(maxlen=frame_history)
+        self.full_redraws = 0
+        self.blits = 0
+
+        # Le fond est recapturé après chaque rendu complet (y compris redimensionnement)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def set_lines(self, lines):
+        """
+        Déclare les lignes mises à jour à chaque trame
+
+        Args:
+            lines: Liste de Line2D appartenant à l'axe
+        """
+        self.lines = list(lines)
+        for line in self.lines:
+            line.set_animated(self.use_blit)
+        self._background = None
+
+    def invalidate(self):
+        """
+        Force un rendu complet à la prochaine trame (changement d'échelle, de légende...)
+        """
+        self._background = None
+
+    def get_pixel_width(self):
+        """
+        Retourne la largeur de la zone de tracé en pixels (base de la décimation)
+        """
+        return max(int(self.ax.bbox.width), 1)
+
+    def _on_draw(self, event):
+        """
+        Capture le fond après un rendu complet et y dessine les lignes animées
+        """
+        if not self.use_blit:
+            return
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for line in self.lines:
+            self.ax.draw_artist(line)
+
+    def _set_limits(self, xlim, ylim):
+        """
+        Applique les limites demandées
+
+        Returns:
+            bool: True si les limites ont changé (rendu complet nécessaire)
+        """
+        changed = False
+        if xlim is not None and tuple(self.ax.get_xlim()) != tuple(xlim):
+            self.ax.set_xlim(*xlim)
+            changed = True
+        if ylim is not None and tuple(self.ax.get_ylim()) != tuple(ylim):
+            self.ax.set_ylim(*ylim)
+            changed = True
+        return changed
+
+    def update(self, x, data, xlim=None, ylim=None):
+        """
+        Met à jour les lignes et rend la trame
+
+        Args:
+            x: Axe des abscisses commun (tableau 1D) ou liste d'axes (un par ligne)
+            data: Données (canaux x points) ou liste de tableaux (un par ligne)
+            xlim: Limites en x (tuple) ou None pour les conserver
+            ylim: Limites en y (tuple) ou None pour les conserver
+        """
+        start = time.perf_counter()
+
+        for i in range(min(len(data), len(self.lines))):
+            x_line = x[i] if isinstance(x, (list, tuple)) else x
+            self.lines[i].set_data(x_line, data[i])
+
+        limits_changed = self._set_limits(xlim, ylim)
+
+        if not self.use_blit:
+            self.canvas.draw()
+            self.full_redraws += 1
+        else:
+            if limits_changed or self._background is None:
+                # Rendu complet : _on_draw recapture le fond et dessine les lignes
+                self.canvas.draw()
+                self.full_redraws += 1
+            else:
+                self.canvas.restore_region(self._background)
+                for line in self.lines:
+                    self.ax.draw_artist(line)
+                self.blits += 1
+            self.canvas.blit(self.ax.bbox)
+
+        self._frame_times.append(time.perf_counter() - start)
+
+    def get_frame_stats(self):
+        """
+        Retourne les statistiques de temps de trame
+
+        Returns:
+            dict: Mode de rendu, nombre de trames, temps moyen/p95/max (ms),
+                  nombre de rendus complets et de blits
+        """
+        times = np.array(self._frame_times) * 1000.0
+        return {
+            'mode': 'blit' if self.use_blit else 'draw',
+            'frames': len(times),
+            'frame_mean_ms': float(times.mean()) if len(times) else 0.0,
+            'frame_p95_ms': float(np.percentile(times, 95)) if len(times) else 0.0,
+            'frame_max_ms': float(times.max()) if len(times) else 0.0,
+            'full_redraws': self.full_redraws,
+            'blits': self.blits
+        }